@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite for the Bible Reader hot paths
+
+Times cold/warm startup and the commands users run most, with all terminal
+output sent to a null sink so only compute time is measured. Results are
+written as JSON; pass --baseline to compare against an earlier run and exit
+non-zero on regressions.
+
+Usage:
+    python benchmark.py                          # run and write benchmark_results.json
+    python benchmark.py --save baseline.json     # keep a baseline
+    python benchmark.py --baseline baseline.json # compare against it
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Keep the reader quiet and its persistent store untouched while benchmarking
+os.environ['TESTING'] = '1'
+
+# Run in a fresh interpreter for cold startup: imports plus loading every data file
+STARTUP_SCRIPT = """
+import time
+start = time.perf_counter()
+import contextlib, io
+with contextlib.redirect_stdout(io.StringIO()):
+    import bible_reader
+    bible_reader.BibleReader()
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+class NullSink(io.TextIOBase):
+    """Text stream that discards everything written to it"""
+
+    def write(self, text):
+        return len(text)
+
+
+def time_call(func, repeat):
+    """Time one call cold, then `repeat` warm calls; returns timings in ms"""
+    sink = NullSink()
+    with contextlib.redirect_stdout(sink):
+        start = time.perf_counter()
+        func()
+        first = (time.perf_counter() - start) * 1000
+
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            runs.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'first_ms': round(first, 3),
+        'median_ms': round(statistics.median(runs), 3),
+        'min_ms': round(min(runs), 3),
+        'runs': len(runs),
+    }
+
+
+def time_startup(repeat):
+    """Cold startup: a fresh interpreter importing the reader and loading all data"""
+    env = dict(os.environ, PYTHONPATH=SCRIPT_DIR + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT], capture_output=True, text=True, env=env, check=True)
+        runs.append(float(output.stdout.strip().splitlines()[-1]))
+    return {
+        'first_ms': round(runs[0], 3),
+        'median_ms': round(statistics.median(runs), 3),
+        'min_ms': round(min(runs), 3),
+        'runs': len(runs),
+    }
+
+
+def build_benchmarks(reader):
+    """Named hot-path callables against a loaded reader"""
+    from bible_reader import BibleReader
+
+    # A fixed sample of ~1000 references spread over the whole Bible
+    references = list(reader.bible_data.keys())
+    references = references[::max(1, len(references) // 1000)]
+
+    def lookup_verses():
+        for reference in references:
+            reader.get_verse(reference)
+
+    def warm_startup():
+        BibleReader()
+
+    return [
+        ('startup_warm', warm_startup),
+        ('get_verse_x1000', lookup_verses),
+        ('display_verse', lambda: reader.display_verse('John 3:16', show_refs=False)),
+        ('display_cross_references', lambda: reader.display_cross_references('John 3:16')),
+        ('display_chapter_short', lambda: reader.display_chapter('Psalms', '23')),
+        ('display_chapter_long', lambda: reader.display_chapter('Psalms', '119')),
+        ('search_single_word', lambda: reader.search_keyword('love')),
+        ('search_multi_word', lambda: reader.search_keyword('faith hope charity')),
+        ('search_exact_phrase', lambda: reader.search_keyword('in the beginning', exact_phrase=True)),
+        ('search_scoped_book', lambda: reader.search_keyword('grace', book='Romans')),
+        ('search_scoped_testament', lambda: reader.search_keyword('light', testament='NT')),
+        ('compare_translations', lambda: reader.compare_translations('John 3:16')),
+        ('compare_chapter', lambda: reader.compare_translations('John 3')),
+        ('show_statistics', reader.show_statistics),
+    ]
+
+
+def compare(results, baseline, threshold, min_delta):
+    """Print current vs baseline medians; returns the names that regressed"""
+    regressions = []
+    print(f"\n{'Benchmark':<28}{'Baseline':>12}{'Current':>12}{'Change':>10}")
+    print('─' * 62)
+    for name, current in results['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if not previous or not previous['median_ms']:
+            print(f"{name:<28}{'-':>12}{current['median_ms']:>10.2f}ms{'new':>10}")
+            continue
+        ratio = current['median_ms'] / previous['median_ms']
+        # Sub-millisecond jitter on fast paths is not a regression
+        regressed = ratio > threshold and current['median_ms'] - previous['median_ms'] > min_delta
+        flag = '  ✗ REGRESSION' if regressed else ''
+        print(f"{name:<28}{previous['median_ms']:>10.2f}ms{current['median_ms']:>10.2f}ms{ratio - 1:>+9.0%}{flag}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the Bible Reader hot paths')
+    parser.add_argument('--repeat', type=int, default=5, help='warm runs per benchmark (default: 5)')
+    parser.add_argument('--data-dir', default=SCRIPT_DIR, help='folder holding the Bible JSON files and cross_references.txt')
+    parser.add_argument('--save', default='benchmark_results.json', help='where to write the JSON results')
+    parser.add_argument('--baseline', help='earlier results file to compare against')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='flag a regression when median time exceeds baseline by this factor (default: 1.25)')
+    parser.add_argument('--min-delta', type=float, default=1.0,
+                        help='ignore slowdowns smaller than this many milliseconds (default: 1.0)')
+    parser.add_argument('--only', help='comma-separated benchmark names to run')
+    args = parser.parse_args()
+
+    # Output paths are relative to where the script was started, data paths to --data-dir
+    save_path = os.path.abspath(args.save)
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+    os.chdir(args.data_dir)
+    sys.path.insert(0, SCRIPT_DIR)
+    only = set(args.only.split(',')) if args.only else None
+
+    print(f"Benchmarking bible_reader.py ({args.repeat} warm runs each)...")
+    results = {}
+    if not only or 'startup_cold' in only:
+        results['startup_cold'] = time_startup(args.repeat)
+        print(f"  {'startup_cold':<28}{results['startup_cold']['median_ms']:>10.2f}ms")
+
+    with contextlib.redirect_stdout(NullSink()):
+        from bible_reader import BibleReader
+        reader = BibleReader()
+    # A background prefetch thread would compete with (and pre-warm) the timed calls
+    reader.prefetch_enabled = False
+
+    for name, func in build_benchmarks(reader):
+        if only and name not in only:
+            continue
+        results[name] = time_call(func, args.repeat)
+        print(f"  {name:<28}{results[name]['median_ms']:>10.2f}ms  (first call {results[name]['first_ms']:.2f}ms)")
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=SCRIPT_DIR).stdout.strip()
+    except OSError:
+        commit = ''
+
+    output = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': commit,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'verses': len(reader.bible_data),
+        },
+        'results': results,
+    }
+    with open(save_path, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2)
+    print(f"\n✓ Results written to: {save_path}")
+
+    if baseline_path:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(output, baseline, args.threshold, args.min_delta)
+        if regressions:
+            print(f"\n✗ {len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+        print("\n✓ No regressions")
+
+
+if __name__ == '__main__':
+    main()
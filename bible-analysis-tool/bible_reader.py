@@ -11,8 +11,138 @@ import os
 import sys
 import time
 import random
-from collections import defaultdict
-from colorama import init, Fore, Back, Style
+import heapq
+import zlib
+import queue
+import threading
+import tracemalloc
+from array import array
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+class Profiler:
+    """Opt-in wall time and peak memory trace of startup phases and commands
+
+    Enabled with --profile or BIBLE_PROFILE=1. Phases nest: each records the
+    peak traced memory (tracemalloc) reached while it ran, which also counts
+    toward its parent. Disabled, every hook is a no-op.
+    """
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.events = []
+        self.stack = []
+        self.origin = time.perf_counter()
+        if enabled:
+            tracemalloc.start()
+
+    def begin(self, name, kind='startup'):
+        if not self.enabled or threading.current_thread() is not threading.main_thread():
+            return None  # Background work (chapter prefetch) is not traced
+        current, peak = tracemalloc.get_traced_memory()
+        if self.stack:
+            self.stack[-1]['peak'] = max(self.stack[-1]['peak'], peak)
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        event = {'name': name, 'kind': kind, 'depth': len(self.stack), 'start': time.perf_counter(), 'peak': current}
+        self.stack.append(event)
+        return event
+
+    def end(self, event):
+        if event is None or event not in self.stack:
+            return
+        while self.stack.pop() is not event:
+            pass  # Inner phases left open by an exception
+        elapsed = time.perf_counter() - event['start']
+        peak = max(event['peak'], tracemalloc.get_traced_memory()[1])
+        if self.stack:
+            self.stack[-1]['peak'] = max(self.stack[-1]['peak'], peak)
+        self.events.append({
+            'name': event['name'],
+            'kind': event['kind'],
+            'depth': event['depth'],
+            'offset_ms': round((event['start'] - self.origin) * 1000, 3),
+            'ms': round(elapsed * 1000, 3),
+            'peak_kb': peak // 1024,
+        })
+
+    @contextmanager
+    def phase(self, name, kind='startup'):
+        event = self.begin(name, kind)
+        try:
+            yield
+        finally:
+            self.end(event)
+
+    def timed(self, name):
+        """Decorator recording every call of a builder (the first str argument is appended to the name)"""
+        def decorate(func):
+            if not self.enabled:
+                return func
+
+            def wrapper(*args, **kwargs):
+                label = next((f"{name} ({arg})" for arg in args[1:2] if isinstance(arg, str)), name)
+                with self.phase(label):
+                    return func(*args, **kwargs)
+            wrapper.__name__, wrapper.__doc__ = func.__name__, func.__doc__
+            return wrapper
+        return decorate
+
+    def report(self, filename=None):
+        """Print the summary table and write the JSON trace"""
+        if not self.enabled:
+            return
+        events = sorted(self.events, key=lambda event: event['offset_ms'])
+
+        header = f"{Colors.BRIGHT_GOLD}PERFORMANCE PROFILE{Colors.RESET}"
+        print(f"\n{Colors.BRIGHT_CYAN}{make_border_top()}")
+        print(make_border_line(header, align='center'))
+        for kind, title in (('startup', 'STARTUP PHASES'), ('command', 'COMMANDS')):
+            rows = [event for event in events if event['kind'] == kind]
+            if not rows:
+                continue
+            print(f"╠{'═' * 78}╣")
+            print(make_border_line(f"{Colors.BRIGHT_WHITE}{title:<50}{'Time':>12}{'Peak mem':>14}{Colors.RESET}"))
+            for event in rows:
+                name = ('  ' * event['depth'] + event['name'])[:50]
+                print(make_border_line(f"{Colors.DIM_CYAN}{name:<50}{Colors.RESET}{Colors.LIME}{event['ms']:>10.1f}ms{Colors.RESET}"
+                                       f"{Colors.PINK}{event['peak_kb'] / 1024:>11.1f} MB{Colors.RESET}"))
+        print(f"{make_border_bottom()}{Colors.RESET}")
+        print(f"{Colors.GRAY}  Times include tracemalloc overhead{Colors.RESET}")
+
+        if not filename:
+            from datetime import datetime
+            filename = f"bible_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        trace = {
+            'python': sys.version.split()[0],
+            'platform': sys.platform,
+            'total_ms': round((time.perf_counter() - self.origin) * 1000, 3),
+            'events': events,
+        }
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(trace, f, indent=2)
+            print(f"{Colors.SUCCESS}  ✓ Profile trace written to: {filename}{Colors.RESET}\n")
+        except OSError as e:
+            print(f"{Colors.ERROR}  ✗ Could not write profile trace: {e}{Colors.RESET}\n")
+
+PROFILER = Profiler('--profile' in sys.argv or bool(os.environ.get('BIBLE_PROFILE')))
+
+with PROFILER.phase('import colorama'):
+    from colorama import init, Fore, Back, Style
+
+# NumPy powers the similarity and graph analytics (optional)
+with PROFILER.phase('import numpy'):
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+# readline provides tab completion at the prompt (optional, missing on stock Windows)
+try:
+    import readline
+except ImportError:
+    readline = None
 
 # Enable Windows VT100 terminal for better Unicode support
 if sys.platform == 'win32':
@@ -31,7 +161,8 @@ if sys.platform == 'win32':
         sys.stderr.reconfigure(encoding='utf-8')
 
 # Initialize colorama for Windows color support
-init(autoreset=True)
+with PROFILER.phase('colorama init'):
+    init(autoreset=True)
 
 # RGB color helper functions (DEATH-STAR style)
 def rgb(r, g, b):
@@ -217,6 +348,502 @@ def make_border_line(text, width=78, align='left'):
     else:  # left
         return f"║ {text}{' ' * padding_total} ║"
 
+# OSIS book abbreviations used by cross_references.txt
+OSIS_BOOK_NAMES = {
+    'Gen': 'Genesis', 'Exod': 'Exodus', 'Lev': 'Leviticus', 'Num': 'Numbers', 'Deut': 'Deuteronomy',
+    'Josh': 'Joshua', 'Judg': 'Judges', 'Ruth': 'Ruth', '1Sam': '1 Samuel', '2Sam': '2 Samuel',
+    '1Kgs': '1 Kings', '2Kgs': '2 Kings', '1Chr': '1 Chronicles', '2Chr': '2 Chronicles',
+    'Ezra': 'Ezra', 'Neh': 'Nehemiah', 'Esth': 'Esther', 'Job': 'Job', 'Ps': 'Psalms',
+    'Prov': 'Proverbs', 'Eccl': 'Ecclesiastes', 'Song': 'Song of Solomon', 'Isa': 'Isaiah',
+    'Jer': 'Jeremiah', 'Lam': 'Lamentations', 'Ezek': 'Ezekiel', 'Dan': 'Daniel',
+    'Hos': 'Hosea', 'Joel': 'Joel', 'Amos': 'Amos', 'Obad': 'Obadiah', 'Jonah': 'Jonah',
+    'Mic': 'Micah', 'Nah': 'Nahum', 'Hab': 'Habakkuk', 'Zeph': 'Zephaniah', 'Hag': 'Haggai',
+    'Zech': 'Zechariah', 'Mal': 'Malachi', 'Matt': 'Matthew', 'Mark': 'Mark', 'Luke': 'Luke',
+    'John': 'John', 'Acts': 'Acts', 'Rom': 'Romans', '1Cor': '1 Corinthians', '2Cor': '2 Corinthians',
+    'Gal': 'Galatians', 'Eph': 'Ephesians', 'Phil': 'Philippians', 'Col': 'Colossians',
+    '1Thess': '1 Thessalonians', '2Thess': '2 Thessalonians', '1Tim': '1 Timothy', '2Tim': '2 Timothy',
+    'Titus': 'Titus', 'Phlm': 'Philemon', 'Heb': 'Hebrews', 'Jas': 'James', '1Pet': '1 Peter',
+    '2Pet': '2 Peter', '1John': '1 John', '2John': '2 John', '3John': '3 John', 'Jude': 'Jude',
+    'Rev': 'Revelation'
+}
+
+# Extra spellings accepted when typing references
+COMMON_BOOK_ALIASES = {
+    'Psalm': 'Psalms', 'Pss': 'Psalms', 'Song of Songs': 'Song of Solomon', 'Canticles': 'Song of Solomon',
+    'Qoh': 'Ecclesiastes', 'Mt': 'Matthew', 'Mk': 'Mark', 'Lk': 'Luke', 'Jn': 'John',
+    'Revelations': 'Revelation', 'Apocalypse': 'Revelation'
+}
+
+# Passage references: "John 3:16", "Romans 8", "8:28" (book carried over from previous item)
+PASSAGE_REF_RE = re.compile(r'^(?:(?P<book>.*?[A-Za-z].*?)\s*)?(?P<chapter>\d+)(?::(?P<verse>\d+))?$')
+
+def book_key(name):
+    """Normalize a book name or abbreviation for lookups ("1 Cor." -> "1cor")"""
+    return re.sub(r'[\s.]+', '', name).lower()
+
+def parse_verse_key(reference):
+    """Split 'Book C:V' into (book, chapter, verse); None if malformed"""
+    try:
+        book, chapter_verse = reference.rsplit(' ', 1)
+        chapter, verse = chapter_verse.split(':')
+        return book, int(chapter), int(verse)
+    except ValueError:
+        return None
+
+def format_range(start_key, end_key):
+    """Format two (book, chapter, verse) keys as a compact range label"""
+    book, chapter, verse = start_key
+    end_book, end_chapter, end_verse = end_key
+    if start_key == end_key:
+        return f"{book} {chapter}:{verse}"
+    if book != end_book:
+        return f"{book} {chapter}:{verse}-{end_book} {end_chapter}:{end_verse}"
+    if chapter != end_chapter:
+        return f"{book} {chapter}:{verse}-{end_chapter}:{end_verse}"
+    return f"{book} {chapter}:{verse}-{end_verse}"
+
+# Text normalization and tokenization (shared by search, statistics and word counts)
+TOKEN_RE = re.compile(r"[^\W_]+(?:[-'’][^\W_]+)*")
+MARKUP_TABLE = str.maketrans('', '', '[]¶')
+ARCHAIC_STEM_EXCEPTIONS = frozenset({
+    'beast', 'behest', 'best', 'breast', 'breath', 'chest', 'conquest', 'crest', 'death',
+    'earnest', 'east', 'feast', 'forest', 'guest', 'harvest', 'heth', 'honest', 'interest',
+    'jest', 'least', 'manifest', 'modest', 'nest', 'pest', 'priest', 'quest', 'request',
+    'rest', 'seth', 'teeth', 'tempest', 'test', 'unrest', 'vest', 'west', 'wrest', 'zest'
+})
+
+def normalize_text(text):
+    """Strip paragraph markers and [italics] brackets, leaving plain verse text"""
+    return text.replace('# ', '').translate(MARKUP_TABLE)
+
+def stem_archaic(token):
+    """Reduce archaic verb forms to a shared stem ("loveth", "love" -> "lov")"""
+    if token in ARCHAIC_STEM_EXCEPTIONS or token.endswith('ieth'):
+        return token
+    if (token.endswith('eth') or token.endswith('est')) and len(token) >= 5:
+        token = token[:-3]
+    if token.endswith('e') and len(token) > 2:
+        token = token[:-1]
+    return token
+
+def tokenize(text, stem=False):
+    """Normalize, case-fold and split text into word tokens"""
+    tokens = TOKEN_RE.findall(normalize_text(text).casefold())
+    if stem:
+        tokens = [stem_archaic(token) for token in tokens]
+    return tuple(tokens)
+
+# Sparse graph helpers (NumPy arrays in CSR layout)
+CACHE_DIR = 'bible_cache'  # Precomputed analytics, rebuilt when cross_references.txt changes
+
+def csr_from_edges(rows, cols, n):
+    """Group cols by row: returns (indptr, members) with row r at indptr[r]:indptr[r + 1]"""
+    order = np.argsort(rows, kind='stable')
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, cols[order]
+
+def gather_csr(indptr, members, groups):
+    """Expand CSR rows: returns (index into groups, member) for every member of each group"""
+    starts = indptr[groups]
+    sizes = indptr[groups + 1] - starts
+    total = int(sizes.sum())
+    owner = np.repeat(np.arange(len(groups)), sizes)
+    offsets = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    return owner, members[starts[owner] + offsets]
+
+# MinHash / LSH parameters for parallel-passage detection
+MINHASH_PERMUTATIONS = 96
+MINHASH_BANDS = 32       # 32 bands x 3 rows: pairs at Jaccard 0.5 collide ~99% of the time
+MINHASH_PRIME = 4294967311  # Smallest prime above 2**32
+SHINGLE_SIZE = 3         # Word shingles per passage
+PARALLEL_THRESHOLD = 0.5  # Minimum estimated Jaccard similarity to call passages parallel
+LSH_MAX_BUCKET = 200     # Larger buckets are formulaic ("And the LORD spake unto Moses") and skipped
+PARALLEL_MIN_SHINGLES = 4  # Shorter passages are too generic to call parallel
+PARALLEL_WINDOW = 2      # Verses per window when matching whole passages
+
+def shingle_hashes(tokens, size=SHINGLE_SIZE):
+    """CRC32 hashes of the distinct word shingles of a token sequence"""
+    return {zlib.crc32(' '.join(tokens[i:i + size]).encode('utf-8'))
+            for i in range(len(tokens) - size + 1)}
+
+def minhash_signatures(values, starts, num_perm=MINHASH_PERMUTATIONS, seed=1):
+    """MinHash signatures for sets stored back to back in values (set i begins at starts[i])
+
+    Each permutation is a universal hash (a*x + b) mod p applied to every
+    shingle at once, reduced per set with minimum.reduceat.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+    signatures = np.empty((len(starts), num_perm), dtype=np.uint64)
+    for p in range(num_perm):
+        signatures[:, p] = np.minimum.reduceat((a[p] * values + b[p]) % MINHASH_PRIME, starts)
+    return signatures
+
+def lsh_candidate_pairs(signatures, bands=MINHASH_BANDS, max_bucket=LSH_MAX_BUCKET):
+    """Candidate pairs (i < j) of signatures sharing at least one LSH band bucket"""
+    rows = signatures.shape[1] // bands
+    found = []
+    for band in range(bands):
+        # Fold the band's rows into one 64-bit bucket key (rare collisions are filtered later)
+        buckets = np.zeros(len(signatures), dtype=np.uint64)
+        for column in range(band * rows, (band + 1) * rows):
+            buckets = buckets * np.uint64(0x9E3779B97F4A7C15) ^ signatures[:, column]
+        order = np.argsort(buckets, kind='stable')
+        bounds = np.concatenate([[0], np.flatnonzero(np.diff(buckets[order])) + 1, [len(order)]])
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if 2 <= end - start <= max_bucket:
+                members = order[start:end]
+                left, right = np.triu_indices(len(members), 1)
+                found.append(members[left] * len(signatures) + members[right])
+    if not found:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    pairs = np.unique(np.concatenate(found))
+    first, second = pairs // len(signatures), pairs % len(signatures)
+    return np.minimum(first, second), np.maximum(first, second)
+
+# Word-wrap layout helpers
+WRAP_WIDTH = 74  # Visible columns available for verse text
+LAYOUT_CACHE_LIMIT = 20000  # Max cached verse layouts before oldest are evicted
+PREVIEW_CACHE_LIMIT = 20000  # Max cached cross-reference previews
+PREVIEW_LENGTH = 65  # Characters of verse text shown in reference previews
+
+def build_layout(text, width=WRAP_WIDTH, markup='italics'):
+    """Word-wrap verse text into lines of (segment, is_italic) runs
+
+    The result holds no color codes, so it can be cached once and re-colored
+    at print time for any theme. With markup='italics' the [bracketed] words are
+    kept and flagged; with markup='plain' the brackets are dropped.
+    """
+    text = text.replace('# ', '')
+    if markup == 'plain':
+        text = text.replace('[', '').replace(']', '')
+
+    # Greedy wrap on visible length (no ANSI codes at this stage)
+    wrapped = []
+    current_line = ""
+    for word in text.split():
+        if current_line and len(current_line) + 1 + len(word) > width:
+            wrapped.append(current_line)
+            current_line = word
+        else:
+            current_line = current_line + " " + word if current_line else word
+    if current_line:
+        wrapped.append(current_line)
+
+    # Split each line into italic / normal runs (italics may span lines)
+    layout = []
+    italic = False
+    for line in wrapped:
+        runs = []
+        for part in re.split(r'(\[|\])', line):
+            if part == '[':
+                italic = True
+                runs.append(['[', True])
+                continue
+            if part == ']':
+                if runs and runs[-1][1]:
+                    runs[-1][0] += ']'
+                else:
+                    runs.append([']', True])
+                italic = False
+                continue
+            if not part:
+                continue
+            if runs and runs[-1][1] == italic:
+                runs[-1][0] += part
+            else:
+                runs.append([part, italic])
+        layout.append(tuple((segment, flag) for segment, flag in runs))
+    return tuple(layout)
+
+def render_layout_line(runs, base_color):
+    """Apply current theme colors to one cached layout line"""
+    return ''.join(
+        f"{Colors.GRAY}{segment}{Colors.RESET}{base_color}" if italic else segment
+        for segment, italic in runs
+    )
+
+class TermHighlighter:
+    """Aho-Corasick automaton that marks every query term in one pass over text
+
+    Built once per search from all query terms (case-insensitive), then reused
+    for every result, so multi-word queries highlight each word.
+    """
+
+    def __init__(self, terms):
+        self.goto = [{}]      # state -> {char: next state}
+        self.fail = [0]       # state -> fallback state
+        self.lengths = [()]   # state -> lengths of terms ending here
+
+        for term in {t.lower() for t in terms if t}:
+            state = 0
+            for ch in term:
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][ch] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.lengths.append(())
+                state = next_state
+            self.lengths[state] += (len(term),)
+
+        # Breadth-first pass to wire failure links and inherit outputs
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.lengths[next_state] += self.lengths[self.fail[next_state]]
+
+    def find_spans(self, text):
+        """Return merged (start, end) spans of all term occurrences"""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Keep offsets aligned when lowercasing changes string length
+            lowered = ''.join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+        spans = []
+        state = 0
+        goto, fail, lengths = self.goto, self.fail, self.lengths
+        for i, ch in enumerate(lowered):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if lengths[state]:
+                end = i + 1
+                start = end - max(lengths[state])
+                # A longer term can cover several earlier spans; absorb all of them
+                while spans and start <= spans[-1][1]:
+                    start = min(start, spans.pop()[0])
+                spans.append((start, end))
+        return spans
+
+    def highlight(self, text, before, after):
+        """Wrap every term occurrence in text with the given markers"""
+        spans = self.find_spans(text)
+        if not spans:
+            return text
+        pieces = []
+        last_end = 0
+        for start, end in spans:
+            pieces.append(text[last_end:start])
+            pieces.append(f"{before}{text[start:end]}{after}")
+            last_end = end
+        pieces.append(text[last_end:])
+        return ''.join(pieces)
+
+class NgramTable:
+    """Frequency table for one n-gram size, stored as compact count arrays
+
+    N-gram ids are ordered by descending total count, so the top-N report is a
+    slice. Per-book counts use a CSR layout: the books and counts for id i live
+    at book_offsets[i]:book_offsets[i + 1].
+    """
+
+    def __init__(self, n, book_counters):
+        self.n = n
+        totals = Counter()
+        for counter in book_counters:
+            totals.update(counter)
+        # Descending count; ties keep first-seen (canonical text) order
+        ordered = sorted(totals, key=totals.__getitem__, reverse=True)
+
+        key = (lambda gram: gram) if n == 1 else ' '.join
+        self.ngrams = [key(gram) for gram in ordered]
+        self.ids = {gram: i for i, gram in enumerate(self.ngrams)}
+        self.totals = array('I', (totals[gram] for gram in ordered))
+        self.total = sum(self.totals)
+
+        # Pack (id, book, count) into one int so a plain sort groups by id, then book
+        raw_ids = {gram: i for i, gram in enumerate(ordered)}
+        packed = [(raw_ids[gram] << 40) | (book_idx << 32) | count
+                  for book_idx, counter in enumerate(book_counters)
+                  for gram, count in counter.items()]
+        packed.sort()
+
+        per_id = Counter(entry >> 40 for entry in packed)
+        self.book_offsets = array('I', [0])
+        for gram_id in range(len(ordered)):
+            self.book_offsets.append(self.book_offsets[-1] + per_id[gram_id])
+        self.book_ids = array('B', ((entry >> 32) & 0xFF for entry in packed))
+        self.book_counts = array('I', (entry & 0xFFFFFFFF for entry in packed))
+
+    def count(self, ngram):
+        """Total occurrences of an n-gram (space-joined tokens)"""
+        gram_id = self.ids.get(ngram)
+        return 0 if gram_id is None else self.totals[gram_id]
+
+    def rank(self, ngram):
+        """1-based frequency rank of an n-gram (None if absent)"""
+        gram_id = self.ids.get(ngram)
+        return None if gram_id is None else gram_id + 1
+
+    def book_breakdown(self, ngram):
+        """List of (book_idx, count) for an n-gram, in book order"""
+        gram_id = self.ids.get(ngram)
+        if gram_id is None:
+            return []
+        start, end = self.book_offsets[gram_id], self.book_offsets[gram_id + 1]
+        return list(zip(self.book_ids[start:end], self.book_counts[start:end]))
+
+    def top(self, limit=20, book_idx=None):
+        """Most frequent n-grams overall or within one book, as (ngram, count)"""
+        if book_idx is None:
+            return [(self.ngrams[i], self.totals[i]) for i in range(min(limit, len(self.ngrams)))]
+        book_ids, book_counts, offsets = self.book_ids, self.book_counts, self.book_offsets
+        in_book = ((book_counts[j], gram_id)
+                   for gram_id in range(len(self.ngrams))
+                   for j in range(offsets[gram_id], offsets[gram_id + 1])
+                   if book_ids[j] == book_idx)
+        return [(self.ngrams[gram_id], count) for count, gram_id in heapq.nlargest(limit, in_book)]
+
+class PrefixTrie:
+    """Prefix trie mapping normalized keys (see book_key) to completions
+
+    Every node keeps the set of completions reachable below it, so a lookup
+    is a single walk down the typed prefix with no subtree traversal.
+    """
+
+    def __init__(self, items=()):
+        self.root = {'': set()}
+        for key, value in items:
+            self.insert(key, value)
+
+    def insert(self, key, value):
+        node = self.root
+        node[''].add(value)
+        for char in book_key(key):
+            node = node.setdefault(char, {'': set()})
+            node[''].add(value)
+
+    def complete(self, prefix):
+        node = self.root
+        for char in book_key(prefix):
+            node = node.get(char)
+            if node is None:
+                return []
+        return sorted(node[''])
+
+# Persistent reading data (append-only JSON-lines logs, one per kind of record)
+STORE_DIR = 'reader_data'
+HISTORY_LIMIT = 50        # Recent verses kept in memory for the history view
+STORE_TAIL_BLOCK = 65536  # Bytes read per step when scanning the history log backwards
+STORE_COMPACT_MIN = 100   # Dead records tolerated before a log is compacted
+
+class ReaderStore:
+    """Append-only JSON-lines logs for history, bookmarks and notes
+
+    Every change is a single appended line, so nothing is rewritten on save.
+    The bookmark and note logs are replayed on load and compacted to their
+    live records (temp file + os.replace) once dead records outnumber them.
+    The history log is never compacted; only its tail is read at startup,
+    so years of history cost nothing to load.
+    """
+
+    def __init__(self, directory=STORE_DIR):
+        self.directory = directory
+        self.dead = defaultdict(int)  # log name -> superseded records in the file
+
+    def path(self, name):
+        return os.path.join(self.directory, f"{name}.jsonl")
+
+    def append(self, name, record):
+        """Append one record; returns False if the log could not be written"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.path(name), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            return True
+        except OSError:
+            return False
+
+    def read(self, name):
+        """All records of a log, oldest first (a torn last line from a crash is skipped)"""
+        records = []
+        try:
+            with open(self.path(name), 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            pass
+        return records
+
+    def read_recent(self, name, limit):
+        """The latest record of each of the last `limit` distinct refs, oldest first, read from the end"""
+        records = []
+        seen = set()
+        try:
+            with open(self.path(name), 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                end = f.tell()
+                leftover = b''
+                while end > 0 and len(records) < limit:
+                    start = max(0, end - STORE_TAIL_BLOCK)
+                    f.seek(start)
+                    lines = (f.read(end - start) + leftover).split(b'\n')
+                    # The first piece may be a partial line unless we reached the start
+                    leftover = lines.pop(0) if start > 0 else b''
+                    for line in reversed(lines):
+                        try:
+                            record = json.loads(line)
+                            ref = record['ref']
+                        except (ValueError, KeyError, TypeError):
+                            continue
+                        if ref not in seen:
+                            seen.add(ref)
+                            records.append(record)
+                            if len(records) == limit:
+                                break
+                    end = start
+        except OSError:
+            pass
+        return records[::-1]
+
+    def note_dead(self, name, count=1):
+        self.dead[name] += count
+
+    def maybe_compact(self, name, live_records):
+        """Rewrite a log to its live records once dead records dominate"""
+        if self.dead[name] < max(STORE_COMPACT_MIN, len(live_records)):
+            return False
+        path = self.path(name)
+        temp_path = path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for record in live_records:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except OSError:
+            return False
+        self.dead[name] = 0
+        return True
+
+# Menu commands offered by tab completion; those in REFERENCE_COMMANDS take a reference
+MENU_COMMANDS = [
+    'search', 'compare', 'similar', 'parallels', 'bookmark', 'bookmarks', 'note', 'notes', 'history', 'translations',
+    'translation', 'stats', 'books', 'freq', 'phrases', 'concordance', 'export bookmarks',
+    'export history', 'daily', 'random', 'next', 'prev', 'quit'
+]
+REFERENCE_COMMANDS = ('compare', 'similar', 'parallels', 'bookmark', 'note', 'notes')
+
+def readline_prompt(prompt):
+    """Mark ANSI codes as zero-width so readline measures the prompt correctly"""
+    if readline is None:
+        return prompt
+    return re.sub(r'(\033\[[0-9;]*m)', '\001\\1\002', prompt)
+
 # Beautiful ASCII Art
 ASCII_CROSS = f"""{Colors.GOLD}
             ╔═══╗
@@ -241,6 +868,7 @@ ASCII_BIBLE = f"""{Colors.CYAN}
 class BibleReader:
     def __init__(self):
         self.translations = {}
+        self.translation_files = {}  # translation -> JSON file it was loaded from
         self.current_translation = 'KJV'
         self.cross_refs = defaultdict(list)
         self.daily_verses = [
@@ -262,10 +890,48 @@ class BibleReader:
         self.current_theme = "professional"
         Colors.set_theme(self.current_theme)
 
-        # History and bookmarks
+        # History, bookmarks and notes (persisted under STORE_DIR, except in tests)
         self.history = []  # Recently viewed verses
         self.bookmarks = []  # Favorite verses
+        self.notes = defaultdict(list)  # reference -> [{'text', 'time'}]
         self.current_chapter_ref = None  # For next/prev navigation
+        self.store = None if os.environ.get('TESTING') else ReaderStore()
+
+        # Cached word-wrap layouts: (translation, reference, width, markup) -> lines
+        self.layout_cache = {}
+        self.preview_cache = {}  # (translation, reference) -> cross-reference preview text
+        self.cache_lock = threading.Lock()  # Guards cache eviction against the prefetch thread
+
+        # Background prefetch of neighbouring chapters (worker started on first use)
+        self.prefetch_enabled = True  # Benchmarks turn this off so timings are not shared with the worker
+        self.prefetch_queue = queue.Queue()
+        self.prefetch_thread = None
+        self.prefetch_generation = 0  # Requests from older generations are skipped
+
+        # Structural index per translation (built as each translation loads)
+        self.verse_ids = {}      # translation -> references in canonical order
+        self.verse_keys = {}     # translation -> (book, chapter, verse) per position
+        self.verse_texts = {}    # translation -> texts, parallel to verse_ids
+        self.verse_index = {}    # translation -> {(book, chapter, verse): position}
+        self.chapter_spans = {}  # translation -> {(book, chapter): (start, end)}
+        self.alignment = None    # Verse-aligned offsets across all translations (built on first compare)
+        self.completion_index = None  # Tab-completion trie and chapter/verse tables
+        self.completion_matches = []  # Candidates for the completion in progress
+
+        # Token arrays per translation (built once, on first use)
+        self.verse_tokens = {}   # translation -> token tuple per position
+        self.verse_spans = {}    # translation -> (starts, ends) of every token, in verse_tokens order
+        self.verse_folded = {}   # translation -> space-joined tokens per position
+        self.verse_stems = {}    # translation -> stemmed token tuple per position
+        self.word_index = {}     # translation -> {token: (positions, starts, ends)}
+        self.ngram_index = {}    # translation -> {n: NgramTable} for n = 1..3
+        self.tfidf_index = {}    # translation -> L2-normalized TF-IDF matrix (term-major CSR)
+
+        # Cross-reference graph analytics (NumPy, persisted under CACHE_DIR)
+        self.ref_graph = None    # Integer edge columns over canonical verse positions
+        self.ref_suggestions = None  # Top-k co-citation / coupling neighbours per verse
+        self.verse_centrality = None  # PageRank / degree scores per canonical position
+        self.parallels = {}      # (translation, window) -> near-duplicate passage pairs and clusters
 
         # Book metadata
         self.book_order = [
@@ -287,12 +953,49 @@ class BibleReader:
             'Jude', 'Revelation'
         ]
 
+        self.book_aliases = self.build_book_aliases()
+
         print(f"\n{Colors.CYAN}╔══════════════════════════════════════════════════════════════════╗")
         print(f"║                    Loading Bible Data...                     ║")
         print(f"╚══════════════════════════════════════════════════════════════════╝{Colors.RESET}\n")
 
         self.load_all_translations()
         self.load_cross_references()
+        self.load_store()
+
+    @PROFILER.timed('reader store')
+    def load_store(self):
+        """Restore history, bookmarks and notes from the append-only logs"""
+        if self.store is None:
+            return
+
+        recent = self.store.read_recent('history', HISTORY_LIMIT)
+        self.history = [record['ref'] for record in recent]
+
+        bookmarks = {}
+        records = self.store.read('bookmarks')
+        for record in records:
+            bookmarks.pop(record.get('ref'), None)
+            if record.get('op') == 'add':
+                bookmarks[record.get('ref')] = record
+        self.bookmarks = list(bookmarks)
+        self.store.note_dead('bookmarks', len(records) - len(bookmarks))
+        self.store.maybe_compact('bookmarks', list(bookmarks.values()))
+
+        self.notes = defaultdict(list)
+        records = self.store.read('notes')
+        for record in records:
+            if record.get('op') == 'clear':
+                self.notes.pop(record.get('ref'), None)
+            elif record.get('op') == 'add':
+                self.notes[record['ref']].append({'text': record.get('text', ''), 'time': record.get('time', 0)})
+        self.store.note_dead('notes', len(records) - sum(len(notes) for notes in self.notes.values()))
+        self.store.maybe_compact('notes', self.note_records())
+
+    def note_records(self):
+        """Live notes as log records (what a compacted notes log contains)"""
+        return [{'op': 'add', 'ref': ref, 'text': note['text'], 'time': note['time']}
+                for ref, notes in self.notes.items() for note in notes]
 
     def load_all_translations(self):
         """Load all available Bible translations"""
@@ -305,8 +1008,10 @@ class BibleReader:
 
         for abbrev, filename in translation_files.items():
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
+                with PROFILER.phase(f'load {abbrev}'), open(filename, 'r', encoding='utf-8') as f:
                     self.translations[abbrev] = json.load(f)
+                self.translation_files[abbrev] = filename
+                self.build_structural_index(abbrev)
                 info = self.translation_info.get(abbrev, {})
                 print(f"{Colors.SUCCESS}  ✓ {abbrev} loaded - {info.get('name', abbrev)} ({len(self.translations[abbrev]):,} verses){Colors.RESET}")
             except FileNotFoundError:
@@ -315,6 +1020,8 @@ class BibleReader:
                     try:
                         with open('bible-kjv.json', 'r', encoding='utf-8') as f:
                             self.translations[abbrev] = json.load(f)
+                        self.translation_files[abbrev] = 'bible-kjv.json'
+                        self.build_structural_index(abbrev)
                         print(f"{Colors.SUCCESS}  ✓ {abbrev} loaded - King James Version ({len(self.translations[abbrev]):,} verses){Colors.RESET}")
                     except:
                         print(f"{Colors.ERROR}  ✗ Error loading {abbrev}{Colors.RESET}")
@@ -326,6 +1033,436 @@ class BibleReader:
         else:
             print(f"\n{Colors.GOLD}  → Current translation: {self.current_translation} ({self.translation_info[self.current_translation]['name']}){Colors.RESET}\n")
 
+    def build_book_aliases(self):
+        """Map normalized book names and abbreviations to canonical book names"""
+        aliases = {book_key(book): book for book in self.book_order}
+        for abbrev, book in list(OSIS_BOOK_NAMES.items()) + list(COMMON_BOOK_ALIASES.items()):
+            aliases.setdefault(book_key(abbrev), book)
+        return aliases
+
+    def resolve_book_name(self, name):
+        """Resolve a typed book name, abbreviation or unique prefix to its canonical name"""
+        key = book_key(name)
+        if key in self.book_aliases:
+            return self.book_aliases[key]
+        if len(key) >= 2:
+            matches = {book for alias, book in self.book_aliases.items() if alias.startswith(key)}
+            if len(matches) == 1:
+                return matches.pop()
+        return None
+
+    @PROFILER.timed('completion index')
+    def build_completion_index(self):
+        """Build (once) the tab-completion data from the structural index
+
+        Tries of menu commands and of book names/abbreviations, plus each
+        book's chapter numbers and each chapter's verse count.
+        """
+        commands = PrefixTrie((command, command) for command in MENU_COMMANDS)
+        books = PrefixTrie(list(self.book_aliases.items()) + [(book, book) for book in self.book_order])
+
+        chapters, verses = defaultdict(list), {}
+        spans = self.chapter_spans.get(self.current_translation, {})
+        for (book, chapter), (start, end) in spans.items():
+            chapters[book].append(str(chapter))
+            verses[(book, chapter)] = end - start
+
+        self.completion_index = {'commands': commands, 'books': books, 'chapters': chapters, 'verses': verses}
+        return self.completion_index
+
+    def complete_reference(self, text):
+        """Completions for a partly typed reference: book, then chapter, then verse"""
+        index = self.completion_index or self.build_completion_index()
+        match = re.match(r'^(?P<book>.*?[A-Za-z].*?)\s+(?P<chapter>\d*)(?::(?P<verse>\d*))?$', text)
+        book = self.book_aliases.get(book_key(match.group('book'))) if match else None
+        if not book:
+            return index['books'].complete(text)
+
+        if match.group('verse') is None:
+            chapters = [chapter for chapter in index['chapters'].get(book, []) if chapter.startswith(match.group('chapter'))]
+            if len(chapters) == 1:
+                # Offer "John 3" and "John 3:" so readline stops before its trailing space
+                return [f"{book} {chapters[0]}", f"{book} {chapters[0]}:"]
+            return [f"{book} {chapter}" for chapter in chapters]
+
+        chapter = int(match.group('chapter') or 0)
+        count = index['verses'].get((book, chapter), 0)
+        return [f"{book} {chapter}:{verse}" for verse in range(1, count + 1) if str(verse).startswith(match.group('verse'))]
+
+    def complete_line(self, line):
+        """Full-line completions for the menu prompt (commands, then references)"""
+        index = self.completion_index or self.build_completion_index()
+        command, _, rest = line.partition(' ')
+        if command.lower() in REFERENCE_COMMANDS and _:
+            return [f"{command} {reference}" for reference in self.complete_reference(rest.lstrip())]
+        if command.lower() == 'translation' and _:
+            return [f"{command} {abbrev}" for abbrev in self.translations if abbrev.lower().startswith(rest.strip().lower())]
+        if not _:
+            return index['commands'].complete(line) + self.complete_reference(line)
+        return self.complete_reference(line)
+
+    def complete(self, text, state):
+        """readline completer: the whole line is the completion text"""
+        if state == 0:
+            try:
+                self.completion_matches = self.complete_line(text)
+            except Exception:
+                self.completion_matches = []
+        return self.completion_matches[state] if state < len(self.completion_matches) else None
+
+    def setup_completion(self):
+        """Enable tab completion of commands and references when readline is available"""
+        if readline is None:
+            return
+        self.build_completion_index()
+        readline.set_completer(self.complete)
+        readline.set_completer_delims('')
+        if 'libedit' in (readline.__doc__ or ''):
+            readline.parse_and_bind('bind ^I rl_complete')
+        else:
+            readline.parse_and_bind('tab: complete')
+
+    @PROFILER.timed('structural index')
+    def build_structural_index(self, abbrev):
+        """Index a translation's verses in canonical order for slice-based retrieval"""
+        book_rank = {book: i for i, book in enumerate(self.book_order)}
+        entries = []
+        for ref, text in self.translations[abbrev].items():
+            parsed = parse_verse_key(ref)
+            if not parsed:
+                continue
+            book, chapter, verse = parsed
+            book = self.book_aliases.get(book_key(book), book)
+            entries.append((book_rank.get(book, len(book_rank)), chapter, verse, book, ref, text))
+        entries.sort(key=lambda e: e[:3])
+
+        ids, keys, texts = [], [], []
+        index, spans = {}, {}
+        for position, (_, chapter, verse, book, ref, text) in enumerate(entries):
+            ids.append(ref)
+            keys.append((book, chapter, verse))
+            texts.append(text)
+            index[(book, chapter, verse)] = position
+            start, _ = spans.get((book, chapter), (position, position))
+            spans[(book, chapter)] = (start, position + 1)
+
+        self.verse_ids[abbrev] = ids
+        self.verse_keys[abbrev] = keys
+        self.verse_texts[abbrev] = texts
+        self.verse_index[abbrev] = index
+        self.chapter_spans[abbrev] = spans
+
+    def get_alignment(self):
+        """Align every installed translation on canonical (book, chapter, verse) keys
+
+        One row per verse present in any translation, in canonical order. Row r
+        holds each translation's position in its text store at
+        offsets[r * width:(r + 1) * width] (-1 where the translation lacks the
+        verse), so comparing a verse or a chapter is a single slice read.
+        """
+        if self.alignment is not None:
+            return self.alignment
+
+        with PROFILER.phase('translation alignment'):
+            translations = [abbrev for abbrev in self.translations if abbrev in self.verse_index]
+            book_rank = {book: i for i, book in enumerate(self.book_order)}
+            keys = sorted(set().union(*(self.verse_index[abbrev] for abbrev in translations)),
+                          key=lambda key: (book_rank.get(key[0], len(book_rank)), key[1], key[2]))
+
+            width = len(translations)
+            index, chapters = {}, {}
+            for row, (book, chapter, verse) in enumerate(keys):
+                index[(book, chapter, verse)] = row
+                start, _ = chapters.get((book, chapter), (row, row))
+                chapters[(book, chapter)] = (start, row + 1)
+
+            offsets = array('i', [-1]) * (len(keys) * width)
+            for column, abbrev in enumerate(translations):
+                for key, position in self.verse_index[abbrev].items():
+                    offsets[index[key] * width + column] = position
+
+            self.alignment = {
+                'translations': translations,
+                'keys': keys,
+                'index': index,
+                'chapters': chapters,
+                'offsets': offsets,
+            }
+            return self.alignment
+
+    @PROFILER.timed('token index')
+    def build_token_index(self, abbrev):
+        """Tokenize every verse of a translation once and cache the token arrays
+
+        Token offsets into normalize_text(verse) are kept alongside as two flat
+        arrays, so the word index never has to re-tokenize.
+        """
+        tokens, spans = [], []
+        for text in self.verse_texts[abbrev]:
+            normalized = normalize_text(text)
+            verse_spans = [match.span() for match in TOKEN_RE.finditer(normalized)]
+            tokens.append(tuple(normalized[start:end].casefold() for start, end in verse_spans))
+            spans.extend(verse_spans)
+        self.verse_tokens[abbrev] = tokens
+        self.verse_spans[abbrev] = (array('H', [start for start, _ in spans]), array('H', [end for _, end in spans]))
+        self.verse_folded[abbrev] = [' '.join(verse_tokens) for verse_tokens in tokens]
+
+    def get_tokens(self, abbrev=None, stem=False):
+        """Get cached token arrays for a translation, parallel to verse_ids"""
+        abbrev = abbrev or self.current_translation
+        if abbrev not in self.verse_tokens:
+            self.build_token_index(abbrev)
+        if not stem:
+            return self.verse_tokens[abbrev]
+        if abbrev not in self.verse_stems:
+            stems = {}
+            for verse_tokens in self.verse_tokens[abbrev]:
+                for token in verse_tokens:
+                    if token not in stems:
+                        stems[token] = stem_archaic(token)
+            self.verse_stems[abbrev] = [tuple(stems[token] for token in verse_tokens)
+                                        for verse_tokens in self.verse_tokens[abbrev]]
+        return self.verse_stems[abbrev]
+
+    def build_word_index(self, abbrev=None):
+        """Build an inverted index of token -> verse positions and character offsets
+
+        Offsets point into normalize_text(verse), so keyword-in-context lines can
+        be cut without re-scanning verses. Stored as compact arrays. Tokens and
+        offsets come from the token cache (see build_token_index).
+        """
+        abbrev = abbrev or self.current_translation
+        if abbrev in self.word_index:
+            return self.word_index[abbrev]
+
+        with PROFILER.phase(f'word index ({abbrev})'):
+            index = {}
+            if abbrev in self.verse_texts:
+                tokens = self.get_tokens(abbrev)
+                spans = zip(*self.verse_spans[abbrev])
+                for position, verse_tokens in enumerate(tokens):
+                    for token, (start, end) in zip(verse_tokens, spans):
+                        entry = index.get(token)
+                        if entry is None:
+                            entry = index[token] = (array('I'), array('H'), array('H'))
+                        entry[0].append(position)
+                        entry[1].append(start)
+                        entry[2].append(end)
+
+            self.word_index[abbrev] = index
+            return index
+
+    def get_ngram_index(self, abbrev=None):
+        """Build (once) the unigram/bigram/trigram frequency tables for a translation"""
+        abbrev = abbrev or self.current_translation
+        if abbrev in self.ngram_index:
+            return self.ngram_index[abbrev]
+
+        with PROFILER.phase(f'n-gram index ({abbrev})'):
+            book_rank = {book: i for i, book in enumerate(self.book_order)}
+            counters = {n: [Counter() for _ in self.book_order] for n in (1, 2, 3)}
+            for (book, _, _), tokens in zip(self.verse_keys.get(abbrev, []), self.get_tokens(abbrev)):
+                book_idx = book_rank.get(book)
+                if book_idx is None:
+                    continue
+                counters[1][book_idx].update(tokens)
+                counters[2][book_idx].update(zip(tokens, tokens[1:]))
+                counters[3][book_idx].update(zip(tokens, tokens[1:], tokens[2:]))
+
+            self.ngram_index[abbrev] = {n: NgramTable(n, counters[n]) for n in (1, 2, 3)}
+            return self.ngram_index[abbrev]
+
+    def get_tfidf_index(self, abbrev=None):
+        """Build (once) normalized TF-IDF vectors for every verse of a translation
+
+        Stored term-major (one posting list per term) so scoring a query is a
+        single sparse matrix-vector product: gather the query terms' postings
+        and sum them per verse with bincount.
+        """
+        abbrev = abbrev or self.current_translation
+        if abbrev in self.tfidf_index:
+            return self.tfidf_index[abbrev]
+
+        with PROFILER.phase(f'TF-IDF index ({abbrev})'):
+            tokens = self.get_tokens(abbrev)
+            vocab = {}
+            term_ids = np.fromiter((vocab.setdefault(token, len(vocab)) for verse_tokens in tokens for token in verse_tokens),
+                                   dtype=np.int64)
+            lengths = np.fromiter((len(verse_tokens) for verse_tokens in tokens), dtype=np.int64, count=len(tokens))
+            verse_ids = np.repeat(np.arange(len(tokens), dtype=np.int64), lengths)
+            n_verses, n_terms = len(tokens), len(vocab)
+
+            # Term frequency per (verse, term) pair
+            pairs, tf = np.unique(verse_ids * n_terms + term_ids, return_counts=True)
+            rows, cols = pairs // n_terms, pairs % n_terms
+
+            # Smoothed IDF and sublinear TF, then L2-normalize each verse vector
+            df = np.bincount(cols, minlength=n_terms)
+            idf = np.log((1 + n_verses) / (1 + df)) + 1.0
+            weights = (1.0 + np.log(tf)) * idf[cols]
+            norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=n_verses))
+            weights /= norms[rows]
+
+            # Term-major layout: postings for term t live at indptr[t]:indptr[t + 1]
+            order = np.argsort(cols, kind='stable')
+            indptr = np.zeros(n_terms + 1, dtype=np.int64)
+            np.cumsum(df, out=indptr[1:])
+
+            index = {
+                'vocab': vocab,
+                'idf': idf,
+                'indptr': indptr,
+                'rows': rows[order].astype(np.int32),
+                'weights': weights[order].astype(np.float32),
+                'n_verses': n_verses,
+            }
+            self.tfidf_index[abbrev] = index
+            return index
+
+    def find_similar_verses(self, position, k=10, abbrev=None):
+        """Top-k verses by TF-IDF cosine similarity to the verse at a position"""
+        abbrev = abbrev or self.current_translation
+        index = self.get_tfidf_index(abbrev)
+        vocab, indptr = index['vocab'], index['indptr']
+
+        # Query vector from the verse's own tokens
+        counts = Counter(self.get_tokens(abbrev)[position])
+        terms = np.array([vocab[token] for token in counts], dtype=np.int64)
+        if not len(terms):
+            return []
+        query = (1.0 + np.log(np.array(list(counts.values()), dtype=np.float64))) * index['idf'][terms]
+        query /= np.linalg.norm(query)
+
+        # Sparse dot product: scores[v] = sum over query terms of w[v, t] * q[t]
+        starts, ends = indptr[terms], indptr[terms + 1]
+        sizes = ends - starts
+        gather = np.repeat(starts - np.cumsum(sizes) + sizes, sizes) + np.arange(sizes.sum())
+        scores = np.bincount(index['rows'][gather],
+                             weights=index['weights'][gather] * np.repeat(query, sizes),
+                             minlength=index['n_verses'])
+        scores[position] = 0.0
+
+        k = min(k, np.count_nonzero(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(int(i), float(scores[i])) for i in top]
+
+    def find_position(self, reference, translation=None):
+        """Find a verse's position in the structural index (None if not indexed)"""
+        parsed = parse_verse_key(reference)
+        if not parsed:
+            return None
+        book, chapter, verse = parsed
+        book = self.book_aliases.get(book_key(book), book)
+        return self.verse_index.get(translation or self.current_translation, {}).get((book, chapter, verse))
+
+    def count_words(self, reference, text):
+        """Word count for a verse, read from the cached token arrays"""
+        position = self.find_position(reference)
+        if position is None:
+            return len(tokenize(text))
+        return len(self.get_tokens()[position])
+
+    def resolve_passage(self, reference, translation=None):
+        """Resolve a passage reference to a list of (label, start, end) verse slices
+
+        Accepts single verses, chapters, verse ranges ("Romans 8:28-39"),
+        multi-chapter ranges ("Matt 5:3-7:29", "Genesis 1-3") and
+        semicolon-separated lists ("John 3:16; 4:1-3; Ps 23").
+        Returns None if any part cannot be resolved.
+        """
+        translation = translation or self.current_translation
+        index = self.verse_index.get(translation)
+        spans = self.chapter_spans.get(translation)
+        if not index:
+            return None
+
+        keys = self.verse_keys[translation]
+        slices = []
+        book = None
+        for item in re.split(r'\s*;\s*', reference.strip()):
+            if not item:
+                continue
+            parts = re.split(r'\s*[-–]\s*', item, maxsplit=1)
+            match = PASSAGE_REF_RE.match(parts[0])
+            if not match:
+                return None
+            if match.group('book'):
+                book = self.resolve_book_name(match.group('book'))
+            if not book:
+                return None
+
+            chapter = int(match.group('chapter'))
+            verse = match.group('verse')
+            span = spans.get((book, chapter))
+            if not span:
+                return None
+            if verse is None:
+                start, end = span
+            else:
+                start = index.get((book, chapter, int(verse)))
+                if start is None:
+                    return None
+                end = start + 1
+
+            if len(parts) == 2:
+                end_match = PASSAGE_REF_RE.match(parts[1])
+                if not end_match:
+                    return None
+                end_book = book
+                if end_match.group('book'):
+                    end_book = self.resolve_book_name(end_match.group('book'))
+                    if not end_book:
+                        return None
+                if end_match.group('verse') is not None:
+                    # "...-7:29" or "...-Book 7:29"
+                    end_chapter, end_verse = int(end_match.group('chapter')), int(end_match.group('verse'))
+                elif end_match.group('book') or verse is None:
+                    # Whole chapters: "Genesis 1-3"
+                    end_chapter, end_verse = int(end_match.group('chapter')), None
+                else:
+                    # Same chapter: "Romans 8:28-39"
+                    end_chapter, end_verse = chapter, int(end_match.group('chapter'))
+
+                end_span = spans.get((end_book, end_chapter))
+                if not end_span:
+                    return None
+                end = end_span[1]
+                if end_verse is not None:
+                    position = index.get((end_book, end_chapter, end_verse))
+                    if position is not None:
+                        end = position + 1  # Otherwise clamp to end of chapter
+                if end <= start:
+                    return None
+
+            slices.append((format_range(keys[start], keys[end - 1]), start, end))
+
+        return slices or None
+
+    def get_passage(self, reference, translation=None):
+        """Get (reference, text) pairs for a passage, one slice read per range"""
+        translation = translation or self.current_translation
+        slices = self.resolve_passage(reference, translation)
+        if not slices:
+            return None
+        ids = self.verse_ids[translation]
+        texts = self.verse_texts[translation]
+        passage = []
+        for _, start, end in slices:
+            passage.extend(zip(ids[start:end], texts[start:end]))
+        return passage
+
+    def get_passage_text(self, reference, translation=None):
+        """Get verse or passage text as a single string (None if not found)"""
+        text = self.get_verse(reference, translation)
+        if text is None and ('-' in reference or ';' in reference):
+            passage = self.get_passage(reference, translation)
+            if passage:
+                text = ' '.join(verse_text for _, verse_text in passage)
+        return text
+
     @property
     def bible_data(self):
         """Get current translation data"""
@@ -333,31 +1470,19 @@ class BibleReader:
 
     def expand_book_name(self, abbrev):
         """Expand book abbreviation to full name"""
-        book_map = {
-            'Gen': 'Genesis', 'Exod': 'Exodus', 'Lev': 'Leviticus', 'Num': 'Numbers', 'Deut': 'Deuteronomy',
-            'Josh': 'Joshua', 'Judg': 'Judges', 'Ruth': 'Ruth', '1Sam': '1 Samuel', '2Sam': '2 Samuel',
-            '1Kgs': '1 Kings', '2Kgs': '2 Kings', '1Chr': '1 Chronicles', '2Chr': '2 Chronicles',
-            'Ezra': 'Ezra', 'Neh': 'Nehemiah', 'Esth': 'Esther', 'Job': 'Job', 'Ps': 'Psalms',
-            'Prov': 'Proverbs', 'Eccl': 'Ecclesiastes', 'Song': 'Song of Solomon', 'Isa': 'Isaiah',
-            'Jer': 'Jeremiah', 'Lam': 'Lamentations', 'Ezek': 'Ezekiel', 'Dan': 'Daniel',
-            'Hos': 'Hosea', 'Joel': 'Joel', 'Amos': 'Amos', 'Obad': 'Obadiah', 'Jonah': 'Jonah',
-            'Mic': 'Micah', 'Nah': 'Nahum', 'Hab': 'Habakkuk', 'Zeph': 'Zephaniah', 'Hag': 'Haggai',
-            'Zech': 'Zechariah', 'Mal': 'Malachi', 'Matt': 'Matthew', 'Mark': 'Mark', 'Luke': 'Luke',
-            'John': 'John', 'Acts': 'Acts', 'Rom': 'Romans', '1Cor': '1 Corinthians', '2Cor': '2 Corinthians',
-            'Gal': 'Galatians', 'Eph': 'Ephesians', 'Phil': 'Philippians', 'Col': 'Colossians',
-            '1Thess': '1 Thessalonians', '2Thess': '2 Thessalonians', '1Tim': '1 Timothy', '2Tim': '2 Timothy',
-            'Titus': 'Titus', 'Phlm': 'Philemon', 'Heb': 'Hebrews', 'Jas': 'James', '1Pet': '1 Peter',
-            '2Pet': '2 Peter', '1John': '1 John', '2John': '2 John', '3John': '3 John', 'Jude': 'Jude',
-            'Rev': 'Revelation'
-        }
-        return book_map.get(abbrev, abbrev)
+        return OSIS_BOOK_NAMES.get(abbrev, abbrev)
 
     def convert_ref_format(self, ref):
-        """Convert Gen.1.1 or Ps.23.1-Ps.23.2 format to Genesis 1:1 format"""
+        """Convert Gen.1.1 or Ps.23.1-Ps.23.2 format to Genesis 1:1 or Psalms 23:1-2 format"""
         if '-' in ref:
-            parts = ref.split('-')
+            parts = ref.split('-', 1)
             start = self.convert_ref_format(parts[0])
-            return start
+            end = self.convert_ref_format(parts[1])
+            start_key = parse_verse_key(start)
+            end_key = parse_verse_key(end)
+            if not start_key or not end_key:
+                return start
+            return format_range(start_key, end_key)
 
         parts = ref.split('.')
         if len(parts) >= 3:
@@ -367,6 +1492,7 @@ class BibleReader:
             return f"{book} {chapter}:{verse}"
         return ref
 
+    @PROFILER.timed('cross-reference parse')
     def load_cross_references(self):
         """Load cross-reference data"""
         try:
@@ -375,7 +1501,8 @@ class BibleReader:
                 for line in lines:
                     parts = line.strip().split('\t')
                     if len(parts) >= 3:
-                        from_verse = self.convert_ref_format(parts[0])
+                        # Cross-references are keyed by the single starting verse
+                        from_verse = self.convert_ref_format(parts[0].split('-')[0])
                         to_verse = self.convert_ref_format(parts[1])
                         try:
                             votes = int(parts[2])
@@ -393,6 +1520,342 @@ class BibleReader:
         except Exception as e:
             print(f"{Colors.ERROR}  ✗ Error loading cross-references: {e}{Colors.RESET}")
 
+    def graph_translation(self):
+        """Translation whose structural index numbers the cross-reference graph"""
+        return 'KJV' if 'KJV' in self.verse_index else next(iter(self.verse_index), None)
+
+    def analytics_signature(self, translation=None):
+        """Fingerprint of the inputs behind cached analytics (size/mtime of the source files)"""
+        parts = []
+        filenames = ['cross_references.txt']
+        if translation in self.translation_files:
+            filenames.append(self.translation_files[translation])
+        for filename in filenames:
+            try:
+                stat = os.stat(filename)
+                parts.append(f"{filename}:{stat.st_size}:{int(stat.st_mtime)}")
+            except OSError:
+                parts.append(f"{filename}:missing")
+        translation = self.graph_translation()
+        parts.append(f"{translation}:{len(self.verse_ids.get(translation, []))}")
+        return '|'.join(parts)
+
+    def load_cached_arrays(self, name, translation=None):
+        """Load a precomputed .npz from CACHE_DIR if it matches the current inputs"""
+        path = os.path.join(CACHE_DIR, f"{name}.npz")
+        try:
+            with np.load(path) as data:
+                if str(data['signature']) != self.analytics_signature(translation):
+                    return None
+                return {key: data[key] for key in data.files if key != 'signature'}
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def save_cached_arrays(self, name, translation=None, **arrays):
+        """Persist precomputed arrays to CACHE_DIR (best effort)"""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            path = os.path.join(CACHE_DIR, f"{name}.npz")
+            np.savez(path, signature=np.array(self.analytics_signature(translation)), **arrays)
+        except OSError as e:
+            print(f"{Colors.GRAY}  (could not cache {name}: {e}){Colors.RESET}")
+
+    def get_ref_graph(self):
+        """Cross-references as integer columns (src, dst, votes) over canonical positions"""
+        if self.ref_graph is not None:
+            return self.ref_graph
+
+        with PROFILER.phase('cross-reference graph'):
+            translation = self.graph_translation()
+            index = self.verse_index.get(translation, {})
+            src, dst, votes = array('i'), array('i'), array('i')
+            for from_verse, refs in self.cross_refs.items():
+                source = self.find_position(from_verse, translation)
+                if source is None:
+                    continue
+                for ref in refs:
+                    # Ranges are linked through their first verse
+                    target = self.find_position(ref['verse'].split('-')[0], translation)
+                    if target is not None:
+                        src.append(source)
+                        dst.append(target)
+                        votes.append(ref['votes'])
+
+            self.ref_graph = {
+                'n': len(index),
+                'src': np.frombuffer(src, dtype=np.int32).astype(np.int64),
+                'dst': np.frombuffer(dst, dtype=np.int32).astype(np.int64),
+                'votes': np.frombuffer(votes, dtype=np.int32).copy(),
+            }
+            return self.ref_graph
+
+    @PROFILER.timed('suggested references')
+    def compute_ref_suggestions(self, k=10, pair_budget=4_000_000):
+        """Top-k co-citation + bibliographic-coupling neighbours for every verse
+
+        coupling(i, x): both i and x reference some verse j (A·Aᵀ)
+        co-citation(i, x): some verse references both i and x (Aᵀ·A)
+        The full pairwise space is far too large, so rows are processed in
+        blocks sized to a pair budget, each block being two vectorized sparse
+        products. Pairs that are already direct cross-references are dropped.
+        """
+        graph = self.get_ref_graph()
+        n = graph['n']
+        src, dst = graph['src'], graph['dst']
+        out_ptr, out_members = csr_from_edges(src, dst, n)
+        in_ptr, in_members = csr_from_edges(dst, src, n)
+        out_deg, in_deg = np.diff(out_ptr), np.diff(in_ptr)
+
+        # Existing links in either direction, as sorted pair keys
+        direct = np.unique(np.concatenate([src * n + dst, dst * n + src]))
+
+        # Estimated pairs per row, used to cut blocks
+        cost = (np.bincount(src, weights=in_deg[dst], minlength=n) +
+                np.bincount(dst, weights=out_deg[src], minlength=n))
+        bounds = np.searchsorted(np.cumsum(cost), np.arange(pair_budget, cost.sum() + pair_budget, pair_budget))
+        bounds = np.unique(np.concatenate([[0], np.minimum(bounds + 1, n), [n]]))
+
+        neighbours = np.full((n, k), -1, dtype=np.int32)
+        scores = np.zeros((n, k), dtype=np.int32)
+        for block_start, block_end in zip(bounds[:-1], bounds[1:]):
+            rows = np.arange(block_start, block_end)
+            # Coupling: i -> j <- x
+            owner, middle = gather_csr(out_ptr, out_members, rows)
+            owner2, coupled = gather_csr(in_ptr, in_members, middle)
+            # Co-citation: i <- j -> x
+            owner3, middle3 = gather_csr(in_ptr, in_members, rows)
+            owner4, cocited = gather_csr(out_ptr, out_members, middle3)
+
+            left = np.concatenate([rows[owner][owner2], rows[owner3][owner4]])
+            right = np.concatenate([coupled, cocited])
+            keys = left * n + right
+            keys = keys[(left != right) & ~np.isin(keys, direct)]
+            if not len(keys):
+                continue
+
+            pairs, counts = np.unique(keys, return_counts=True)
+            pair_rows, pair_cols = pairs // n, pairs % n
+            order = np.lexsort((-counts, pair_rows))
+            pair_rows, pair_cols, counts = pair_rows[order], pair_cols[order], counts[order]
+            first = np.searchsorted(pair_rows, pair_rows, side='left')
+            rank = np.arange(len(pair_rows)) - first
+            keep = rank < k
+            neighbours[pair_rows[keep], rank[keep]] = pair_cols[keep]
+            scores[pair_rows[keep], rank[keep]] = counts[keep]
+
+        return neighbours, scores
+
+    def get_ref_suggestions(self):
+        """Load suggested references from cache, computing and persisting them once"""
+        if self.ref_suggestions is not None:
+            return self.ref_suggestions
+        if np is None:
+            return None
+
+        cached = self.load_cached_arrays('ref_suggestions')
+        if cached is None:
+            print(f"{Colors.GRAY}  Computing suggested references (one-time)...{Colors.RESET}")
+            neighbours, scores = self.compute_ref_suggestions()
+            self.save_cached_arrays('ref_suggestions', neighbours=neighbours, scores=scores)
+            cached = {'neighbours': neighbours, 'scores': scores}
+        self.ref_suggestions = cached
+        return cached
+
+    @PROFILER.timed('verse centrality')
+    def compute_verse_centrality(self, damping=0.85, tol=1e-10, max_iter=200):
+        """PageRank, vote-weighted PageRank and degrees over the cross-reference graph
+
+        Power iteration on an integer CSR (edges grouped by source): each step
+        spreads every verse's rank evenly (or by votes) over its references
+        with one bincount. Dangling verses redistribute uniformly.
+        """
+        graph = self.get_ref_graph()
+        n = graph['n']
+        src, dst, votes = graph['src'], graph['dst'], graph['votes']
+        indptr, targets = csr_from_edges(src, dst, n)
+        order = np.argsort(src, kind='stable')
+        out_degree = np.diff(indptr).astype(np.int32)
+        in_degree = np.bincount(dst, minlength=n).astype(np.int32)
+
+        def power_iteration(edge_weights):
+            strength = np.bincount(src[order], weights=edge_weights, minlength=n)
+            dangling = strength == 0
+            share = np.divide(edge_weights, strength[src[order]],
+                              out=np.zeros_like(edge_weights), where=edge_weights > 0)
+            rank = np.full(n, 1.0 / n)
+            for iteration in range(1, max_iter + 1):
+                spread = np.bincount(targets, weights=share * rank[src[order]], minlength=n)
+                new_rank = (1.0 - damping) / n + damping * (spread + rank[dangling].sum() / n)
+                delta = np.abs(new_rank - rank).sum()
+                rank = new_rank
+                if delta < tol:
+                    break
+            return rank, iteration
+
+        pagerank, iterations = power_iteration(np.ones(len(targets)))
+        # Negative votes carry no weight; verses whose refs all score <= 0 act as dangling
+        weighted, _ = power_iteration(np.clip(votes[order], 0, None).astype(np.float64))
+
+        return {
+            'pagerank': pagerank,
+            'weighted_pagerank': weighted,
+            'in_degree': in_degree,
+            'out_degree': out_degree,
+            'vote_in': np.bincount(dst, weights=np.clip(votes, 0, None), minlength=n).astype(np.int64),
+            'iterations': np.array(iterations),
+        }
+
+    def export_centrality_json(self, scores, filename):
+        """Write centrality scores as JSON for the visualizers"""
+        translation = self.graph_translation()
+        keys = self.verse_keys[translation]
+        data = {
+            'verses': [format_range(key, key) for key in keys],
+            'pagerank': [round(float(x) * len(keys), 4) for x in scores['pagerank']],
+            'weighted_pagerank': [round(float(x) * len(keys), 4) for x in scores['weighted_pagerank']],
+            'in_degree': scores['in_degree'].tolist(),
+            'out_degree': scores['out_degree'].tolist(),
+            'vote_in': scores['vote_in'].tolist(),
+            'note': 'PageRank values are scaled by verse count (1.0 = average verse)',
+        }
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    def get_verse_centrality(self):
+        """Load centrality scores from cache, computing and persisting them once"""
+        if self.verse_centrality is not None:
+            return self.verse_centrality
+        if np is None:
+            return None
+
+        cached = self.load_cached_arrays('verse_centrality')
+        if cached is None:
+            print(f"{Colors.GRAY}  Computing verse centrality (one-time)...{Colors.RESET}")
+            cached = self.compute_verse_centrality()
+            self.save_cached_arrays('verse_centrality', **cached)
+            try:
+                self.export_centrality_json(cached, os.path.join(CACHE_DIR, 'verse_centrality.json'))
+            except OSError:
+                pass
+        self.verse_centrality = cached
+        return cached
+
+    @PROFILER.timed('parallel passages')
+    def compute_parallels(self, abbrev, window=1):
+        """Near-duplicate passages of `window` consecutive verses (MinHash + LSH)
+
+        Every passage is reduced to a MinHash signature of its word shingles;
+        only passages sharing an LSH band bucket are compared, so the full
+        all-pairs comparison is never made. Candidates whose signatures agree
+        on at least PARALLEL_THRESHOLD of the permutations are kept and joined
+        into clusters with union-find. Windows never cross a chapter boundary.
+        """
+        tokens = self.get_tokens(abbrev)
+        keys = self.verse_keys[abbrev]
+        units, starts, values = array('i'), array('q'), array('I')
+        for position in range(len(tokens) - window + 1):
+            if keys[position][:2] != keys[position + window - 1][:2]:
+                continue
+            passage = [token for verse_tokens in tokens[position:position + window] for token in verse_tokens]
+            hashes = shingle_hashes(passage)
+            if len(hashes) < PARALLEL_MIN_SHINGLES:
+                continue
+            units.append(position)
+            starts.append(len(values))
+            values.extend(hashes)
+
+        units = np.frombuffer(units, dtype=np.int32).astype(np.int64)
+        signatures = minhash_signatures(np.frombuffer(values, dtype=np.uint32).astype(np.uint64),
+                                        np.frombuffer(starts, dtype=np.int64))
+        first, second = lsh_candidate_pairs(signatures)
+
+        # Estimated Jaccard similarity = share of agreeing permutations (chunked to bound memory)
+        similarity = np.empty(len(first), dtype=np.float32)
+        for chunk in range(0, len(first), 100_000):
+            block = slice(chunk, chunk + 100_000)
+            similarity[block] = (signatures[first[block]] == signatures[second[block]]).mean(axis=1)
+        keep = similarity >= PARALLEL_THRESHOLD
+        # Overlapping windows trivially share verses
+        keep &= units[second] - units[first] >= window
+        first, second, similarity = first[keep], second[keep], similarity[keep]
+
+        parent = list(range(len(units)))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for i, j in zip(first.tolist(), second.tolist()):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        linked = np.unique(np.concatenate([first, second]))
+        roots = np.array([find(i) for i in linked.tolist()], dtype=np.int64)
+        # Roots are each cluster's smallest member, so clusters come out in canonical order
+        order = np.argsort(roots, kind='stable')
+        _, sizes = np.unique(roots, return_counts=True)
+        cluster_ptr = np.concatenate([[0], np.cumsum(sizes)])
+
+        return {
+            'pair_first': units[first].astype(np.int32),
+            'pair_second': units[second].astype(np.int32),
+            'pair_similarity': similarity,
+            'cluster_ptr': cluster_ptr,
+            'cluster_members': units[linked[order]].astype(np.int32),
+            'window': np.array(window),
+        }
+
+    def get_parallels(self, window=1, abbrev=None):
+        """Load parallel passages from cache, computing and persisting them once"""
+        abbrev = abbrev or self.current_translation
+        if (abbrev, window) in self.parallels:
+            return self.parallels[(abbrev, window)]
+        if np is None:
+            return None
+
+        name = f"parallels_{abbrev.lower()}_w{window}"
+        cached = self.load_cached_arrays(name, translation=abbrev)
+        if cached is None:
+            print(f"{Colors.GRAY}  Detecting parallel passages in {abbrev} (one-time)...{Colors.RESET}")
+            cached = self.compute_parallels(abbrev, window)
+            self.save_cached_arrays(name, translation=abbrev, **cached)
+        self.parallels[(abbrev, window)] = cached
+        return cached
+
+    def parallel_runs(self, parallels):
+        """Merge pairs of adjacent windows into aligned runs: (first, second, length, similarity)
+
+        Psalms 14:1-2 ~ 53:1-2 and 14:2-3 ~ 53:2-3 become one run Psalms 14:1-3 ~ 53:1-3.
+        """
+        first = parallels['pair_first'].astype(np.int64)
+        second = parallels['pair_second'].astype(np.int64)
+        similarity = parallels['pair_similarity']
+        if not len(first):
+            return []
+        order = np.lexsort((first, second - first))
+        first, second, similarity = first[order], second[order], similarity[order]
+        breaks = np.flatnonzero((np.diff(first) != 1) | (np.diff(second - first) != 0)) + 1
+        bounds = np.concatenate([[0], breaks, [len(first)]])
+        window = int(parallels['window'])
+        return [(int(first[a]), int(second[a]), int(first[b - 1] - first[a]) + window, float(similarity[a:b].mean()))
+                for a, b in zip(bounds[:-1], bounds[1:])]
+
+    def parallel_cluster(self, parallels, position):
+        """Start positions of every passage in the union-find cluster of the one starting at `position`
+
+        Clusters are transitive, so this includes passages that only match through
+        another member (e.g. every telling of a story shared by Samuel, Kings and Chronicles).
+        """
+        members, ptr = parallels['cluster_members'], parallels['cluster_ptr']
+        hit = np.flatnonzero(members == position)
+        if not len(hit):
+            return []
+        cluster = int(np.searchsorted(ptr, hit[0], side='right')) - 1
+        return members[ptr[cluster]:ptr[cluster + 1]].tolist()
+
     def format_verse_text(self, text):
         """Format verse text with colors"""
         text = text.replace('# ', '')
@@ -400,17 +1863,53 @@ class BibleReader:
         text = re.sub(r'\[([^\]]+)\]', f'{Colors.GRAY}[\\1]{Colors.RESET}', text)
         return text
 
-    def get_verse(self, reference):
-        """Get a specific verse by reference"""
-        if reference in self.bible_data:
-            return self.bible_data[reference]
-        for key in self.bible_data.keys():
-            if key.lower() == reference.lower():
-                return self.bible_data[key]
+    def get_layout(self, reference, text, width=WRAP_WIDTH, markup='italics', translation=None):
+        """Get the cached word-wrap layout for a verse, building it on first use"""
+        key = (translation or self.current_translation, reference, width, markup)
+        layout = self.layout_cache.get(key)
+        if layout is None:
+            layout = build_layout(text, width, markup)
+            with self.cache_lock:
+                if len(self.layout_cache) >= LAYOUT_CACHE_LIMIT:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    self.layout_cache.pop(next(iter(self.layout_cache)))
+                self.layout_cache[key] = layout
+        return layout
+
+    def get_ref_preview(self, reference, translation=None):
+        """Get the cached one-line preview shown for a cross-reference (None if not found)"""
+        translation = translation or self.current_translation
+        key = (translation, reference)
+        if key in self.preview_cache:
+            return self.preview_cache[key]
+        verse_text = self.get_passage_text(reference, translation)
+        preview = None
+        if verse_text:
+            preview = verse_text[:PREVIEW_LENGTH] + "..." if len(verse_text) > PREVIEW_LENGTH else verse_text
+            preview = normalize_text(preview)
+        with self.cache_lock:
+            if len(self.preview_cache) >= PREVIEW_CACHE_LIMIT:
+                self.preview_cache.pop(next(iter(self.preview_cache)))
+            self.preview_cache[key] = preview
+        return preview
+
+    def get_verse(self, reference, translation=None):
+        """Get a specific verse by reference (any case, abbreviations accepted)"""
+        translation = translation or self.current_translation
+        data = self.translations.get(translation, {})
+        if reference in data:
+            return data[reference]
+        position = self.find_position(reference, translation)
+        if position is not None:
+            return self.verse_texts[translation][position]
         return None
 
     def display_verse(self, reference, show_refs=True):
         """Display a verse with beautiful formatting, metadata panel, and cross-references"""
+        # Resolve abbreviations and case ("jn 3:16") to the translation's own reference
+        position = self.find_position(reference)
+        if position is not None:
+            reference = self.verse_ids[self.current_translation][position]
         text = self.get_verse(reference)
 
         if text:
@@ -427,9 +1926,8 @@ class BibleReader:
             trans_year = trans_info.get('year', 'N/A')
 
             # Count characters and words
-            plain_text = re.sub(r'\[([^\]]+)\]', r'\1', text)
-            char_count = len(plain_text)
-            word_count = len(plain_text.split())
+            char_count = len(normalize_text(text))
+            word_count = self.count_words(reference, text)
 
             # Metadata panel
             header = f"{Colors.BRIGHT_GOLD}VERSE DETAILS{Colors.RESET}"
@@ -453,28 +1951,16 @@ class BibleReader:
             print(make_border_line(text_header, align='center'))
             print(f"{make_border_bottom()}{Colors.RESET}\n")
 
-            # Word wrap for long verses
-            formatted = self.format_verse_text(text)
-            words = formatted.split()
-            lines = []
-            current_line = ""
-
-            for word in words:
-                test_line = current_line + " " + word if current_line else word
-                # Account for ANSI codes in length check
-                visible_length = len(re.sub(r'\033\[[0-9;]+m', '', test_line))
-                if visible_length <= 74:
-                    current_line = test_line
-                else:
-                    lines.append(current_line)
-                    current_line = word
-            if current_line:
-                lines.append(current_line)
-
-            for line in lines:
-                print(f"  {Colors.VERSE_TEXT}{line}{Colors.RESET}")
+            # Word wrap for long verses (layout cached, colors applied here)
+            for runs in self.get_layout(reference, text):
+                print(f"  {Colors.VERSE_TEXT}{render_layout_line(runs, Colors.VERSE_TEXT)}{Colors.RESET}")
             print()
 
+            for note in self.notes.get(reference, []):
+                print(f"  {Colors.BRIGHT_MAGENTA}📝{Colors.RESET} {Colors.WHITE}{note['text']}{Colors.RESET}")
+            if self.notes.get(reference):
+                print()
+
             if show_refs:
                 self.display_cross_references(reference)
         else:
@@ -507,11 +1993,9 @@ class BibleReader:
             print(f"{make_border_bottom()}{Colors.RESET}\n")
 
             for i, ref in enumerate(refs[:limit], 1):
-                verse_text = self.get_verse(ref['verse'])
-                if verse_text:
-                    preview = verse_text[:65] + "..." if len(verse_text) > 65 else verse_text
-                    preview = preview.replace('# ', '')
-                    preview = re.sub(r'\[([^\]]+)\]', r'\1', preview)
+                # Ranges like "Psalms 23:1-2" preview the whole passage
+                preview = self.get_ref_preview(ref['verse'])
+                if preview:
                     votes = ref.get('votes', 0)
 
                     print(f"  {Colors.BRIGHT_MAGENTA}[{i}]{Colors.RESET} {Colors.BRIGHT_GOLD}{ref['verse']}{Colors.RESET} {Colors.GRAY}({votes} votes){Colors.RESET}")
@@ -522,7 +2006,39 @@ class BibleReader:
                 print(f"  💡 {len(refs) - limit} more references available")
                 print(f"{'─' * 80}{Colors.RESET}\n")
 
-    def search_keyword(self, keyword, limit=15, testament=None, book=None, exact_phrase=False):
+        self.display_suggested_references(reference)
+
+    def display_suggested_references(self, reference, limit=3):
+        """Show verses that share many references with this one (precomputed)"""
+        suggestions = self.get_ref_suggestions()
+        translation = self.graph_translation()
+        position = self.find_position(reference, translation)
+        if suggestions is None or position is None:
+            return
+
+        neighbours = suggestions['neighbours'][position]
+        scores = suggestions['scores'][position]
+        keys = self.verse_keys[translation]
+        shown = [(int(other), int(score)) for other, score in zip(neighbours, scores) if other >= 0][:limit]
+        if not shown:
+            return
+
+        header = f"{Colors.BRIGHT_GOLD}SUGGESTED REFERENCES{Colors.RESET} {Colors.GRAY}(shared cross-references){Colors.RESET}"
+        print(f"{Colors.BRIGHT_BLUE}{make_border_top()}")
+        print(make_border_line(header, align='center'))
+        print(f"{make_border_bottom()}{Colors.RESET}\n")
+
+        current_index = self.verse_index.get(self.current_translation, {})
+        for i, (other, score) in enumerate(shown, 1):
+            current = current_index.get(keys[other])
+            other_ref = self.verse_ids[self.current_translation][current] if current is not None else format_range(keys[other], keys[other])
+            verse_text = self.verse_texts[self.current_translation][current] if current is not None else ''
+            preview = normalize_text(verse_text)
+            preview = preview[:65] + "..." if len(preview) > 65 else preview
+            print(f"  {Colors.BRIGHT_BLUE}[{i}]{Colors.RESET} {Colors.BRIGHT_GOLD}{other_ref}{Colors.RESET} {Colors.GRAY}({score} shared){Colors.RESET}")
+            print(f"      {Colors.DIM_CYAN}↳{Colors.RESET} {Colors.WHITE}{preview}{Colors.RESET}\n")
+
+    def search_keyword(self, keyword, limit=15, testament=None, book=None, exact_phrase=False, stem=False, rank=False):
         """Search for verses containing a keyword with optional filters
 
         Args:
@@ -531,21 +2047,35 @@ class BibleReader:
             testament: Filter by 'OT' or 'NT' (optional)
             book: Filter by specific book name (optional)
             exact_phrase: If True, search for exact phrase; if False, search for word presence
+            stem: If True, match archaic forms ("loveth", "givest") by word stem
+            rank: If True, order results by verse centrality (PageRank) instead of Bible order
         """
-        keyword_lower = keyword.lower()
+        translation = self.current_translation
+        query_tokens = tokenize(keyword, stem=stem)
         results = []
 
         # Define Old Testament books for filtering
         ot_books = set(self.book_order[:39])
         nt_books = set(self.book_order[39:])
+        book_filter = (self.resolve_book_name(book) or book) if book else None
+
+        # Match against the cached, normalized token text of each verse
+        if stem:
+            # Pad with spaces so stems only match whole tokens
+            haystacks = [f" {' '.join(stems)} " for stems in self.get_tokens(translation, stem=True)]
+            phrase = f" {' '.join(query_tokens)} "
+            words = [f" {token} " for token in query_tokens]
+        else:
+            self.get_tokens(translation)
+            haystacks = self.verse_folded[translation]
+            phrase = ' '.join(query_tokens)
+            words = query_tokens
 
-        for ref, text in self.bible_data.items():
-            # Extract book name from reference
-            ref_parts = ref.split()
-            if len(ref_parts) > 1 and not ref_parts[1][0].isdigit():
-                ref_book = ref_parts[0] + ' ' + ref_parts[1]
-            else:
-                ref_book = ref_parts[0]
+        ids = self.verse_ids.get(translation, [])
+        keys = self.verse_keys.get(translation, [])
+        texts = self.verse_texts.get(translation, [])
+        for position, haystack in enumerate(haystacks if query_tokens else []):
+            ref_book = keys[position][0]
 
             # Apply testament filter
             if testament:
@@ -555,19 +2085,30 @@ class BibleReader:
                     continue
 
             # Apply book filter
-            if book and ref_book.lower() != book.lower():
+            if book_filter and ref_book.lower() != book_filter.lower():
                 continue
 
             # Apply keyword search
             if exact_phrase:
                 # Exact phrase matching
-                if keyword_lower in text.lower():
-                    results.append((ref, text))
+                if phrase in haystack:
+                    results.append((ids[position], texts[position], position))
             else:
                 # Word presence matching (all words must be present)
-                words = keyword_lower.split()
-                if all(word in text.lower() for word in words):
-                    results.append((ref, text))
+                if all(word in haystack for word in words):
+                    results.append((ids[position], texts[position], position))
+
+        centrality = self.get_verse_centrality() if rank else None
+        if centrality is not None:
+            graph_index = self.verse_index[self.graph_translation()]
+            pagerank = centrality['pagerank']
+
+            def score(result):
+                position = graph_index.get(keys[result[2]])
+                return pagerank[position] if position is not None else 0.0
+
+            results.sort(key=score, reverse=True)
+        results = [(ref, text) for ref, text, _ in results]
 
         if results:
             total_found = len(results)
@@ -587,6 +2128,10 @@ class BibleReader:
                 filter_parts.append("Exact phrase")
             else:
                 filter_parts.append("Contains words")
+            if stem:
+                filter_parts.append("Word stems")
+            if rank:
+                filter_parts.append("Ranked by centrality")
             filter_desc = ", ".join(filter_parts) if filter_parts else "No filters"
 
             search_line = f"{Colors.DIM_CYAN}Search Term:{Colors.RESET}   {Colors.ORANGE}'{keyword}'{Colors.RESET}"
@@ -605,25 +2150,16 @@ class BibleReader:
             print(make_border_line(showing_line))
             print(f"{make_border_bottom()}{Colors.RESET}\n")
 
+            # One automaton for all query terms, reused for every result
+            highlighter = TermHighlighter([keyword] if exact_phrase else keyword.split())
+            highlight_end = f"{Colors.RESET}{Colors.VERSE_TEXT}"
+
             for i, (ref, text) in enumerate(results[:limit], 1):
                 text_display = text.replace('# ', '')
-                # Highlight keyword
-                pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-
-                # Find the keyword and create highlighted version
-                matches = list(pattern.finditer(text_display))
-                if matches:
-                    highlighted_text = ""
-                    last_end = 0
-                    for match in matches:
-                        highlighted_text += text_display[last_end:match.start()]
-                        highlighted_text += f"{Colors.HIGHLIGHT}{match.group()}{Colors.RESET}{Colors.VERSE_TEXT}"
-                        last_end = match.end()
-                    highlighted_text += text_display[last_end:]
-                    text_display = highlighted_text
-
-                # Result entry with preview
+
+                # Result entry with preview (truncate before adding color codes)
                 preview = text_display[:75] + "..." if len(text_display) > 75 else text_display
+                preview = highlighter.highlight(preview, Colors.HIGHLIGHT, highlight_end)
                 print(f"  {Colors.BRIGHT_GREEN}[{i}]{Colors.RESET} {Colors.BRIGHT_GOLD}{ref}{Colors.RESET}")
                 print(f"      {Colors.DIM_CYAN}↳{Colors.RESET} {Colors.VERSE_TEXT}{preview}{Colors.RESET}\n")
 
@@ -644,21 +2180,80 @@ class BibleReader:
             print(make_border_line(msg2))
             print(f"{make_border_bottom()}{Colors.RESET}\n")
 
+    def display_passage(self, reference):
+        """Display a verse range or list of ranges with chapter headings"""
+        slices = self.resolve_passage(reference)
+        if not slices:
+            error_header = f"{Colors.BRIGHT_WHITE}ERROR{Colors.RESET}"
+            error_msg = f"{Colors.WHITE}Passage not found: {reference}{Colors.RESET}"
+            print(f"\n{Colors.BRIGHT_RED}{make_border_top()}")
+            print(make_border_line(error_header, align='center'))
+            print(f"╠{'═' * 78}╣")
+            print(make_border_line(error_msg))
+            print(f"{make_border_bottom()}{Colors.RESET}\n")
+            return
+
+        ids = self.verse_ids[self.current_translation]
+        keys = self.verse_keys[self.current_translation]
+        texts = self.verse_texts[self.current_translation]
+        verse_count = sum(end - start for _, start, end in slices)
+        trans_info = self.translation_info.get(self.current_translation, {})
+        trans_name = trans_info.get('name', self.current_translation)
+
+        header = f"{Colors.BRIGHT_GOLD}PASSAGE READING{Colors.RESET}"
+        labels = '; '.join(label for label, _, _ in slices)
+        if len(labels) > 60:
+            labels = labels[:57] + "..."
+        ref_line = f"{Colors.DIM_CYAN}Passage:{Colors.RESET}      {Colors.BRIGHT_WHITE}{labels}{Colors.RESET}"
+        trans_line = f"{Colors.DIM_CYAN}Translation:{Colors.RESET}  {Colors.PURPLE}{trans_name}{Colors.RESET}"
+        verses_line = f"{Colors.DIM_CYAN}Total Verses:{Colors.RESET} {Colors.LIME}{verse_count} verses{Colors.RESET}"
+
+        print(f"\n{Colors.BRIGHT_BLUE}{make_border_top()}")
+        print(make_border_line(header, align='center'))
+        print(f"╠{'═' * 78}╣")
+        print(make_border_line(ref_line))
+        print(make_border_line(trans_line))
+        print(make_border_line(verses_line))
+        print(f"{make_border_bottom()}{Colors.RESET}\n")
+
+        for label, start, end in slices:
+            current_chapter = None
+            for ref, key, text in zip(ids[start:end], keys[start:end], texts[start:end]):
+                if key[:2] != current_chapter:
+                    current_chapter = key[:2]
+                    print(f"\n  {Colors.BRIGHT_CYAN}── {key[0]} {key[1]} ──{Colors.RESET}")
+                for i, runs in enumerate(self.get_layout(ref, text)):
+                    line = render_layout_line(runs, Colors.VERSE_TEXT)
+                    if i == 0:
+                        print(f"{Colors.BRIGHT_GOLD}{key[2]:>4}.{Colors.RESET} {Colors.VERSE_TEXT}{line}{Colors.RESET}")
+                    else:
+                        print(f"      {Colors.VERSE_TEXT}{line}{Colors.RESET}")
+
+        print(f"\n{Colors.BRIGHT_BLUE}{'═' * 80}")
+        print(f"{Colors.GRAY}  📖 End of {'; '.join(label for label, _, _ in slices)} ({verse_count} verses)")
+        print(f"{'═' * 80}{Colors.RESET}\n")
+
     def display_chapter(self, book, chapter):
         """Display an entire chapter with beautiful formatting"""
         chapter_verses = []
-        pattern = f"{book} {chapter}:"
-
-        for ref, text in self.bible_data.items():
-            if ref.startswith(pattern):
-                chapter_verses.append((ref, text))
+        canonical = self.resolve_book_name(book)
+        span = None
+        if canonical and str(chapter).isdigit():
+            span = self.chapter_spans.get(self.current_translation, {}).get((canonical, int(chapter)))
+
+        if span:
+            # One slice read from the structural index
+            book = canonical
+            start, end = span
+            chapter_verses = list(zip(self.verse_ids[self.current_translation][start:end],
+                                      self.verse_texts[self.current_translation][start:end]))
 
         if chapter_verses:
             # Track current chapter for next/prev navigation
             self.current_chapter_ref = f"{book} {chapter}"
             # Calculate stats
             verse_count = len(chapter_verses)
-            total_words = sum(len(text.split()) for _, text in chapter_verses)
+            total_words = sum(len(tokens) for tokens in self.get_tokens()[start:end])
             avg_words = total_words // verse_count if verse_count > 0 else 0
 
             # Get translation info
@@ -691,16 +2286,25 @@ class BibleReader:
 
             for ref, text in chapter_verses:
                 verse_num = ref.split(':')[-1]
-                formatted_text = self.format_verse_text(text)
 
                 if text.startswith('# '):
                     print()
 
-                print(f"{Colors.BRIGHT_GOLD}{verse_num:>4}.{Colors.RESET} {Colors.VERSE_TEXT}{formatted_text}{Colors.RESET}")
+                # Hanging indent: continuation lines line up under the verse text
+                layout = self.get_layout(ref, text)
+                for i, runs in enumerate(layout):
+                    line = render_layout_line(runs, Colors.VERSE_TEXT)
+                    if i == 0:
+                        print(f"{Colors.BRIGHT_GOLD}{verse_num:>4}.{Colors.RESET} {Colors.VERSE_TEXT}{line}{Colors.RESET}")
+                    else:
+                        print(f"      {Colors.VERSE_TEXT}{line}{Colors.RESET}")
 
             print(f"\n{Colors.BRIGHT_BLUE}{'═' * 80}")
             print(f"{Colors.GRAY}  📖 End of {book} {chapter} ({verse_count} verses)")
             print(f"{'═' * 80}{Colors.RESET}\n")
+
+            # Prepare the previous/next chapters while this one is read
+            self.prefetch_neighbours(book, int(chapter))
         else:
             error_header = f"{Colors.BRIGHT_WHITE}ERROR{Colors.RESET}"
             error_msg = f"{Colors.WHITE}Chapter not found: {book} {chapter}{Colors.RESET}"
@@ -752,17 +2356,26 @@ class BibleReader:
         """Display comprehensive Bible statistics dashboard"""
         # Calculate stats
         total_verses = len(self.bible_data)
-        total_books = len(set(ref.split()[0] + (' ' + ref.split()[1] if ref.split()[1].isdigit() == False and len(ref.split()) > 2 else '') for ref in self.bible_data.keys()))
-        total_chapters = len(set(' '.join(ref.split()[:2]) if ':' in ref.split()[1] else ref.split()[0] + ' ' + ref.split()[1] for ref in self.bible_data.keys()))
         total_cross_refs = sum(len(refs) for refs in self.cross_refs.values())
         verses_with_refs = len([v for v in self.cross_refs if len(self.cross_refs[v]) > 0])
 
-        # Calculate word stats
-        total_words = sum(len(text.split()) for text in self.bible_data.values())
+        # Calculate word stats (from the precomputed frequency index)
+        unigrams = self.get_ngram_index()[1]
+        total_words = unigrams.total
         avg_words_per_verse = total_words // total_verses if total_verses > 0 else 0
 
-        # Most referenced verses
-        most_ref_verses = sorted(self.cross_refs.items(), key=lambda x: len(x[1]), reverse=True)[:10]
+        # Most central verses (precomputed PageRank), falling back to outgoing list length
+        centrality = self.get_verse_centrality()
+        if centrality is not None:
+            graph_keys = self.verse_keys[self.graph_translation()]
+            top = np.argsort(-centrality['pagerank'], kind='stable')[:10]
+            most_ref_verses = [(format_range(graph_keys[i], graph_keys[i]),
+                                f"PageRank {centrality['pagerank'][i] * len(graph_keys):.1f}, "
+                                f"{centrality['in_degree'][i]} in / {centrality['out_degree'][i]} out")
+                               for i in top]
+        else:
+            most_ref_verses = [(ref, f"{len(refs_list)} refs") for ref, refs_list in
+                               sorted(self.cross_refs.items(), key=lambda x: len(x[1]), reverse=True)[:10]]
 
         # Translation info
         trans_info = self.translation_info.get(self.current_translation, {})
@@ -785,6 +2398,7 @@ class BibleReader:
         print(make_border_line(f"{Colors.DIM_CYAN}Total Verses:{Colors.RESET}        {Colors.BRIGHT_GOLD}{total_verses:,} verses{Colors.RESET}"))
         print(make_border_line(f"{Colors.DIM_CYAN}Total Words:{Colors.RESET}         {Colors.BRIGHT_WHITE}{total_words:,} words{Colors.RESET}"))
         print(make_border_line(f"{Colors.DIM_CYAN}Avg Words/Verse:{Colors.RESET}    {Colors.ORANGE}~{avg_words_per_verse} words{Colors.RESET}"))
+        print(make_border_line(f"{Colors.DIM_CYAN}Unique Words:{Colors.RESET}        {Colors.PINK}{len(unigrams.ngrams):,} words{Colors.RESET}"))
         print(f"{make_border_bottom()}{Colors.RESET}\n")
 
         # Cross-Reference Stats
@@ -798,25 +2412,207 @@ class BibleReader:
         print(f"{make_border_bottom()}{Colors.RESET}\n")
 
         # Top Referenced Verses
-        top_header = f"{Colors.BRIGHT_WHITE}⭐ TOP 10 MOST REFERENCED VERSES{Colors.RESET}"
+        top_title = "TOP 10 MOST CENTRAL VERSES (PageRank)" if centrality is not None else "TOP 10 MOST REFERENCED VERSES"
+        top_header = f"{Colors.BRIGHT_WHITE}⭐ {top_title}{Colors.RESET}"
         print(f"{Colors.BRIGHT_BLUE}{make_border_top()}")
         print(make_border_line(top_header))
         print(f"{make_border_bottom()}{Colors.RESET}\n")
 
-        for i, (ref, refs_list) in enumerate(most_ref_verses, 1):
-            ref_count = len(refs_list)
+        for i, (ref, detail) in enumerate(most_ref_verses, 1):
             verse_text = self.get_verse(ref)
             if verse_text:
                 preview = verse_text[:50] + "..." if len(verse_text) > 50 else verse_text
-                preview = preview.replace('# ', '')
-                preview = re.sub(r'\[([^\]]+)\]', r'\1', preview)
-                print(f"  {Colors.BRIGHT_BLUE}{i:2}.{Colors.RESET} {Colors.BRIGHT_GOLD}{ref:20}{Colors.RESET} {Colors.GRAY}({ref_count} refs){Colors.RESET}")
+                preview = normalize_text(preview)
+                print(f"  {Colors.BRIGHT_BLUE}{i:2}.{Colors.RESET} {Colors.BRIGHT_GOLD}{ref:20}{Colors.RESET} {Colors.GRAY}({detail}){Colors.RESET}")
                 print(f"      {Colors.DIM_CYAN}↳{Colors.RESET} {Colors.WHITE}{preview}{Colors.RESET}\n")
 
         print(f"{Colors.BRIGHT_CYAN}{'═' * 80}")
         print(f"{Colors.GRAY}  💡 Type 'books' to see all books, 'history' to see recent verses{Colors.RESET}")
         print(f"{'═' * 80}{Colors.RESET}\n")
 
+    def show_frequency(self, phrase):
+        """Show how often a word or phrase (up to 3 words) occurs, with per-book breakdown"""
+        tokens = tokenize(phrase)
+        if not tokens or len(tokens) > 3:
+            print(f"\n{Colors.ERROR}✗ Please provide a word or a phrase of up to 3 words (e.g., 'freq grace'){Colors.RESET}\n")
+            return
+
+        table = self.get_ngram_index()[len(tokens)]
+        ngram = tokens[0] if len(tokens) == 1 else ' '.join(tokens)
+        count = table.count(ngram)
+        trans_name = self.translation_info.get(self.current_translation, {}).get('name', self.current_translation)
+
+        header = f"{Colors.BRIGHT_GOLD}WORD FREQUENCY{Colors.RESET}"
+        term_line = f"{Colors.DIM_CYAN}Term:{Colors.RESET}          {Colors.ORANGE}'{ngram}'{Colors.RESET}"
+        trans_line = f"{Colors.DIM_CYAN}Translation:{Colors.RESET}   {Colors.PURPLE}{trans_name}{Colors.RESET}"
+        count_line = f"{Colors.DIM_CYAN}Occurrences:{Colors.RESET}   {Colors.LIME}{count:,}{Colors.RESET}"
+
+        print(f"\n{Colors.BRIGHT_GREEN}{make_border_top()}")
+        print(make_border_line(header, align='center'))
+        print(f"╠{'═' * 78}╣")
+        print(make_border_line(term_line))
+        print(make_border_line(trans_line))
+        print(make_border_line(count_line))
+        if count:
+            per_million = count * 1_000_000 / table.total if table.total else 0
+            rank_line = f"{Colors.DIM_CYAN}Rank:{Colors.RESET}          {Colors.PINK}#{table.rank(ngram):,} of {len(table.ngrams):,}{Colors.RESET} {Colors.GRAY}({per_million:,.1f} per million){Colors.RESET}"
+            print(make_border_line(rank_line))
+        print(f"{make_border_bottom()}{Colors.RESET}\n")
+
+        if not count:
+            return
+
+        breakdown = sorted(table.book_breakdown(ngram), key=lambda item: item[1], reverse=True)
+        peak = breakdown[0][1]
+        print(f"  {Colors.BRIGHT_WHITE}Top books:{Colors.RESET}\n")
+        for book_idx, book_count in breakdown[:10]:
+            bar = '█' * max(1, book_count * 40 // peak)
+            print(f"  {Colors.BRIGHT_GOLD}{self.book_order[book_idx]:18}{Colors.RESET} {Colors.LIME}{bar}{Colors.RESET} {Colors.GRAY}{book_count:,}{Colors.RESET}")
+        if len(breakdown) > 10:
+            print(f"\n{Colors.GRAY}  ...found in {len(breakdown)} books{Colors.RESET}")
+        print()
+
+    def show_top_phrases(self, n=None, limit=15, book=None):
+        """Show the most frequent bigrams and/or trigrams, optionally within one book"""
+        book_idx = None
+        if book:
+            canonical = self.resolve_book_name(book)
+            if canonical not in self.book_order:
+                print(f"\n{Colors.ERROR}✗ Book not found: {book}{Colors.RESET}\n")
+                return
+            book_idx = self.book_order.index(canonical)
+            book = canonical
+
+        index = self.get_ngram_index()
+        for size in ([n] if n else [2, 3]):
+            label = {1: 'WORDS', 2: 'TWO-WORD PHRASES', 3: 'THREE-WORD PHRASES'}[size]
+            header = f"{Colors.BRIGHT_GOLD}TOP {limit} {label}{Colors.RESET}" + (f" {Colors.GRAY}({book}){Colors.RESET}" if book else "")
+            print(f"\n{Colors.BRIGHT_CYAN}{make_border_top()}")
+            print(make_border_line(header, align='center'))
+            print(f"{make_border_bottom()}{Colors.RESET}\n")
+            for i, (ngram, count) in enumerate(index[size].top(limit, book_idx), 1):
+                print(f"  {Colors.BRIGHT_CYAN}{i:2}.{Colors.RESET} {Colors.BRIGHT_WHITE}{ngram:32}{Colors.RESET} {Colors.GRAY}{count:,}{Colors.RESET}")
+        print()
+
+    def show_similar_verses(self, reference, limit=10):
+        """Show the verses most textually similar to a verse (TF-IDF cosine)"""
+        if np is None:
+            print(f"\n{Colors.ERROR}✗ Similar verses requires NumPy (pip install numpy){Colors.RESET}\n")
+            return
+
+        position = self.find_position(reference)
+        if position is None:
+            print(f"\n{Colors.ERROR}✗ Verse not found: {reference}{Colors.RESET}\n")
+            return
+
+        ids = self.verse_ids[self.current_translation]
+        texts = self.verse_texts[self.current_translation]
+        similar = self.find_similar_verses(position, k=limit)
+
+        header = f"{Colors.BRIGHT_GOLD}SIMILAR VERSES{Colors.RESET}"
+        ref_line = f"{Colors.DIM_CYAN}Reference:{Colors.RESET}    {Colors.BRIGHT_WHITE}{ids[position]}{Colors.RESET}"
+        method_line = f"{Colors.DIM_CYAN}Method:{Colors.RESET}       {Colors.ORANGE}TF-IDF cosine similarity ({self.current_translation}){Colors.RESET}"
+
+        print(f"\n{Colors.BRIGHT_MAGENTA}{make_border_top()}")
+        print(make_border_line(header, align='center'))
+        print(f"╠{'═' * 78}╣")
+        print(make_border_line(ref_line))
+        print(make_border_line(method_line))
+        print(f"{make_border_bottom()}{Colors.RESET}\n")
+
+        if not similar:
+            print(f"  {Colors.GRAY}No similar verses found{Colors.RESET}\n")
+            return
+
+        for i, (other, score) in enumerate(similar, 1):
+            preview = normalize_text(texts[other])
+            preview = preview[:65] + "..." if len(preview) > 65 else preview
+            print(f"  {Colors.BRIGHT_MAGENTA}[{i}]{Colors.RESET} {Colors.BRIGHT_GOLD}{ids[other]}{Colors.RESET} {Colors.GRAY}({score:.0%} similar){Colors.RESET}")
+            print(f"      {Colors.DIM_CYAN}↳{Colors.RESET} {Colors.WHITE}{preview}{Colors.RESET}\n")
+
+    def show_parallels(self, reference=None, limit=15):
+        """Show near-identical passages for a verse, or the longest parallels in the Bible"""
+        if np is None:
+            print(f"\n{Colors.ERROR}✗ Parallel passages requires NumPy (pip install numpy){Colors.RESET}\n")
+            return
+
+        position = None
+        if reference:
+            position = self.find_position(reference)
+            if position is None:
+                print(f"\n{Colors.ERROR}✗ Verse not found: {reference}{Colors.RESET}\n")
+                return
+
+        ids = self.verse_ids[self.current_translation]
+        keys = self.verse_keys[self.current_translation]
+        texts = self.verse_texts[self.current_translation]
+        runs = self.parallel_runs(self.get_parallels(PARALLEL_WINDOW))
+        if position is None:
+            runs.sort(key=lambda run: (-run[2], run[0]))
+        else:
+            runs = [run for run in runs
+                    if run[0] <= position < run[0] + run[2] or run[1] <= position < run[1] + run[2]]
+            runs.sort(key=lambda run: -run[3])
+
+        header = f"{Colors.BRIGHT_GOLD}PARALLEL PASSAGES{Colors.RESET}"
+        scope = ids[position] if position is not None else "Whole Bible (longest first)"
+        ref_line = f"{Colors.DIM_CYAN}Reference:{Colors.RESET}    {Colors.BRIGHT_WHITE}{scope}{Colors.RESET}"
+        method_line = f"{Colors.DIM_CYAN}Method:{Colors.RESET}       {Colors.ORANGE}MinHash / LSH over word shingles ({self.current_translation}){Colors.RESET}"
+
+        print(f"\n{Colors.BRIGHT_MAGENTA}{make_border_top()}")
+        print(make_border_line(header, align='center'))
+        print(f"╠{'═' * 78}╣")
+        print(make_border_line(ref_line))
+        print(make_border_line(method_line))
+        print(f"{make_border_bottom()}{Colors.RESET}\n")
+
+        for i, (first, second, length, score) in enumerate(runs[:limit], 1):
+            left = format_range(keys[first], keys[first + length - 1])
+            right = format_range(keys[second], keys[second + length - 1])
+            print(f"  {Colors.BRIGHT_MAGENTA}[{i}]{Colors.RESET} {Colors.BRIGHT_GOLD}{left}{Colors.RESET} {Colors.DIM_CYAN}≈{Colors.RESET} "
+                  f"{Colors.BRIGHT_GOLD}{right}{Colors.RESET} {Colors.GRAY}({length} verses, {score:.0%} match){Colors.RESET}")
+        if runs[:limit]:
+            print()
+
+        if position is None:
+            if len(runs) > limit:
+                print(f"  {Colors.GRAY}💡 {len(runs) - limit} more parallels - type 'parallels [ref]' to look up a verse{Colors.RESET}\n")
+            elif not runs:
+                print(f"  {Colors.GRAY}No parallel passages found{Colors.RESET}\n")
+            return
+
+        # Verse-level near duplicates, whether or not the surrounding passage matches
+        verses = self.get_parallels(1)
+        first, second = verses['pair_first'], verses['pair_second']
+        partners = [(int(other), float(score)) for mine, others in ((first, second), (second, first))
+                    for other, score in zip(others[mine == position], verses['pair_similarity'][mine == position])]
+        partners.sort(key=lambda partner: -partner[1])
+
+        if not partners and not runs:
+            print(f"  {Colors.GRAY}No parallel passages found{Colors.RESET}\n")
+            return
+
+        for i, (other, score) in enumerate(partners[:limit], 1):
+            preview = normalize_text(texts[other])
+            preview = preview[:65] + "..." if len(preview) > 65 else preview
+            print(f"  {Colors.BRIGHT_CYAN}≈{Colors.RESET} {Colors.BRIGHT_GOLD}{ids[other]}{Colors.RESET} {Colors.GRAY}({score:.0%} match){Colors.RESET}")
+            print(f"      {Colors.DIM_CYAN}↳{Colors.RESET} {Colors.WHITE}{preview}{Colors.RESET}\n")
+
+        # Whole clusters, including members linked only through another member; a lone pair is shown above
+        for label, parallels in (('Verse group', verses), ('Passage group', self.get_parallels(PARALLEL_WINDOW))):
+            window = int(parallels['window'])
+            group = self.parallel_cluster(parallels, position)
+            if len(group) <= 2:
+                continue
+            print(f"  {Colors.BRIGHT_MAGENTA}{label}{Colors.RESET} {Colors.GRAY}({len(group)} passages){Colors.RESET}")
+            for start in group[:limit]:
+                name = format_range(keys[start], keys[start + window - 1])
+                color = Colors.BRIGHT_WHITE if start == position else Colors.BRIGHT_GOLD
+                print(f"    {Colors.DIM_CYAN}•{Colors.RESET} {color}{name}{Colors.RESET}")
+            if len(group) > limit:
+                print(f"    {Colors.GRAY}... {len(group) - limit} more{Colors.RESET}")
+            print()
+
     def show_books_list(self):
         """Display list of all Bible books with chapter counts"""
         header = f"{Colors.BRIGHT_GOLD}BIBLE BOOKS INDEX{Colors.RESET}"
@@ -868,9 +2664,36 @@ class BibleReader:
         print(f"{'─' * 80}{Colors.RESET}\n")
 
     def compare_translations(self, reference):
-        """Show verse in all 4 translations side-by-side"""
+        """Show a verse in every installed translation, or a chapter side-by-side"""
+        alignment = self.get_alignment()
+        translations = alignment['translations']
+
+        # Trailing translation codes pick the columns: "compare John 3 KJV WEB"
+        words = reference.split()
+        chosen = []
+        while words and words[-1].upper() in translations:
+            chosen.insert(0, words.pop().upper())
+        reference = ' '.join(words)
+
+        match = PASSAGE_REF_RE.match(reference)
+        book = self.resolve_book_name(match.group('book')) if match and match.group('book') else None
+        if book and match.group('verse') is None:
+            self.compare_chapter(book, int(match.group('chapter')), chosen or None)
+            return
+
+        row = None
+        if book:
+            row = alignment['index'].get((book, int(match.group('chapter')), int(match.group('verse'))))
+        if row is None:
+            print(f"\n{Colors.ERROR}✗ Verse not found: {reference}{Colors.RESET}\n")
+            return
+
+        width = len(translations)
+        positions = alignment['offsets'][row * width:(row + 1) * width]
+        label = format_range(alignment['keys'][row], alignment['keys'][row])
+
         header = f"{Colors.BRIGHT_GOLD}TRANSLATION COMPARISON{Colors.RESET}"
-        ref_line = f"{Colors.DIM_CYAN}Reference:{Colors.RESET} {Colors.BRIGHT_WHITE}{reference}{Colors.RESET}"
+        ref_line = f"{Colors.DIM_CYAN}Reference:{Colors.RESET} {Colors.BRIGHT_WHITE}{label}{Colors.RESET}"
 
         print(f"\n{Colors.BRIGHT_CYAN}{make_border_top()}")
         print(make_border_line(header, align='center'))
@@ -878,8 +2701,9 @@ class BibleReader:
         print(make_border_line(ref_line))
         print(f"{make_border_bottom()}{Colors.RESET}\n")
 
-        for abbrev in ['KJV', 'ASV', 'WEB', 'YLT']:
-            verse = self.translations.get(abbrev, {}).get(reference)
+        for abbrev, position in zip(translations, positions):
+            if chosen and abbrev not in chosen:
+                continue
             info = self.translation_info.get(abbrev, {})
             name = info.get('name', abbrev)
 
@@ -888,29 +2712,156 @@ class BibleReader:
             print(make_border_line(trans_header))
             print(f"{make_border_bottom()}{Colors.RESET}")
 
-            if verse:
-                formatted = verse.replace('# ', '').replace('[', '').replace(']', '')
-                # Word wrap
-                words = formatted.split()
-                lines = []
-                current_line = ""
-                for word in words:
-                    if len(current_line + " " + word) <= 74:
-                        current_line = current_line + " " + word if current_line else word
-                    else:
-                        lines.append(current_line)
-                        current_line = word
-                if current_line:
-                    lines.append(current_line)
-
-                for line in lines:
-                    print(f"  {Colors.WHITE}{line}{Colors.RESET}")
+            if position >= 0:
+                # Word wrap (plain markup: brackets dropped)
+                verse_ref = self.verse_ids[abbrev][position]
+                verse = self.verse_texts[abbrev][position]
+                for runs in self.get_layout(verse_ref, verse, markup='plain', translation=abbrev):
+                    print(f"  {Colors.WHITE}{render_layout_line(runs, Colors.WHITE)}{Colors.RESET}")
             else:
                 print(f"  {Colors.GRAY}(Not available in this translation){Colors.RESET}")
             print()
 
         print(f"{Colors.GRAY}{'─' * 80}{Colors.RESET}\n")
 
+    def compare_chapter(self, book, chapter, translations=None):
+        """Show a whole chapter side-by-side, one column per translation"""
+        alignment = self.get_alignment()
+        span = alignment['chapters'].get((book, chapter))
+        if not span:
+            print(f"\n{Colors.ERROR}✗ Chapter not found: {book} {chapter}{Colors.RESET}\n")
+            return
+
+        all_translations = alignment['translations']
+        columns = [all_translations.index(abbrev) for abbrev in (translations or all_translations)]
+        # Verse number gutter (6) plus " │ " separators between columns, within 80 columns
+        column_width = (74 - 3 * (len(columns) - 1)) // len(columns)
+
+        header = f"{Colors.BRIGHT_GOLD}CHAPTER COMPARISON{Colors.RESET}"
+        ref_line = f"{Colors.DIM_CYAN}Chapter:{Colors.RESET}      {Colors.BRIGHT_WHITE}{book} {chapter}{Colors.RESET}"
+        trans_line = f"{Colors.DIM_CYAN}Translations:{Colors.RESET} {Colors.PURPLE}{', '.join(all_translations[c] for c in columns)}{Colors.RESET}"
+
+        print(f"\n{Colors.BRIGHT_CYAN}{make_border_top()}")
+        print(make_border_line(header, align='center'))
+        print(f"╠{'═' * 78}╣")
+        print(make_border_line(ref_line))
+        print(make_border_line(trans_line))
+        print(f"{make_border_bottom()}{Colors.RESET}\n")
+
+        separator = f" {Colors.GRAY}│{Colors.RESET} "
+        print("      " + separator.join(f"{Colors.BRIGHT_MAGENTA}{all_translations[c]:<{column_width}}{Colors.RESET}" for c in columns))
+        print(f"{Colors.GRAY}{'─' * 80}{Colors.RESET}")
+
+        width = len(all_translations)
+        offsets = alignment['offsets']
+        start, end = span
+        for row in range(start, end):
+            positions = offsets[row * width:(row + 1) * width]
+            layouts = []
+            for column in columns:
+                abbrev, position = all_translations[column], positions[column]
+                if position < 0:
+                    layouts.append(((('—', False),),))
+                    continue
+                layouts.append(self.get_layout(self.verse_ids[abbrev][position], self.verse_texts[abbrev][position],
+                                               width=column_width, markup='plain', translation=abbrev))
+
+            verse_num = alignment['keys'][row][2]
+            for i in range(max(len(layout) for layout in layouts)):
+                cells = []
+                for layout in layouts:
+                    runs = layout[i] if i < len(layout) else ()
+                    padding = ' ' * max(0, column_width - sum(len(segment) for segment, _ in runs))
+                    cells.append(f"{Colors.VERSE_TEXT}{render_layout_line(runs, Colors.VERSE_TEXT)}{padding}{Colors.RESET}")
+                gutter = f"{Colors.BRIGHT_GOLD}{verse_num:>4}.{Colors.RESET} " if i == 0 else "      "
+                print(gutter + separator.join(cells))
+
+        print(f"\n{Colors.BRIGHT_BLUE}{'═' * 80}")
+        print(f"{Colors.GRAY}  📖 End of {book} {chapter} ({end - start} verses)")
+        print(f"{'═' * 80}{Colors.RESET}\n")
+
+    def kwic_line(self, text, start, end, width=35):
+        """Cut a keyword-in-context line: left context, KEYWORD, right context"""
+        left = text[max(0, start - width):start]
+        if start > width and ' ' in left:
+            left = left[left.index(' ') + 1:]  # Don't start mid-word
+        right = text[end:end + width]
+        if end + width < len(text) and ' ' in right:
+            right = right[:right.rindex(' ')]
+        # Right context keeps its leading space/punctuation ("GRACE." / "GRACE be")
+        return f"{left.rstrip():>{width}} {text[start:end].upper()}{right.rstrip()}"
+
+    def write_concordance(self, filename, words=None, translation=None, width=35):
+        """Stream a concordance to a file, grouped by word then book
+
+        Uses the word index, so a whole-vocabulary concordance is one pass over
+        the index rather than a search per word. Returns (words, lines) written.
+        """
+        translation = translation or self.current_translation
+        index = self.build_word_index(translation)
+        ids = self.verse_ids[translation]
+        keys = self.verse_keys[translation]
+        texts = self.verse_texts[translation]
+        info = self.translation_info.get(translation, {})
+
+        if words is None:
+            words = sorted(index)
+        else:
+            words = [token for word in words for token in tokenize(word)]
+
+        normalized = {}  # position -> normalize_text(verse), shared across words
+        words_written = 0
+        lines_written = 0
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write("=" * 80 + "\n")
+            f.write(f"BIBLE CONCORDANCE - {translation} ({info.get('name', translation)})\n")
+            f.write("=" * 80 + "\n\n")
+
+            for word in words:
+                entry = index.get(word)
+                if not entry:
+                    continue
+                positions, starts, ends = entry
+                f.write(f"{word.upper()} ({len(positions):,} occurrences)\n")
+                current_book = None
+                for position, start, end in zip(positions, starts, ends):
+                    book = keys[position][0]
+                    if book != current_book:
+                        current_book = book
+                        f.write(f"  {book}\n")
+                    text = normalized.get(position)
+                    if text is None:
+                        text = normalized[position] = normalize_text(texts[position])
+                    f.write(f"    {ids[position]:<24}{self.kwic_line(text, start, end, width)}\n")
+                    lines_written += 1
+                f.write("\n")
+                words_written += 1
+
+            f.write("=" * 80 + "\n")
+            f.write(f"Total: {words_written:,} words, {lines_written:,} lines\n")
+
+        return words_written, lines_written
+
+    def export_concordance(self, word=None, filename=None):
+        """Export a concordance for one word (or the whole vocabulary) to a text file"""
+        from datetime import datetime
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            label = re.sub(r'\W+', '_', word.lower()) if word else 'all'
+            filename = f"bible_concordance_{label}_{timestamp}.txt"
+
+        try:
+            start_time = time.time()
+            words_written, lines_written = self.write_concordance(filename, words=[word] if word else None)
+            if not words_written:
+                print(f"\n{Colors.GRAY}No occurrences of '{word}' in {self.current_translation}{Colors.RESET}\n")
+                return
+            elapsed = time.time() - start_time
+            print(f"\n{Colors.SUCCESS}✓ Concordance exported to: {filename}{Colors.RESET}")
+            print(f"{Colors.GRAY}  {words_written:,} words, {lines_written:,} lines in {elapsed:.1f}s{Colors.RESET}\n")
+        except Exception as e:
+            print(f"\n{Colors.ERROR}✗ Error exporting concordance: {e}{Colors.RESET}\n")
+
     def show_history(self):
         """Show recently viewed verses"""
         if not self.history:
@@ -926,8 +2877,7 @@ class BibleReader:
             verse_text = self.get_verse(ref)
             if verse_text:
                 preview = verse_text[:60] + "..." if len(verse_text) > 60 else verse_text
-                preview = preview.replace('# ', '')
-                preview = re.sub(r'\[([^\]]+)\]', r'\1', preview)
+                preview = normalize_text(preview)
                 print(f"  {Colors.BRIGHT_CYAN}{i:2}.{Colors.RESET} {Colors.BRIGHT_GOLD}{ref:20}{Colors.RESET}")
                 print(f"      {Colors.DIM_CYAN}↳{Colors.RESET} {Colors.WHITE}{preview}{Colors.RESET}\n")
 
@@ -939,6 +2889,8 @@ class BibleReader:
         """Add verse to bookmarks"""
         if reference not in self.bookmarks:
             self.bookmarks.append(reference)
+            if self.store:
+                self.store.append('bookmarks', {'op': 'add', 'ref': reference, 'time': int(time.time())})
             print(f"\n{Colors.SUCCESS}✓ Bookmarked: {reference}{Colors.RESET}\n")
         else:
             print(f"\n{Colors.GRAY}Already bookmarked: {reference}{Colors.RESET}\n")
@@ -958,8 +2910,7 @@ class BibleReader:
             verse_text = self.get_verse(ref)
             if verse_text:
                 preview = verse_text[:60] + "..." if len(verse_text) > 60 else verse_text
-                preview = preview.replace('# ', '')
-                preview = re.sub(r'\[([^\]]+)\]', r'\1', preview)
+                preview = normalize_text(preview)
                 print(f"  {Colors.BRIGHT_MAGENTA}{i:2}.{Colors.RESET} {Colors.BRIGHT_GOLD}{ref:20}{Colors.RESET}")
                 print(f"      {Colors.DIM_CYAN}↳{Colors.RESET} {Colors.WHITE}{preview}{Colors.RESET}\n")
 
@@ -974,30 +2925,117 @@ class BibleReader:
         self.display_verse(random_ref)
 
     def add_to_history(self, reference):
-        """Add verse to history (max 50 entries)"""
+        """Add verse to history (max 50 entries in memory, every visit logged)"""
         if reference in self.history:
             self.history.remove(reference)
         self.history.append(reference)
-        if len(self.history) > 50:
+        if len(self.history) > HISTORY_LIMIT:
             self.history.pop(0)
+        if self.store:
+            self.store.append('history', {'ref': reference, 'time': int(time.time())})
+
+    def add_note(self, reference, text):
+        """Attach a note to a verse"""
+        position = self.find_position(reference)
+        if position is None:
+            print(f"\n{Colors.ERROR}✗ Verse not found: {reference}{Colors.RESET}\n")
+            return
+        reference = self.verse_ids[self.current_translation][position]
+        note = {'text': text, 'time': int(time.time())}
+        self.notes[reference].append(note)
+        if self.store:
+            self.store.append('notes', {'op': 'add', 'ref': reference, **note})
+        print(f"\n{Colors.SUCCESS}✓ Note added to {reference}{Colors.RESET}\n")
+
+    def clear_notes(self, reference):
+        """Remove every note on a verse"""
+        position = self.find_position(reference)
+        reference = self.verse_ids[self.current_translation][position] if position is not None else reference
+        removed = self.notes.pop(reference, [])
+        if not removed:
+            print(f"\n{Colors.GRAY}No notes on {reference}{Colors.RESET}\n")
+            return
+        if self.store:
+            self.store.append('notes', {'op': 'clear', 'ref': reference})
+            self.store.note_dead('notes', len(removed) + 1)
+            self.store.maybe_compact('notes', self.note_records())
+        print(f"\n{Colors.SUCCESS}✓ Cleared {len(removed)} note(s) from {reference}{Colors.RESET}\n")
+
+    def show_notes(self, reference=None):
+        """Show notes for one verse, or all notes"""
+        if reference:
+            position = self.find_position(reference)
+            reference = self.verse_ids[self.current_translation][position] if position is not None else reference
+            notes = [(reference, note) for note in self.notes.get(reference, [])]
+        else:
+            notes = [(ref, note) for ref, ref_notes in self.notes.items() for note in ref_notes]
 
-    def get_chapter_count(self, book):
-        """Get the number of chapters in a book"""
-        chapter_counts = {}
-        for ref in self.bible_data.keys():
-            ref_parts = ref.split()
-            if len(ref_parts) > 1 and not ref_parts[1][0].isdigit():
-                ref_book = ref_parts[0] + ' ' + ref_parts[1]
-                chapter_num = ref_parts[2].split(':')[0] if ':' in ref_parts[2] else ref_parts[2]
-            else:
-                ref_book = ref_parts[0]
-                chapter_num = ref_parts[1].split(':')[0] if ':' in ref_parts[1] else ref_parts[1]
+        if not notes:
+            print(f"\n{Colors.GRAY}No notes yet. Type 'note [reference] [text]' to add one!{Colors.RESET}\n")
+            return
 
-            if ref_book not in chapter_counts:
-                chapter_counts[ref_book] = set()
-            chapter_counts[ref_book].add(int(chapter_num))
+        header = f"{Colors.BRIGHT_GOLD}STUDY NOTES{Colors.RESET}"
+        print(f"\n{Colors.BRIGHT_CYAN}{make_border_top()}")
+        print(make_border_line(header, align='center'))
+        print(f"{make_border_bottom()}{Colors.RESET}\n")
 
-        return max(chapter_counts.get(book, [0]))
+        from datetime import datetime
+        for i, (ref, note) in enumerate(notes, 1):
+            stamp = datetime.fromtimestamp(note['time']).strftime('%Y-%m-%d')
+            print(f"  {Colors.BRIGHT_MAGENTA}{i:2}.{Colors.RESET} {Colors.BRIGHT_GOLD}{ref:20}{Colors.RESET} {Colors.GRAY}({stamp}){Colors.RESET}")
+            print(f"      {Colors.DIM_CYAN}↳{Colors.RESET} {Colors.WHITE}{note['text']}{Colors.RESET}\n")
+
+    def get_chapter_count(self, book):
+        """Get the number of chapters in a book"""
+        book = self.resolve_book_name(book) or book
+        spans = self.chapter_spans.get(self.current_translation, {})
+        return max((chapter for span_book, chapter in spans if span_book == book), default=0)
+
+    def neighbour_chapters(self, book, chapter, translation=None):
+        """(book, chapter) keys just before and after a chapter in canonical order"""
+        translation = translation or self.current_translation
+        span = self.chapter_spans.get(translation, {}).get((book, chapter))
+        if not span:
+            return []
+        keys = self.verse_keys[translation]
+        start, end = span
+        return [keys[position][:2] for position in (start - 1, end) if 0 <= position < len(keys)]
+
+    def prefetch_neighbours(self, book, chapter):
+        """Queue the chapters around the one being read for background preparation"""
+        if not self.prefetch_enabled:
+            return
+        self.prefetch_generation += 1
+        if self.prefetch_thread is None:
+            self.prefetch_thread = threading.Thread(target=self.prefetch_worker, name='chapter-prefetch', daemon=True)
+            self.prefetch_thread.start()
+        for neighbour in self.neighbour_chapters(book, chapter):
+            self.prefetch_queue.put((self.prefetch_generation, self.current_translation, neighbour))
+
+    def prefetch_worker(self):
+        """Worker thread: build layouts and cross-reference previews for queued chapters"""
+        while True:
+            generation, translation, (book, chapter) = self.prefetch_queue.get()
+            # The reader has moved on (or switched translation) since this was queued
+            if generation != self.prefetch_generation or translation != self.current_translation:
+                continue
+            try:
+                self.warm_chapter(translation, book, chapter)
+            except Exception:
+                pass  # Prefetching is best effort; display_chapter redoes any missing work
+
+    def warm_chapter(self, translation, book, chapter):
+        """Prepare everything display_chapter and display_verse need for one chapter"""
+        span = self.chapter_spans.get(translation, {}).get((book, chapter))
+        if not span:
+            return
+        start, end = span
+        self.get_tokens(translation)
+        ids, texts = self.verse_ids[translation], self.verse_texts[translation]
+        for position in range(start, end):
+            self.get_layout(ids[position], texts[position], translation=translation)
+            for ref in self.cross_refs.get(ids[position], [])[:5]:
+                self.get_ref_preview(ref['verse'], translation)
 
     def next_chapter(self):
         """Navigate to the next chapter"""
@@ -1091,7 +3129,7 @@ class BibleReader:
                 for i, ref in enumerate(self.bookmarks, 1):
                     verse_text = self.get_verse(ref)
                     if verse_text:
-                        clean_text = verse_text.replace('# ', '').replace('[', '').replace(']', '')
+                        clean_text = normalize_text(verse_text)
                         f.write(f"{i}. {ref}\n")
                         f.write(f"   {clean_text}\n\n")
 
@@ -1124,7 +3162,7 @@ class BibleReader:
                 for i, ref in enumerate(reversed(self.history[-50:]), 1):
                     verse_text = self.get_verse(ref)
                     if verse_text:
-                        clean_text = verse_text.replace('# ', '').replace('[', '').replace(']', '')
+                        clean_text = normalize_text(verse_text)
                         f.write(f"{i}. {ref}\n")
                         f.write(f"   {clean_text}\n\n")
 
@@ -1346,7 +3384,11 @@ class BibleReader:
         print(f"  Created by {Colors.CYAN}@Ringmast4r{Colors.RESET}\n")
 
         # Show daily verse
-        self.show_daily_verse()
+        with PROFILER.phase('daily verse'):
+            self.show_daily_verse()
+
+        # Tab completion for commands and references
+        self.setup_completion()
 
         while True:
             # Bright, colorful command menu (DEATH-STAR inspired)
@@ -1365,7 +3407,7 @@ class BibleReader:
 
             print(f"  {Colors.BRIGHT_GREEN}🔍 KEYWORD SEARCH{Colors.RESET}")
             print(f"     {Colors.DIM_CYAN}Basic search:{Colors.RESET}        {Colors.GRAY}Type keyword (e.g., {Colors.PINK}'love'{Colors.GRAY}, {Colors.PINK}'faith'{Colors.GRAY}){Colors.RESET}")
-            print(f"     {Colors.DIM_CYAN}Advanced search:{Colors.RESET}     {Colors.GRAY}{Colors.ORANGE}'search [term] --ot/--nt --book [name] --exact'{Colors.RESET}")
+            print(f"     {Colors.DIM_CYAN}Advanced search:{Colors.RESET}     {Colors.GRAY}{Colors.ORANGE}'search [term] --ot/--nt --book [name] --exact --stem --rank'{Colors.RESET}")
             print(f"     {Colors.DIM_CYAN}Examples:{Colors.RESET}            {Colors.GRAY}{Colors.ORANGE}'search faith --nt'{Colors.GRAY}, {Colors.ORANGE}'search love --book John'{Colors.RESET}\n")
 
             print(f"  {Colors.BRIGHT_MAGENTA}🌟 DAILY INSPIRATION{Colors.RESET}")
@@ -1374,17 +3416,23 @@ class BibleReader:
             print(f"  {Colors.PURPLE}🔄 BIBLE TRANSLATIONS{Colors.RESET}")
             print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'translations'{Colors.DIM_CYAN} to list all versions{Colors.RESET}")
             print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'translation XXX'{Colors.DIM_CYAN} to switch (e.g., {Colors.ORANGE}'translation ASV'{Colors.DIM_CYAN}){Colors.RESET}")
-            print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'compare [ref]'{Colors.DIM_CYAN} to see verse in all translations{Colors.RESET}\n")
+            print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'compare [ref]'{Colors.DIM_CYAN} to see verse in all translations{Colors.RESET}")
+            print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'compare John 3 KJV WEB'{Colors.DIM_CYAN} to read a chapter side-by-side{Colors.RESET}")
+            print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'similar [ref]'{Colors.DIM_CYAN} to find verses with similar wording{Colors.RESET}")
+            print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'parallels [ref]'{Colors.DIM_CYAN} for near-identical passages (Kings/Chronicles, Psalms 14/53){Colors.RESET}\n")
 
             print(f"  {Colors.BRIGHT_BLUE}📊 STATISTICS & INFO{Colors.RESET}")
             print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'stats'{Colors.DIM_CYAN} for Bible statistics dashboard{Colors.RESET}")
-            print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'books'{Colors.DIM_CYAN} to see list of all 66 books{Colors.RESET}\n")
+            print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'books'{Colors.DIM_CYAN} to see list of all 66 books{Colors.RESET}")
+            print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'freq [word]'{Colors.DIM_CYAN} for word frequency or {Colors.ORANGE}'phrases [2|3] [--book name]'{Colors.DIM_CYAN} for top phrases{Colors.RESET}\n")
 
             print(f"  {Colors.LIME}📌 HISTORY & BOOKMARKS{Colors.RESET}")
             print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'history'{Colors.DIM_CYAN} to see recently viewed verses{Colors.RESET}")
             print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'bookmark [ref]'{Colors.DIM_CYAN} to save a favorite verse{Colors.RESET}")
             print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'bookmarks'{Colors.DIM_CYAN} to view all saved bookmarks{Colors.RESET}")
-            print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'export bookmarks'{Colors.DIM_CYAN} or {Colors.ORANGE}'export history'{Colors.DIM_CYAN} to save to file{Colors.RESET}\n")
+            print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'note [ref] [text]'{Colors.DIM_CYAN} to add a study note, {Colors.ORANGE}'notes'{Colors.DIM_CYAN} to list them{Colors.RESET}")
+            print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'export bookmarks'{Colors.DIM_CYAN} or {Colors.ORANGE}'export history'{Colors.DIM_CYAN} to save to file{Colors.RESET}")
+            print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'concordance [word]'{Colors.DIM_CYAN} or {Colors.ORANGE}'concordance all'{Colors.DIM_CYAN} to export keyword-in-context lines{Colors.RESET}\n")
 
             print(f"  {Colors.BRIGHT_GOLD}🎨 THEME TOGGLE{Colors.RESET}")
             print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'t'{Colors.DIM_CYAN} to cycle through color themes{Colors.RESET}\n")
@@ -1393,7 +3441,8 @@ class BibleReader:
             print(f"     {Colors.DIM_CYAN}Type {Colors.ORANGE}'quit'{Colors.DIM_CYAN} or {Colors.ORANGE}'exit'{Colors.DIM_CYAN} to close{Colors.RESET}\n")
 
             print(f"{Colors.BRIGHT_GOLD}{'═' * 80}{Colors.RESET}")
-            choice = input(f"\n{Colors.BRIGHT_CYAN}⊳ Enter your choice:{Colors.RESET} ").strip()
+            print()
+            choice = input(readline_prompt(f"{Colors.BRIGHT_CYAN}⊳ Enter your choice:{Colors.RESET} ")).strip()
 
             if not choice:
                 continue
@@ -1406,6 +3455,9 @@ class BibleReader:
                 print(f"{make_border_bottom()}{Colors.RESET}\n")
                 break
 
+            # Time every command when profiling (closed after the dispatch below)
+            command_event = PROFILER.begin(choice, kind='command')
+
             # Theme toggle
             if choice.lower() == 't':
                 self.cycle_theme()
@@ -1434,6 +3486,21 @@ class BibleReader:
             elif choice.lower() == 'books':
                 self.show_books_list()
 
+            # Word / phrase frequency
+            elif choice.lower().startswith('freq '):
+                self.show_frequency(choice[5:].strip())
+
+            # Top phrases report
+            elif choice.lower() == 'phrases' or choice.lower().startswith('phrases '):
+                args = choice[7:].strip()
+                book = None
+                book_match = re.search(r'--book\s+(.+)$', args, re.IGNORECASE)
+                if book_match:
+                    book = book_match.group(1).strip()
+                    args = args[:book_match.start()].strip()
+                size = int(args) if args in ('1', '2', '3') else None
+                self.show_top_phrases(size, book=book)
+
             # Compare translations
             elif choice.lower().startswith('compare '):
                 reference = choice[8:].strip()
@@ -1442,6 +3509,18 @@ class BibleReader:
                 else:
                     print(f"\n{Colors.ERROR}✗ Please provide a verse reference (e.g., 'compare John 3:16'){Colors.RESET}\n")
 
+            # Similar verses
+            elif choice.lower().startswith('similar '):
+                reference = choice[8:].strip()
+                if reference:
+                    self.show_similar_verses(reference)
+                else:
+                    print(f"\n{Colors.ERROR}✗ Please provide a verse reference (e.g., 'similar John 3:16'){Colors.RESET}\n")
+
+            # Parallel passages
+            elif choice.lower() == 'parallels' or choice.lower().startswith('parallels '):
+                self.show_parallels(choice[10:].strip() or None)
+
             # History
             elif choice.lower() == 'history':
                 self.show_history()
@@ -1458,6 +3537,20 @@ class BibleReader:
             elif choice.lower() == 'bookmarks':
                 self.show_bookmarks()
 
+            # Show notes (all, or for one verse)
+            elif choice.lower() == 'notes' or choice.lower().startswith('notes '):
+                self.show_notes(choice[6:].strip() or None)
+
+            # Add or clear a note: "note John 3:16 text" / "note John 3:16 --clear"
+            elif choice.lower().startswith('note '):
+                note_match = re.match(r'^(.*?\d+:\d+)\s*(.*)$', choice[5:].strip())
+                if note_match and note_match.group(2).strip().lower() == '--clear':
+                    self.clear_notes(note_match.group(1))
+                elif note_match and note_match.group(2).strip():
+                    self.add_note(note_match.group(1), note_match.group(2).strip())
+                else:
+                    print(f"\n{Colors.ERROR}✗ Please provide a verse and a note (e.g., 'note John 3:16 God's love for the world'){Colors.RESET}\n")
+
             # Random verse
             elif choice.lower() == 'random':
                 self.show_random_verse()
@@ -1480,6 +3573,16 @@ class BibleReader:
                 else:
                     print(f"\n{Colors.ERROR}✗ Unknown export type. Use 'export bookmarks' or 'export history'{Colors.RESET}\n")
 
+            # Concordance export
+            elif choice.lower().startswith('concordance'):
+                word = choice[11:].strip()
+                if word.lower() == 'all':
+                    self.export_concordance()
+                elif word:
+                    self.export_concordance(word)
+                else:
+                    print(f"\n{Colors.ERROR}✗ Please provide a word or 'all' (e.g., 'concordance grace'){Colors.RESET}\n")
+
             # Advanced search with filters
             elif choice.lower().startswith('search '):
                 # Parse search command with filters
@@ -1500,6 +3603,16 @@ class BibleReader:
                     exact_phrase = True
                     search_input = re.sub(r'--exact', '', search_input, flags=re.IGNORECASE).strip()
 
+                stem = False
+                if '--stem' in search_input.lower():
+                    stem = True
+                    search_input = re.sub(r'--stem', '', search_input, flags=re.IGNORECASE).strip()
+
+                rank = False
+                if '--rank' in search_input.lower():
+                    rank = True
+                    search_input = re.sub(r'--rank', '', search_input, flags=re.IGNORECASE).strip()
+
                 # Check for --book filter
                 book_match = re.search(r'--book\s+([A-Za-z0-9 ]+?)(?:\s+--|$)', search_input, re.IGNORECASE)
                 if book_match:
@@ -1507,16 +3620,21 @@ class BibleReader:
                     search_input = re.sub(r'--book\s+[A-Za-z0-9 ]+', '', search_input, flags=re.IGNORECASE).strip()
 
                 if search_input:
-                    self.search_keyword(search_input, testament=testament, book=book, exact_phrase=exact_phrase)
+                    self.search_keyword(search_input, testament=testament, book=book, exact_phrase=exact_phrase, stem=stem, rank=rank)
                 else:
                     print(f"\n{Colors.ERROR}✗ Please provide a search term{Colors.RESET}\n")
 
+            # Passage references (ranges and semicolon-separated lists)
+            elif ('-' in choice or ';' in choice) and re.search(r'\d', choice) and self.resolve_passage(choice):
+                self.display_passage(choice)
+
             # Check if it's a verse reference (contains a colon)
             elif ':' in choice:
                 self.display_verse(choice)
 
             # Check if it's a chapter reference
-            elif re.match(r'^[A-Za-z]+ \d+$', choice) or re.match(r'^\d? ?[A-Za-z]+ \d+$', choice):
+            elif re.match(r'^\d? ?[A-Za-z]+ \d+$', choice) or (
+                    re.match(r'^(\d ?)?[A-Za-z][A-Za-z ]* \d+$', choice) and self.resolve_book_name(choice.rsplit(' ', 1)[0])):
                 parts = choice.rsplit(' ', 1)
                 if len(parts) == 2:
                     book, chapter = parts
@@ -1526,11 +3644,16 @@ class BibleReader:
             else:
                 self.search_keyword(choice)
 
+            PROFILER.end(command_event)
+
 if __name__ == "__main__":
     try:
-        reader = BibleReader()
+        with PROFILER.phase('startup'):
+            reader = BibleReader()
         reader.main_menu()
     except KeyboardInterrupt:
         print(f"\n\n{Colors.GOLD}May God bless you! Goodbye.{Colors.RESET}\n")
     except Exception as e:
         print(f"\n{Colors.ERROR}An error occurred: {e}{Colors.RESET}\n")
+    finally:
+        PROFILER.report()
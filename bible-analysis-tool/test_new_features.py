@@ -114,6 +114,120 @@ try:
 except AssertionError as e:
     print(f"   ✗ {e}")
 
+# The checks below build their own data, so they run without the Bible files
+import tempfile
+from bible_reader import ReaderStore, HISTORY_LIMIT, STORE_COMPACT_MIN
+
+# Test the append-only store
+print("\n11. Testing ReaderStore append and read_recent...")
+try:
+    with tempfile.TemporaryDirectory() as directory:
+        store = ReaderStore(directory)
+        for ref in ["John 3:16", "Psalms 23:1", "John 3:16", "Romans 8:28", "Psalms 23:1"]:
+            assert store.append('history', {'ref': ref, 'time': 0}), "append failed"
+        recent = [record['ref'] for record in store.read_recent('history', 10)]
+        assert recent == ["John 3:16", "Romans 8:28", "Psalms 23:1"], f"Unexpected order: {recent}"
+        recent = [record['ref'] for record in store.read_recent('history', 2)]
+        assert recent == ["Romans 8:28", "Psalms 23:1"], f"Unexpected limited tail: {recent}"
+        assert len(store.read('history')) == 5, "Every visit should stay in the log"
+    print("   ✓ Records come back oldest first, latest visit per verse, limited to the tail")
+except AssertionError as e:
+    print(f"   ✗ {e}")
+
+# Test that history survives a restart without being truncated
+print("\n12. Testing history across restarts...")
+saved_store, saved_history = reader.store, reader.history
+try:
+    with tempfile.TemporaryDirectory() as directory:
+        reader.store, reader.history = ReaderStore(directory), []
+        visits = [f"Psalms 119:{verse}" for verse in range(1, HISTORY_LIMIT * 3 + 11)]
+        for ref in visits:
+            reader.add_to_history(ref)
+
+        reader.store, reader.history = ReaderStore(directory), []
+        reader.load_store()
+        assert reader.history == visits[-HISTORY_LIMIT:], "Recent history not restored after restart"
+        logged = [record['ref'] for record in reader.store.read('history')]
+        assert logged == visits, f"History log lost visits ({len(logged)} of {len(visits)} kept)"
+    print(f"   ✓ {len(visits)} visits kept on disk, last {HISTORY_LIMIT} restored")
+except AssertionError as e:
+    print(f"   ✗ {e}")
+finally:
+    reader.store, reader.history = saved_store, saved_history
+
+# Test bookmark and note replay after compaction
+print("\n13. Testing bookmark and note logs after compaction...")
+saved = reader.store, reader.bookmarks, reader.notes
+try:
+    with tempfile.TemporaryDirectory() as directory:
+        store = ReaderStore(directory)
+        for i in range(STORE_COMPACT_MIN + 10):
+            store.append('bookmarks', {'op': 'add', 'ref': "John 3:16", 'time': i})
+            store.append('notes', {'op': 'add', 'ref': "John 3:16", 'text': f"draft {i}", 'time': i})
+            store.append('notes', {'op': 'clear', 'ref': "John 3:16"})
+        store.append('bookmarks', {'op': 'add', 'ref': "Romans 8:28", 'time': 1})
+        store.append('bookmarks', {'op': 'remove', 'ref': "Romans 8:28", 'time': 2})
+        store.append('bookmarks', {'op': 'add', 'ref': "Psalms 23:1", 'time': 3})
+        store.append('notes', {'op': 'add', 'ref': "Psalms 23:1", 'text': "kept", 'time': 4})
+
+        for restart in range(2):
+            reader.store = ReaderStore(directory)
+            reader.load_store()
+            assert reader.bookmarks == ["John 3:16", "Psalms 23:1"], f"Bookmarks after restart {restart}: {reader.bookmarks}"
+            assert dict(reader.notes) == {"Psalms 23:1": [{'text': "kept", 'time': 4}]}, \
+                f"Notes after restart {restart}: {dict(reader.notes)}"
+        assert len(reader.store.read('bookmarks')) == 2, "Bookmark log was not compacted"
+        assert len(reader.store.read('notes')) == 1, "Notes log was not compacted"
+    print("   ✓ Logs compacted to their live records and replay the same after restart")
+except AssertionError as e:
+    print(f"   ✗ {e}")
+finally:
+    reader.store, reader.bookmarks, reader.notes = saved
+
+# Test passage resolution against a small synthetic translation
+print("\n14. Testing resolve_passage() and convert_ref_format()...")
+try:
+    reader.translations['TEST'] = {
+        **{f"Genesis {c}:{v}": "text" for c in (1, 2) for v in range(1, 8)},
+        **{f"Matthew {c}:{v}": "text" for c in (5, 6, 7) for v in range(1, 30)},
+    }
+    reader.build_structural_index('TEST')
+    ids = reader.verse_ids['TEST']
+
+    slices = reader.resolve_passage("Matt 5:3-7:29", 'TEST')
+    assert slices and len(slices) == 1, f"Expected one slice, got {slices}"
+    _, start, end = slices[0]
+    assert (ids[start], ids[end - 1]) == ("Matthew 5:3", "Matthew 7:29"), f"Wrong range {ids[start]}-{ids[end - 1]}"
+
+    slices = reader.resolve_passage("Gen 1:1-3; 2:4", 'TEST')
+    got = [ids[start:end] for _, start, end in slices or []]
+    assert got == [["Genesis 1:1", "Genesis 1:2", "Genesis 1:3"], ["Genesis 2:4"]], f"Unexpected slices {got}"
+
+    assert reader.resolve_passage("Gen 1:5-2", 'TEST') is None, "Reversed range should not resolve"
+    converted = reader.convert_ref_format('Ps.23.1-Ps.23.2')
+    assert converted == "Psalms 23:1-2", f"Got {converted}"
+    print("   ✓ Multi-chapter, semicolon and reversed ranges resolve as expected")
+except AssertionError as e:
+    print(f"   ✗ {e}")
+finally:
+    for table in (reader.translations, reader.verse_ids, reader.verse_keys, reader.verse_texts,
+                  reader.verse_index, reader.chapter_spans):
+        table.pop('TEST', None)
+
+# Test search term highlighting
+print("\n15. Testing TermHighlighter...")
+try:
+    from bible_reader import TermHighlighter
+    highlighter = TermHighlighter(['a', 'c', 'abcd'])
+    assert highlighter.find_spans('abcd') == [(0, 4)], f"Got {highlighter.find_spans('abcd')}"
+    assert highlighter.highlight('abcd', '[', ']') == '[abcd]', f"Got {highlighter.highlight('abcd', '[', ']')}"
+    highlighter = TermHighlighter(['love', 'God'])
+    result = highlighter.highlight('For God so loved', '[', ']')
+    assert result == 'For [God] so [love]d', f"Got {result}"
+    print("   ✓ Overlapping terms merge into one span; separate terms stay separate")
+except AssertionError as e:
+    print(f"   ✗ {e}")
+
 print("\n" + "=" * 80)
 print("✓ All new features are implemented and accessible!")
 print("=" * 80)
@@ -17,6 +17,9 @@ if os.path.exists(shared_data_path):
         (os.path.join(shared_data_path, 'graph_data.json'), 'shared-data/processed'),
         (os.path.join(shared_data_path, 'stats.json'), 'shared-data/processed'),
     ]
+    # Binary columns load faster than graph_data.json when present
+    if os.path.exists(os.path.join(shared_data_path, 'graph_columns')):
+        datas.append((os.path.join(shared_data_path, 'graph_columns'), 'shared-data/processed/graph_columns'))
 
 # Hidden imports for components and key libraries
 hiddenimports = [
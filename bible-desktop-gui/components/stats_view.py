@@ -9,6 +9,7 @@ from PyQt5.QtCore import Qt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
+import numpy as np
 
 
 class StatsView(QWidget):
@@ -61,8 +62,18 @@ class StatsView(QWidget):
     def set_data(self, stats):
         """Set statistics data"""
         self.stats = stats
+        # Older stats.json files only carry the four summary charts
+        rows = 4 if 'book_totals' in stats else 2
+        self.canvas.setMinimumHeight(rows * 320)
         self.render()
 
+    @staticmethod
+    def book_counts(entries):
+        """(books, counts) from [{'book', 'count'}] lists or {book: count} dicts"""
+        if isinstance(entries, dict):
+            return list(entries.keys()), list(entries.values())
+        return [e['book'] for e in entries], [e['count'] for e in entries]
+
     def render(self):
         """Render statistics"""
         if not self.stats:
@@ -73,15 +84,15 @@ class StatsView(QWidget):
             self.stats_grid.itemAt(i).widget().setParent(None)
 
         # Add stat cards
-        total_connections = self.stats.get('total_connections', 0)
+        verse_references = self.stats.get('total_verse_references', 0)
         chapter_connections = self.stats.get('total_chapter_connections', 0)
-        avg_connections = round(total_connections / chapter_connections, 2) if chapter_connections > 0 else 0
+        avg_references = round(verse_references / chapter_connections, 2) if chapter_connections > 0 else 0
 
         stat_items = [
-            ('Total Connections', f'{total_connections:,}', '#FFD700'),
+            ('Verse References', f'{verse_references:,}', '#FFD700'),
             ('Chapter Connections', f'{chapter_connections:,}', '#00CED1'),
             ('Total Books', '66', '#2ecc71'),
-            ('Avg Connections', avg_connections, '#9370DB'),
+            ('Refs per Connection', avg_references, '#9370DB'),
         ]
 
         for i, (label, value, color) in enumerate(stat_items):
@@ -125,15 +136,15 @@ class StatsView(QWidget):
             return
 
         self.figure.clear()
+        rows = 4 if 'book_totals' in self.stats else 2
 
         # Top books by connections (most referenced)
-        ax1 = self.figure.add_subplot(2, 2, 1)
+        ax1 = self.figure.add_subplot(rows, 2, 1)
         ax1.set_facecolor('#1a1a2e')
 
         if 'most_referenced_books' in self.stats:
-            top_books = self.stats['most_referenced_books'][:10]
-            books = list(top_books.keys())
-            counts = list(top_books.values())
+            books, counts = self.book_counts(self.stats['most_referenced_books'])
+            books, counts = books[:10], counts[:10]
 
             bars = ax1.barh(books, counts, color='#FFD700', edgecolor='#00CED1')
             ax1.set_xlabel('Total References', color='#00CED1')
@@ -141,14 +152,14 @@ class StatsView(QWidget):
             ax1.tick_params(colors='#00CED1')
 
         # Testament distribution
-        ax2 = self.figure.add_subplot(2, 2, 2)
+        ax2 = self.figure.add_subplot(rows, 2, 2)
         ax2.set_facecolor('#1a1a2e')
 
         if 'testament_distribution' in self.stats:
             testament_dist = self.stats['testament_distribution']
             labels = list(testament_dist.keys())
             sizes = list(testament_dist.values())
-            colors = ['#2ecc71', '#00CED1', '#9370DB'][:len(labels)]
+            colors = ['#2ecc71', '#00CED1', '#9370DB', '#FFD700'][:len(labels)]
 
             ax2.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
                    textprops={'color': '#FFD700'})
@@ -156,13 +167,12 @@ class StatsView(QWidget):
                          color='#FFD700', fontweight='bold')
 
         # Most referencing books
-        ax3 = self.figure.add_subplot(2, 2, 3)
+        ax3 = self.figure.add_subplot(rows, 2, 3)
         ax3.set_facecolor('#1a1a2e')
 
         if 'most_referencing_books' in self.stats:
-            ref_books = self.stats['most_referencing_books'][:10]
-            books = list(ref_books.keys())
-            counts = list(ref_books.values())
+            books, counts = self.book_counts(self.stats['most_referencing_books'])
+            books, counts = books[:10], counts[:10]
 
             ax3.barh(books, counts, color='#00CED1', edgecolor='#FFD700')
             ax3.set_xlabel('Outgoing References', color='#00CED1')
@@ -172,7 +182,7 @@ class StatsView(QWidget):
             ax3.tick_params(colors='#00CED1')
 
         # Summary info
-        ax4 = self.figure.add_subplot(2, 2, 4)
+        ax4 = self.figure.add_subplot(rows, 2, 4)
         ax4.set_facecolor('#1a1a2e')
         ax4.axis('off')
 
@@ -181,7 +191,6 @@ class StatsView(QWidget):
 
         Total Verse References: {self.stats.get('total_verse_references', 0):,}
         Total Chapter Connections: {self.stats.get('total_chapter_connections', 0):,}
-        Total Connections: {self.stats.get('total_connections', 0):,}
 
         Data Source:
         Treasury of Scripture Knowledge
@@ -191,9 +200,63 @@ class StatsView(QWidget):
         ax4.text(0.1, 0.5, summary_text, color='#00CED1', fontsize=10,
                 verticalalignment='center', fontfamily='monospace')
 
+        if rows > 2:
+            self.render_detail_charts(rows)
+
         self.figure.tight_layout()
         self.canvas.draw()
 
+    def render_detail_charts(self, rows):
+        """Per-book, vote, degree and chapter density charts from the extended stats"""
+        # Incoming vs outgoing references for every book, in canonical order
+        ax5 = self.figure.add_subplot(rows, 2, 5)
+        ax5.set_facecolor('#1a1a2e')
+        totals = self.stats['book_totals']
+        positions = np.arange(len(totals))
+        ax5.bar(positions - 0.2, [b['in'] for b in totals], width=0.4, color='#FFD700', label='Incoming')
+        ax5.bar(positions + 0.2, [b['out'] for b in totals], width=0.4, color='#00CED1', label='Outgoing')
+        ax5.axvline(sum(1 for b in totals if b['testament'] == 'OT') - 0.5, color='#9370DB', linestyle='--')
+        ax5.set_xticks(positions[::5])
+        ax5.set_xticklabels([totals[i]['book'] for i in positions[::5]], rotation=60, fontsize=7)
+        ax5.set_title('References per Book', color='#FFD700', fontweight='bold')
+        ax5.tick_params(colors='#00CED1')
+        ax5.legend(fontsize=8)
+
+        # Vote histogram
+        ax6 = self.figure.add_subplot(rows, 2, 6)
+        ax6.set_facecolor('#1a1a2e')
+        votes = self.stats.get('vote_histogram', {})
+        ax6.bar(votes.get('bins', []), votes.get('counts', []), color='#9370DB', edgecolor='#FFD700')
+        ax6.set_xlabel('Votes', color='#00CED1')
+        ax6.set_title('Cross-Reference Votes', color='#FFD700', fontweight='bold')
+        ax6.tick_params(colors='#00CED1')
+
+        # Degree distribution (log-log)
+        ax7 = self.figure.add_subplot(rows, 2, 7)
+        ax7.set_facecolor('#1a1a2e')
+        degrees = self.stats.get('degree_distribution', {})
+        for key, label, color in (('out', 'Outgoing', '#00CED1'), ('in', 'Incoming', '#FFD700')):
+            if degrees.get(key, {}).get('degrees'):
+                ax7.scatter(degrees[key]['degrees'], degrees[key]['counts'], s=6, color=color, label=label)
+        ax7.set_xscale('log')
+        ax7.set_yscale('log')
+        ax7.set_xlabel('References per verse', color='#00CED1')
+        ax7.set_ylabel('Verses', color='#00CED1')
+        ax7.set_title('Degree Distribution', color='#FFD700', fontweight='bold')
+        ax7.tick_params(colors='#00CED1')
+        ax7.legend(fontsize=8)
+
+        # References per verse across every chapter, Genesis 1 to Revelation 22
+        # (per verse up to the highest one referenced; stats.json has no real verse counts)
+        ax8 = self.figure.add_subplot(rows, 2, 8)
+        ax8.set_facecolor('#1a1a2e')
+        density = self.stats.get('chapter_density', {}).get('density', [])
+        ax8.plot(range(len(density)), density, color='#2ecc71', linewidth=0.6)
+        ax8.set_xlabel('Chapter (canonical order)', color='#00CED1')
+        ax8.set_ylabel('References per referenced verse', color='#00CED1')
+        ax8.set_title('Chapter Density', color='#FFD700', fontweight='bold')
+        ax8.tick_params(colors='#00CED1')
+
     def apply_filters(self, filters):
         """Stats view doesn't use filters"""
         pass
@@ -35,7 +35,7 @@ try:
     if stats_path.exists():
         with open(stats_path, 'r', encoding='utf-8') as f:
             stats = json.load(f)
-        print(f"   ✓ Loaded stats: {stats.get('total_connections', 0)} total connections")
+        print(f"   ✓ Loaded stats: {stats.get('total_chapter_connections', 0)} chapter connections")
         print(f"   Stats keys: {list(stats.keys())}")
 
 except Exception as e:
@@ -26,6 +26,11 @@ from components.people_network_view import PeopleNetworkView
 # Import theographic data loader
 from theographic_data import TheographicDataLoader
 
+# Binary graph export reader shared with the data processor
+SHARED_DATA_DIR = Path(__file__).parent.parent / 'shared-data'
+sys.path.insert(0, str(SHARED_DATA_DIR))
+from data_processor import load_graph_columns
+
 
 class BibleVisualizerApp(QMainWindow):
     """Main application window for Bible visualizations"""
@@ -255,15 +260,40 @@ class BibleVisualizerApp(QMainWindow):
 
         self.setPalette(palette)
 
+    def load_graph_columns(self, columns_path):
+        """Build graph data from the columnar export (shared-data/processed/graph_columns)
+
+        This only avoids parsing graph_data.json: the views work on a list of
+        connection dicts, so the columns are read into memory rather than mapped.
+        """
+        data = load_graph_columns(str(columns_path), mmap=False)
+        sources, targets, weights = data.pop('source'), data.pop('target'), data.pop('weight')
+        data['connections'] = [
+            {'source': source, 'target': target, 'weight': weight}
+            for source, target, weight in zip(sources.tolist(), targets.tolist(), weights.tolist())
+        ]
+        data['book_matrix'] = data['book_matrix'].tolist()
+        return data
+
     def load_data(self):
         """Load Bible cross-reference data and theographic data"""
         try:
-            # Load graph data
-            data_path = Path(__file__).parent.parent / 'shared-data' / 'processed' / 'graph_data.json'
-            stats_path = Path(__file__).parent.parent / 'shared-data' / 'processed' / 'stats.json'
-
-            with open(data_path, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
+            # Load graph data, preferring the binary columns over re-parsing the JSON
+            processed_path = SHARED_DATA_DIR / 'processed'
+            data_path = processed_path / 'graph_data.json'
+            columns_path = processed_path / 'graph_columns'
+            stats_path = processed_path / 'stats.json'
+
+            self.data = None
+            if (columns_path / 'meta.json').exists():
+                try:
+                    self.data = self.load_graph_columns(columns_path)
+                except ValueError as e:
+                    # Export from another version of the data processor
+                    print(f"Skipping graph_columns ({e}), loading graph_data.json")
+            if self.data is None:
+                with open(data_path, 'r', encoding='utf-8') as f:
+                    self.data = json.load(f)
 
             with open(stats_path, 'r', encoding='utf-8') as f:
                 self.stats = json.load(f)
@@ -0,0 +1,36 @@
+// Web Asset Manifest
+// Maps data files to the minified, content-hashed copies listed in
+// processed/web/manifest.json (written by shared-data/web_assets.py)
+
+class AssetManifest {
+    constructor(webBase = '../shared-data/processed/web/') {
+        this.webBase = webBase;
+        this.manifestPromise = null;
+    }
+
+    /**
+     * Fetch manifest.json once and share the result between all loaders
+     * @returns {Promise<Object|null>} null when no manifest has been published
+     */
+    load() {
+        if (!this.manifestPromise) {
+            this.manifestPromise = fetch(this.webBase + 'manifest.json', { cache: 'no-cache' })
+                .then(response => response.ok ? response.json() : null)
+                .catch(() => null);
+        }
+        return this.manifestPromise;
+    }
+
+    /**
+     * Resolve a logical name ('graph_data.json', 'theographic/books.json') to its
+     * hashed copy, falling back to the plain file when it is not in the manifest
+     */
+    async resolve(name, fallbackUrl) {
+        const manifest = await this.load();
+        const entry = manifest?.files?.[name];
+        return entry ? this.webBase + entry.file : fallbackUrl;
+    }
+}
+
+// Global asset manifest shared by the data loaders
+const assetManifest = new AssetManifest();
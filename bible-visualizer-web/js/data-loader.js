@@ -8,6 +8,11 @@ class BibleDataLoader {
         this.isPreviewMode = false;
         this.loadingProgress = 0;
         this.progressCallbacks = [];
+        this.tileIndex = null;
+        this.tilesBase = '../shared-data/processed/tiles/';
+        this.lodIndex = null;
+        this.lodLevel = -1;
+        this.lodBase = '../shared-data/processed/lod/';
     }
 
     /**
@@ -35,6 +40,7 @@ class BibleDataLoader {
         console.log('⚡ Loading preview data instantly...');
         this.graphData = PREVIEW_DATA;
         this.isPreviewMode = true;
+        this.lodLevel = PREVIEW_DATA.metadata.lod_level ?? -1;
         this.isLoaded = true;
         this.updateProgress(100, 'Preview loaded');
 
@@ -47,6 +53,53 @@ class BibleDataLoader {
         return true;
     }
 
+    /**
+     * Progressively refine preview data with level-of-detail tiers
+     * (shared-data/processed/lod/). Each tier only adds connections and
+     * chapters on top of the ones already loaded.
+     * @param {number} level - highest tier to load (defaults to the last)
+     */
+    async refine(level = Infinity) {
+        if (!this.isPreviewMode || this.lodLevel < 0) return this.graphData;
+
+        if (!this.lodIndex) {
+            const response = await fetch(this.lodBase + 'index.json', { cache: 'no-cache' });
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            this.lodIndex = await response.json();
+        }
+
+        const tiers = this.lodIndex.tiers;
+        while (this.lodLevel + 1 < tiers.length && this.lodLevel < level) {
+            const next = tiers[this.lodLevel + 1];
+            const response = await fetch(this.lodBase + next.file);
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            const tier = await response.json();
+
+            // Tiers must extend exactly what we already hold
+            const { chapters, connections } = this.graphData;
+            if (tier.node_offset !== chapters.length || tier.edge_offset !== connections.length) {
+                throw new Error(`LOD tier ${next.level} does not match the loaded data`);
+            }
+
+            tier.chapters.forEach(chapter => chapters.push(chapter));
+            tier.source.forEach((source, i) => {
+                connections.push({ source, target: tier.target[i], weight: tier.weight[i] });
+            });
+
+            this.lodLevel = next.level;
+            this.graphData.metadata.total_chapters = chapters.length;
+            this.graphData.metadata.total_connections = connections.length;
+            this.graphData.metadata.lod_level = next.level;
+            this.updateProgress(Math.round(100 * (this.lodLevel + 1) / tiers.length), `Detail level ${next.level} loaded`);
+        }
+
+        return this.graphData;
+    }
+
     async load() {
         if (this.isLoaded && !this.isPreviewMode) return;
 
@@ -58,7 +111,7 @@ class BibleDataLoader {
 
             if (isLocal) {
                 // Local development - use local file
-                apiUrl = '../shared-data/processed/graph_data.json';
+                apiUrl = await assetManifest.resolve('graph_data.json', '../shared-data/processed/graph_data.json');
 
                 console.log('🔧 LOCAL MODE: Loading from file...');
                 this.updateProgress(5, 'Loading local data...');
@@ -74,7 +127,8 @@ class BibleDataLoader {
                 this.updateProgress(80, 'Processing graph data...');
 
                 // Load stats locally
-                const statsResponse = await fetch('../shared-data/processed/stats.json');
+                const statsUrl = await assetManifest.resolve('stats.json', '../shared-data/processed/stats.json');
+                const statsResponse = await fetch(statsUrl);
                 if (statsResponse.ok) {
                     this.stats = await statsResponse.json();
                 }
@@ -145,6 +199,56 @@ class BibleDataLoader {
         }
     }
 
+    /**
+     * Index of the per-book and per-chapter edge tiles (shared-data/processed/tiles/)
+     */
+    async loadTileIndex() {
+        if (!this.tileIndex) {
+            const response = await fetch(this.tilesBase + 'index.json');
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            this.tileIndex = await response.json();
+        }
+        return this.tileIndex;
+    }
+
+    async loadTile(file) {
+        const response = await fetch(this.tilesBase + file);
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+
+        // Tiles store edges as parallel source/target/weight arrays
+        const tile = await response.json();
+        tile.connections = tile.source.map((source, i) => ({
+            source,
+            target: tile.target[i],
+            weight: tile.weight[i]
+        }));
+        return tile;
+    }
+
+    /**
+     * Connections touching one book, without downloading the whole graph
+     * @param {string} bookName - e.g. 'Genesis'
+     */
+    async loadBookConnections(bookName) {
+        const index = await this.loadTileIndex();
+        const entry = index.books.find(book => book.book === bookName);
+        return entry ? (await this.loadTile(entry.file)).connections : [];
+    }
+
+    /**
+     * Connections touching one chapter
+     * @param {number} chapterId - chapter node id (index into chapters)
+     */
+    async loadChapterConnections(chapterId) {
+        const index = await this.loadTileIndex();
+        const entry = index.chapters[chapterId];
+        return entry ? (await this.loadTile(entry.file)).connections : [];
+    }
+
     getBooks() {
         return this.graphData ? this.graphData.books : [];
     }
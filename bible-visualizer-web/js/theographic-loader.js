@@ -41,57 +41,60 @@ class TheographicDataLoader {
 
             console.log('Loading theographic data from:', basePath);
 
+            // Local runs use the hashed web copies when published; the CDN serves the plain files
+            const assetUrl = async (name) => isLocal ? assetManifest.resolve('theographic/' + name, basePath + name) : basePath + name;
+
             // Load books first (small file)
             this.updateProgress(5, 'Loading books metadata...');
-            const booksResponse = await fetch(basePath + 'books.json');
+            const booksResponse = await fetch(await assetUrl('books.json'));
             this.books = await booksResponse.json();
             console.log('✓ Loaded', this.books.length, 'books');
 
             // Load people data
             this.updateProgress(15, 'Loading biblical people...');
-            const peopleResponse = await fetch(basePath + 'people.json');
+            const peopleResponse = await fetch(await assetUrl('people.json'));
             this.people = await peopleResponse.json();
             console.log('✓ Loaded', this.people.length, 'people');
 
             // Load places data with coordinates
             this.updateProgress(30, 'Loading places with GPS coordinates...');
-            const placesResponse = await fetch(basePath + 'places.json');
+            const placesResponse = await fetch(await assetUrl('places.json'));
             this.places = await placesResponse.json();
             console.log('✓ Loaded', this.places.length, 'places');
 
             // Load events
             this.updateProgress(45, 'Loading biblical events...');
-            const eventsResponse = await fetch(basePath + 'events.json');
+            const eventsResponse = await fetch(await assetUrl('events.json'));
             this.events = await eventsResponse.json();
             console.log('✓ Loaded', this.events.length, 'events');
 
             // Load periods (for timeline)
             this.updateProgress(55, 'Loading historical periods...');
-            const periodsResponse = await fetch(basePath + 'periods.json');
+            const periodsResponse = await fetch(await assetUrl('periods.json'));
             this.periods = await periodsResponse.json();
             console.log('✓ Loaded', this.periods.length, 'periods');
 
             // Load people groups
             this.updateProgress(65, 'Loading people groups...');
-            const groupsResponse = await fetch(basePath + 'peopleGroups.json');
+            const groupsResponse = await fetch(await assetUrl('peopleGroups.json'));
             this.peopleGroups = await groupsResponse.json();
             console.log('✓ Loaded', this.peopleGroups.length, 'people groups');
 
             // Load Easton's Bible Dictionary
             this.updateProgress(75, 'Loading Easton\'s Dictionary...');
-            const eastonResponse = await fetch(basePath + 'easton.json');
+            const eastonResponse = await fetch(await assetUrl('easton.json'));
             this.easton = await eastonResponse.json();
             console.log('✓ Loaded', this.easton.length, 'dictionary entries');
 
             // Load chapters metadata
             this.updateProgress(85, 'Loading chapters metadata...');
-            const chaptersResponse = await fetch(basePath + 'chapters.json');
+            const chaptersResponse = await fetch(await assetUrl('chapters.json'));
             this.chapters = await chaptersResponse.json();
             console.log('✓ Loaded', this.chapters.length, 'chapters');
 
             // Skip verses.json for now (36MB) - load on demand
             // this.updateProgress(90, 'Loading verse metadata (36MB)...');
-            // const versesResponse = await fetch(basePath + 'verses.json');
+            // const versesResponse = await fetch(await assetUrl('verses.json'));
             // this.verses = await versesResponse.json();
             // console.log('✓ Loaded', this.verses.length, 'verses');
 
@@ -1,78 +1,157 @@
 #!/usr/bin/env python3
 """
-Create Preview Data for Instant Loading
-Extracts top 200 connections from graph_data.json for instant visualization
+Create Preview and Level-of-Detail Data for Progressive Loading
+Splits the processed graph into nested, weight-ordered tiers (top 200 / 2k / 20k / all
+connections). Each tier file holds only the connections and chapters it adds on top of
+the previous ones, so a client can refine step by step without re-downloading anything.
+Tier 0 is also written as preview-data.js for instant visualization.
 """
 
 import json
 import os
 
-def create_preview_data():
-    """Extract top connections and create preview JavaScript file"""
-
-    # Load full graph data
-    graph_data_path = os.path.join('processed', 'graph_data.json')
-    print(f"Loading full dataset from {graph_data_path}...")
-
-    with open(graph_data_path, 'r', encoding='utf-8') as f:
-        full_data = json.load(f)
-
-    print(f"[OK] Loaded {len(full_data['connections'])} connections")
-
-    # Sort connections by weight (descending) and take top 200
-    sorted_connections = sorted(
-        full_data['connections'],
-        key=lambda x: x['weight'],
-        reverse=True
-    )
-
-    top_connections = sorted_connections[:200]
-    print(f"[OK] Extracted top 200 connections (weight range: {top_connections[0]['weight']} - {top_connections[-1]['weight']})")
-
-    # Get unique chapter indices used in top connections
-    chapter_indices = set()
-    for conn in top_connections:
-        chapter_indices.add(conn['source'])
-        chapter_indices.add(conn['target'])
-
-    # Extract only chapters that are referenced in top connections
-    # AND create a mapping from old index to new index
-    preview_chapters = []
-    old_to_new_index = {}  # Maps original chapter index to new preview array index
-
-    for new_idx, old_idx in enumerate(sorted(chapter_indices)):
-        if old_idx < len(full_data['chapters']):
-            chapter = full_data['chapters'][old_idx]
-            preview_chapters.append(chapter)
-            old_to_new_index[old_idx] = new_idx
-
-    print(f"[OK] Extracted {len(preview_chapters)} chapters")
-
-    # Remap connections to use new indices
-    remapped_connections = []
-    for conn in top_connections:
-        remapped_connections.append({
-            'source': old_to_new_index[conn['source']],
-            'target': old_to_new_index[conn['target']],
-            'weight': conn['weight']
+import numpy as np
+
+# Cumulative connection counts per tier; None means every remaining connection
+LOD_TIERS = [200, 2000, 20000, None]
+LOD_DIR = os.path.join('processed', 'lod')
+LOD_FORMAT = 1
+
+def load_weight_ordered_graph():
+    """Graph data (without its connection list) and (source, target, weight) arrays, heaviest first.
+
+    Reads the memory-mapped graph_columns export when present, otherwise graph_data.json.
+    """
+    columns_dir = os.path.join('processed', 'graph_columns')
+    if os.path.exists(os.path.join(columns_dir, 'meta.json')):
+        from data_processor import load_graph_columns
+
+        print(f"Loading full dataset from {columns_dir}/...")
+        graph = load_graph_columns(columns_dir)
+        sources, targets, weights = graph.pop('source'), graph.pop('target'), graph.pop('weight')
+        graph['book_matrix'] = graph['book_matrix'].tolist()
+    else:
+        graph_data_path = os.path.join('processed', 'graph_data.json')
+        print(f"Loading full dataset from {graph_data_path}...")
+
+        with open(graph_data_path, 'r', encoding='utf-8') as f:
+            graph = json.load(f)
+
+        connections = graph.pop('connections')
+        sources = np.array([c['source'] for c in connections], dtype=np.int64)
+        targets = np.array([c['target'] for c in connections], dtype=np.int64)
+        weights = np.array([c['weight'] for c in connections], dtype=np.int64)
+
+    print(f"[OK] Loaded {len(weights)} connections")
+
+    # Stable sort keeps equal weights in file order
+    order = np.argsort(-weights.astype(np.int64), kind='stable')
+    return graph, sources[order].astype(np.int64), targets[order].astype(np.int64), weights[order].astype(np.int64)
+
+def build_lod_tiers(graph, sources, targets, weights, tiers=LOD_TIERS):
+    """Split weight-ordered edges into nested delta tiers with one node remapping shared by all tiers.
+
+    Chapters get compact ids in the order tiers first use them (sorted by chapter within a tier),
+    so the nodes of tiers 0..k are always ids 0..n_k-1. Each chapter dict's 'id' is its compact
+    id and 'graph_id' its id in graph_data.json.
+    """
+    remap = np.full(len(graph['chapters']), -1, dtype=np.int64)
+    node_count = 0
+    start = 0
+    lod = []
+
+    for level, limit in enumerate(tiers):
+        end = len(weights) if limit is None else min(limit, len(weights))
+        if end <= start and lod:
+            break
+
+        tier_sources, tier_targets = sources[start:end], targets[start:end]
+        used = np.unique(np.concatenate([tier_sources, tier_targets]))
+        new_nodes = used[remap[used] < 0]
+        remap[new_nodes] = np.arange(node_count, node_count + len(new_nodes))
+
+        chapters = []
+        for offset, graph_id in enumerate(new_nodes.tolist()):
+            chapter = dict(graph['chapters'][graph_id], id=node_count + offset, graph_id=graph_id)
+            chapters.append(chapter)
+
+        lod.append({
+            'level': level,
+            'edge_offset': start,
+            'node_offset': node_count,
+            'chapters': chapters,
+            'source': remap[tier_sources].tolist(),
+            'target': remap[tier_targets].tolist(),
+            'weight': weights[start:end].tolist()
         })
+        node_count += len(new_nodes)
+        start = end
+
+    return lod
+
+def write_lod_tiers(graph, lod, output_dir=LOD_DIR):
+    """Write one minified JSON file per tier plus index.json"""
+    os.makedirs(output_dir, exist_ok=True)
+    print(f"Writing {len(lod)} level-of-detail tiers to {output_dir}/...")
+
+    entries = []
+    for tier in lod:
+        file_name = f"tier{tier['level']}.json"
+        data = dict(tier, format=LOD_FORMAT)
+        if tier['level'] == 0:
+            # Everything a client needs to start rendering from tier 0 alone
+            data.update(metadata=graph['metadata'], books=graph['books'], book_matrix=graph.get('book_matrix', []))
+        with open(os.path.join(output_dir, file_name), 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+        entries.append({
+            'level': tier['level'],
+            'file': file_name,
+            'connections': len(tier['weight']),
+            'total_connections': tier['edge_offset'] + len(tier['weight']),
+            'chapters': len(tier['chapters']),
+            'total_chapters': tier['node_offset'] + len(tier['chapters']),
+            'min_weight': tier['weight'][-1] if tier['weight'] else 0,
+            'bytes': os.path.getsize(os.path.join(output_dir, file_name))
+        })
+        print(f"   Tier {tier['level']}: +{entries[-1]['connections']} connections, "
+              f"+{entries[-1]['chapters']} chapters ({entries[-1]['bytes'] / 1024:.1f} KB)")
+
+    # Stale tiers from a run with more levels would otherwise linger
+    for name in os.listdir(output_dir):
+        if name.startswith('tier') and name not in {e['file'] for e in entries}:
+            os.remove(os.path.join(output_dir, name))
 
-    print(f"[OK] Remapped {len(remapped_connections)} connections to new indices")
+    with open(os.path.join(output_dir, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump({'format': LOD_FORMAT, 'metadata': graph['metadata'], 'tiers': entries}, f, indent=2)
+
+    print(f"[OK] Level-of-detail tiers written")
+
+def write_preview_js(graph, tier):
+    """Write tier 0 as preview-data.js (PREVIEW_DATA) for instant loading"""
+    top_connections = [
+        {'source': source, 'target': target, 'weight': weight}
+        for source, target, weight in zip(tier['source'], tier['target'], tier['weight'])
+    ]
+    print(f"[OK] Extracted top {len(top_connections)} connections "
+          f"(weight range: {top_connections[0]['weight']} - {top_connections[-1]['weight']})")
+    print(f"[OK] Extracted {len(tier['chapters'])} chapters")
 
     # Create preview data structure
     preview_data = {
         'metadata': {
-            'total_books': full_data['metadata']['total_books'],
-            'total_chapters': len(preview_chapters),
-            'total_connections': len(remapped_connections),
-            'total_verse_refs': full_data['metadata']['total_verse_refs'],
+            'total_books': graph['metadata']['total_books'],
+            'total_chapters': len(tier['chapters']),
+            'total_connections': len(top_connections),
+            'total_verse_refs': graph['metadata']['total_verse_refs'],
             'is_preview': True,
-            'preview_description': 'Top 200 connections by weight for instant loading'
+            'lod_level': 0,
+            'preview_description': f'Top {len(top_connections)} connections by weight for instant loading'
         },
-        'books': full_data['books'],  # Keep all book metadata
-        'chapters': preview_chapters,
-        'connections': remapped_connections,
-        'book_matrix': full_data.get('book_matrix', [])  # Keep book matrix for heatmap
+        'books': graph['books'],  # Keep all book metadata
+        'chapters': tier['chapters'],
+        'connections': top_connections,
+        'book_matrix': graph.get('book_matrix', [])  # Keep book matrix for heatmap
     }
 
     # Generate JavaScript file
@@ -81,9 +160,9 @@ def create_preview_data():
 
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write('// Bible Cross-Reference Preview Data\n')
-        f.write('// Auto-generated from graph_data.json\n')
-        f.write('// Contains top 200 connections for instant loading\n')
-        f.write('// Full dataset (190K connections) loads in background\n\n')
+        f.write('// Auto-generated from graph_data.json (level-of-detail tier 0)\n')
+        f.write(f'// Contains top {len(top_connections)} connections for instant loading\n')
+        f.write('// Higher tiers (shared-data/processed/lod/) refine it; full dataset loads in background\n\n')
         f.write('const PREVIEW_DATA = ')
         json.dump(preview_data, f, indent=2)
         f.write(';\n\n')
@@ -93,6 +172,7 @@ def create_preview_data():
         f.write('}\n')
 
     # Calculate sizes
+    graph_data_path = os.path.join('processed', 'graph_data.json')
     preview_size = os.path.getsize(output_path) / 1024
     full_size = os.path.getsize(graph_data_path) / 1024 / 1024
 
@@ -101,12 +181,19 @@ def create_preview_data():
     print(f"   Full size: {full_size:.1f} MB")
     print(f"   Reduction: {(1 - preview_size/1024/full_size) * 100:.1f}%")
     print(f"   Top connections: {len(top_connections)}")
-    print(f"   Chapters included: {len(preview_chapters)}")
+    print(f"   Chapters included: {len(tier['chapters'])}")
     print(f"\n[STATS] Preview Statistics:")
     print(f"   Highest weight: {top_connections[0]['weight']} connections")
     print(f"   Lowest weight: {top_connections[-1]['weight']} connections")
 
     return preview_data
 
+def create_preview_data():
+    """Build the level-of-detail tiers and the preview JavaScript file; returns the preview data"""
+    graph, sources, targets, weights = load_weight_ordered_graph()
+    lod = build_lod_tiers(graph, sources, targets, weights)
+    write_lod_tiers(graph, lod)
+    return write_preview_js(graph, lod[0])
+
 if __name__ == '__main__':
     create_preview_data()
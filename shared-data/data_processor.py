@@ -4,9 +4,13 @@ Bible Cross-Reference Data Processor
 Converts cross_references.txt into visualization-ready formats
 """
 
+import argparse
 import json
-import re
-from collections import defaultdict
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 # Bible book metadata
 BIBLE_BOOKS = [
@@ -79,117 +83,298 @@ BIBLE_BOOKS = [
 ]
 
 # Create lookup dictionaries
-ABBREV_TO_BOOK = {b['abbrev']: b for b in BIBLE_BOOKS}
 BOOK_TO_INDEX = {b['name']: i for i, b in enumerate(BIBLE_BOOKS)}
+ABBREV_TO_INDEX = {b['abbrev']: i for i, b in enumerate(BIBLE_BOOKS)}
+
+# Compact verse ids: book_index * 1,000,000 + chapter * 1,000 + verse (fits in a signed 32-bit int)
+BOOK_ID_SCALE = 1000000
+CHAPTER_ID_SCALE = 1000
+
+def encode_verse_id(book_index, chapter, verse):
+    """Pack a verse reference into a single int"""
+    return book_index * BOOK_ID_SCALE + chapter * CHAPTER_ID_SCALE + verse
+
+def decode_verse_id(verse_id):
+    """Unpack a compact verse id to (book_index, chapter, verse)"""
+    book_index, rest = divmod(verse_id, BOOK_ID_SCALE)
+    chapter, verse = divmod(rest, CHAPTER_ID_SCALE)
+    return book_index, chapter, verse
+
+# Chapter node ids run 0..1188 in canonical order; a book's chapters start at its offset
+CHAPTER_OFFSETS = [0]
+for _book in BIBLE_BOOKS:
+    CHAPTER_OFFSETS.append(CHAPTER_OFFSETS[-1] + _book['chapters'])
+TOTAL_CHAPTERS = CHAPTER_OFFSETS.pop()
+
+# Books before Matthew are Old Testament
+NT_START = 39
+
+# Vote histogram bin edges (np.digitize): < 0, 0, 1-4, 5-9, 10-19, 20-49, 50-99, 100+
+VOTE_BIN_EDGES = [0, 1, 5, 10, 20, 50, 100]
+VOTE_BIN_LABELS = ['< 0', '0', '1-4', '5-9', '10-19', '20-49', '50-99', '100+']
+
+# Binary columnar export (processed/graph_columns/): little-endian .npy files
+#   source.npy, target.npy  uint16  chapter node id per edge
+#   weight.npy              uint32  summed |votes| per edge
+#   book_matrix.npy         uint32  66x66 book connection matrix
+#   meta.json               format version, metadata, books and chapters (as in graph_data.json)
+GRAPH_COLUMNS_FORMAT = 1
+GRAPH_COLUMNS_DTYPES = {'source': '<u2', 'target': '<u2', 'weight': '<u4', 'book_matrix': '<u4'}
+
+# Edge tiles (processed/tiles/): every edge touching a book or chapter, for on-demand loading
+#   index.json                 books and chapters with tile file names and edge counts
+#   books/<book_index>.json    {'book', 'book_index', 'source': [...], 'target': [...], 'weight': [...]}
+#   chapters/<node_id>.json    {'chapter', 'label', 'source': [...], 'target': [...], 'weight': [...]}
+GRAPH_TILES_FORMAT = 1
+
+def parse_reference_id(ref_str):
+    """Parse Gen.1.1 format (or the start of a range) to a compact verse id, -1 if unknown"""
+    abbrev, _, rest = ref_str.partition('.')
+    book_index = ABBREV_TO_INDEX.get(abbrev)
+    if book_index is None:
+        return -1
+    chapter, _, verse = rest.partition('.')
+    try:
+        return encode_verse_id(book_index, int(chapter), int(verse.split('-', 1)[0]))
+    except ValueError:
+        return -1
+
+def chapter_nodes(verse_ids):
+    """Map an array of verse ids to chapter node ids, -1 where the chapter is out of range"""
+    books = verse_ids // BOOK_ID_SCALE
+    chapters = verse_ids // CHAPTER_ID_SCALE % (BOOK_ID_SCALE // CHAPTER_ID_SCALE)
+    book_chapters = np.array([b['chapters'] for b in BIBLE_BOOKS], dtype=np.int32)[books]
+    nodes = np.array(CHAPTER_OFFSETS, dtype=np.int32)[books] + chapters - 1
+    return np.where((chapters >= 1) & (chapters <= book_chapters), nodes, -1)
+
+def chapter_node_list():
+    """Chapter node dicts in canonical order (ids match CHAPTER_OFFSETS)"""
+    chapter_nodes = []
+    chapter_index = 0
+
+    for book in BIBLE_BOOKS:
+        for ch in range(1, book['chapters'] + 1):
+            chapter_nodes.append({
+                'id': chapter_index,
+                'label': f"{book['name']} {ch}",
+                'book': book['name'],
+                'chapter': ch,
+                'book_index': BOOK_TO_INDEX[book['name']],
+                'testament': book['testament']
+            })
+            chapter_index += 1
+
+    return chapter_nodes
+
+def load_graph_columns(directory, mmap=True):
+    """Load a graph_columns export; edge arrays are memory-mapped unless mmap=False"""
+    with open(os.path.join(directory, 'meta.json'), 'r', encoding='utf-8') as f:
+        graph = json.load(f)
+    if graph.get('format') != GRAPH_COLUMNS_FORMAT:
+        raise ValueError(f"Unsupported graph_columns format: {graph.get('format')}")
+
+    for name in GRAPH_COLUMNS_DTYPES:
+        graph[name] = np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r' if mmap else None)
+    return graph
+
+def load_graph_tile(tiles_dir, book_index=None, chapter_id=None):
+    """Load one book or chapter tile as {'connections': [{'source', 'target', 'weight'}, ...], ...}"""
+    if book_index is not None:
+        path = os.path.join(tiles_dir, 'books', f'{book_index}.json')
+    else:
+        path = os.path.join(tiles_dir, 'chapters', f'{chapter_id}.json')
+
+    with open(path, 'r', encoding='utf-8') as f:
+        tile = json.load(f)
+    tile['connections'] = [
+        {'source': source, 'target': target, 'weight': weight}
+        for source, target, weight in zip(tile.pop('source'), tile.pop('target'), tile.pop('weight'))
+    ]
+    return tile
+
+def sum_by_key(keys, weights):
+    """Sorted distinct keys and the summed weight of each"""
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    sums = np.bincount(inverse, weights=weights, minlength=len(unique_keys))
+    return unique_keys, sums.astype(np.int64)
+
+def chapter_edge_sums(from_ids, to_ids, votes):
+    """(source * TOTAL_CHAPTERS + target) pair keys with summed |votes|, skipping same-chapter pairs"""
+    sources = chapter_nodes(from_ids)
+    targets = chapter_nodes(to_ids)
+    keep = (sources >= 0) & (targets >= 0) & (sources != targets)
+    pairs = sources[keep].astype(np.int64) * TOTAL_CHAPTERS + targets[keep]
+    return sum_by_key(pairs, np.abs(votes[keep]))
+
+def book_matrix_sums(from_ids, to_ids, votes):
+    """Flattened 66x66 matrix of summed |votes| between different books"""
+    from_books = from_ids // BOOK_ID_SCALE
+    to_books = to_ids // BOOK_ID_SCALE
+    keep = from_books != to_books
+    cells = from_books[keep] * 66 + to_books[keep]
+    return np.bincount(cells, weights=np.abs(votes[keep]), minlength=66 * 66).astype(np.int64)
+
+def header_end(path):
+    """Byte offset of the first data line (just past the header)"""
+    with open(path, 'rb') as f:
+        f.readline()
+        return f.tell()
+
+def shard_bounds(path, shards):
+    """Split the file after its header into byte ranges that start on line boundaries"""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        bounds = [header_end(path)]
+        for i in range(1, shards):
+            f.seek(bounds[0] + (size - bounds[0]) * i // shards)
+            f.readline()  # Finish the partial line; it belongs to the previous shard
+            bounds.append(max(min(f.tell(), size), bounds[-1]))
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+def parse_shard(path, start, end):
+    """Parse the lines starting in [start, end) into (from_ids, to_ids, votes) columns"""
+    # The same few thousand reference strings repeat across rows, so parse each once
+    ids = {}
+    from_ids, to_ids, votes = array('i'), array('i'), array('i')
+
+    with open(path, 'rb') as f:
+        f.seek(start)
+        position = start
+        for line in f:
+            if position >= end:
+                break
+            position += len(line)
+
+            parts = line.rstrip(b'\r\n').split(b'\t')
+            if len(parts) < 3:
+                continue
+
+            from_id = ids.get(parts[0])
+            if from_id is None:
+                from_id = ids[parts[0]] = parse_reference_id(parts[0].decode('utf-8', 'replace'))
+            to_id = ids.get(parts[1])
+            if to_id is None:
+                to_id = ids[parts[1]] = parse_reference_id(parts[1].decode('utf-8', 'replace'))
+
+            if from_id >= 0 and to_id >= 0:
+                try:
+                    vote = int(parts[2])
+                except ValueError:
+                    vote = 0
+                from_ids.append(from_id)
+                to_ids.append(to_id)
+                votes.append(vote)
+
+    return from_ids, to_ids, votes
+
+def process_shard(task):
+    """Worker: parse one byte range and pre-aggregate it to chapter and book level"""
+    path, start, end = task
+    from_ids, to_ids, votes = parse_shard(path, start, end)
+    columns = [np.frombuffer(c, dtype=np.int32) for c in (from_ids, to_ids, votes)]
+    pairs, weights = chapter_edge_sums(*columns)
+    return from_ids, to_ids, votes, pairs, weights, book_matrix_sums(*columns)
 
 class BibleDataProcessor:
     def __init__(self, cross_ref_file):
         self.cross_ref_file = cross_ref_file
-        self.verse_refs = []
-        self.chapter_refs = []
+        # Verse-level references as parallel integer columns (see encode_verse_id)
+        self.from_ids = array('i')
+        self.to_ids = array('i')
+        self.votes = array('i')
+        # Chapter-level edges as parallel arrays of chapter node ids and summed |votes|
+        self.chapter_sources = np.zeros(0, dtype=np.int32)
+        self.chapter_targets = np.zeros(0, dtype=np.int32)
+        self.chapter_weights = np.zeros(0, dtype=np.int64)
         self.book_refs = []
 
-    def parse_reference(self, ref_str):
-        """Parse Gen.1.1 format to structured data"""
-        # Handle ranges like Ps.23.1-Ps.23.2
-        if '-' in ref_str:
-            ref_str = ref_str.split('-')[0]
-
-        parts = ref_str.split('.')
-        if len(parts) >= 3:
-            abbrev = parts[0]
-            chapter = int(parts[1])
-            verse = int(parts[2])
-
-            book_info = ABBREV_TO_BOOK.get(abbrev)
-            if book_info:
-                return {
-                    'book': book_info['name'],
-                    'book_abbrev': abbrev,
-                    'chapter': chapter,
-                    'verse': verse,
-                    'book_index': BOOK_TO_INDEX[book_info['name']],
-                    'testament': book_info['testament'],
-                    'full_ref': f"{book_info['name']} {chapter}:{verse}"
-                }
-        return None
-
     def load_cross_references(self):
-        """Load and parse cross-references"""
+        """Stream cross-references into integer columns (from_ids, to_ids, votes)"""
         print("Loading cross-references...")
 
-        with open(self.cross_ref_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()[1:]  # Skip header
-
-        for line in lines:
-            parts = line.strip().split('\t')
-            if len(parts) >= 3:
-                from_ref = self.parse_reference(parts[0])
-                to_ref = self.parse_reference(parts[1])
-
-                try:
-                    votes = int(parts[2])
-                except:
-                    votes = 0
-
-                if from_ref and to_ref:
-                    self.verse_refs.append({
-                        'from': from_ref,
-                        'to': to_ref,
-                        'votes': votes
-                    })
-
-        print(f"Loaded {len(self.verse_refs)} verse-level cross-references")
+        self.from_ids, self.to_ids, self.votes = parse_shard(
+            self.cross_ref_file, header_end(self.cross_ref_file), os.path.getsize(self.cross_ref_file))
+
+        print(f"Loaded {len(self.votes)} verse-level cross-references")
+
+    def process_sharded(self, workers):
+        """Load and aggregate in parallel: each worker parses one byte range, partial aggregates are merged"""
+        print(f"Loading cross-references with {workers} worker processes...")
+
+        tasks = [(self.cross_ref_file, start, end) for start, end in shard_bounds(self.cross_ref_file, workers)]
+        pair_parts, weight_parts = [], []
+        book_matrix = np.zeros(66 * 66, dtype=np.int64)
+
+        # Shards come back in file order, so the verse columns match a sequential load
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for from_ids, to_ids, votes, pairs, weights, books in pool.map(process_shard, tasks):
+                self.from_ids.extend(from_ids)
+                self.to_ids.extend(to_ids)
+                self.votes.extend(votes)
+                pair_parts.append(pairs)
+                weight_parts.append(weights)
+                book_matrix += books
+
+        print(f"Loaded {len(self.votes)} verse-level cross-references from {len(tasks)} shards")
+
+        # The same chapter pair can appear in several shards; sum them once more
+        if pair_parts:
+            self.set_chapter_edges(*sum_by_key(np.concatenate(pair_parts), np.concatenate(weight_parts)))
+        self.book_refs = book_matrix.reshape(66, 66).tolist()
+        print(f"Created {len(self.chapter_weights)} chapter-level connections and 66x66 book connection matrix")
+
+    def columns(self):
+        """Zero-copy NumPy views of (from_ids, to_ids, votes)"""
+        return (np.frombuffer(self.from_ids, dtype=np.int32),
+                np.frombuffer(self.to_ids, dtype=np.int32),
+                np.frombuffer(self.votes, dtype=np.int32))
+
+    def save_columns(self, path):
+        """Cache the verse-level columns as an .npz file"""
+        from_ids, to_ids, votes = self.columns()
+        np.savez(path, from_ids=from_ids, to_ids=to_ids, votes=votes)
+
+    def load_columns(self, path):
+        """Restore verse-level columns saved by save_columns"""
+        with np.load(path) as data:
+            for name in ('from_ids', 'to_ids', 'votes'):
+                column = array('i')
+                column.frombytes(data[name].astype(np.int32).tobytes())
+                setattr(self, name, column)
+
+    def save_aggregates(self, path):
+        """Cache chapter edges and the book matrix as an .npz file"""
+        np.savez(path, chapter_sources=self.chapter_sources, chapter_targets=self.chapter_targets,
+                 chapter_weights=self.chapter_weights, book_matrix=np.array(self.book_refs, dtype=np.int64))
+
+    def load_aggregates(self, path):
+        """Restore chapter edges and the book matrix saved by save_aggregates"""
+        with np.load(path) as data:
+            self.chapter_sources = data['chapter_sources']
+            self.chapter_targets = data['chapter_targets']
+            self.chapter_weights = data['chapter_weights']
+            self.book_refs = data['book_matrix'].tolist()
+
+    def set_chapter_edges(self, pairs, weights):
+        """Store chapter edges from encoded (source, target) pair keys"""
+        self.chapter_sources = (pairs // TOTAL_CHAPTERS).astype(np.int32)
+        self.chapter_targets = (pairs % TOTAL_CHAPTERS).astype(np.int32)
+        self.chapter_weights = weights
 
     def aggregate_to_chapters(self):
         """Aggregate verse references to chapter level"""
         print("Aggregating to chapter level...")
 
-        chapter_connections = defaultdict(lambda: defaultdict(int))
-
-        for ref in self.verse_refs:
-            from_chapter = f"{ref['from']['book']} {ref['from']['chapter']}"
-            to_chapter = f"{ref['to']['book']} {ref['to']['chapter']}"
-
-            if from_chapter != to_chapter:
-                chapter_connections[from_chapter][to_chapter] += abs(ref['votes'])
+        self.set_chapter_edges(*chapter_edge_sums(*self.columns()))
 
-        # Convert to list
-        for from_ch, connections in chapter_connections.items():
-            for to_ch, weight in connections.items():
-                self.chapter_refs.append({
-                    'from': from_ch,
-                    'to': to_ch,
-                    'weight': weight
-                })
-
-        print(f"Created {len(self.chapter_refs)} chapter-level connections")
+        print(f"Created {len(self.chapter_weights)} chapter-level connections")
 
     def aggregate_to_books(self):
         """Aggregate to book level for matrix visualization"""
         print("Aggregating to book level...")
 
-        book_connections = defaultdict(lambda: defaultdict(int))
-
-        for ref in self.verse_refs:
-            from_book = ref['from']['book']
-            to_book = ref['to']['book']
-
-            if from_book != to_book:
-                book_connections[from_book][to_book] += abs(ref['votes'])
-
-        # Convert to matrix format
-        matrix = [[0] * 66 for _ in range(66)]
-
-        for from_book, connections in book_connections.items():
-            from_idx = BOOK_TO_INDEX.get(from_book)
-            if from_idx is not None:
-                for to_book, count in connections.items():
-                    to_idx = BOOK_TO_INDEX.get(to_book)
-                    if to_idx is not None:
-                        matrix[from_idx][to_idx] = count
-
-        self.book_refs = matrix
+        self.book_refs = book_matrix_sums(*self.columns()).reshape(66, 66).tolist()
         print(f"Created 66x66 book connection matrix")
 
     def export_for_web(self, output_file):
@@ -197,40 +382,18 @@ class BibleDataProcessor:
         print(f"Exporting web data to {output_file}...")
 
         # Prepare chapter nodes (for arc diagram)
-        chapter_nodes = []
-        chapter_index = 0
-
-        for book in BIBLE_BOOKS:
-            for ch in range(1, book['chapters'] + 1):
-                chapter_nodes.append({
-                    'id': chapter_index,
-                    'label': f"{book['name']} {ch}",
-                    'book': book['name'],
-                    'chapter': ch,
-                    'book_index': BOOK_TO_INDEX[book['name']],
-                    'testament': book['testament']
-                })
-                chapter_index += 1
-
-        # Prepare edges with node indices
-        chapter_map = {node['label']: node['id'] for node in chapter_nodes}
-
-        edges = []
-        for ref in self.chapter_refs:
-            if ref['from'] in chapter_map and ref['to'] in chapter_map:
-                edges.append({
-                    'source': chapter_map[ref['from']],
-                    'target': chapter_map[ref['to']],
-                    'weight': ref['weight']
-                })
+        chapter_nodes = chapter_node_list()
+
+        # Chapter edges already carry node indices
+        edges = [
+            {'source': source, 'target': target, 'weight': weight}
+            for source, target, weight in zip(self.chapter_sources.tolist(),
+                                              self.chapter_targets.tolist(),
+                                              self.chapter_weights.tolist())
+        ]
 
         web_data = {
-            'metadata': {
-                'total_books': 66,
-                'total_chapters': len(chapter_nodes),
-                'total_connections': len(edges),
-                'total_verse_refs': len(self.verse_refs)
-            },
+            'metadata': self.graph_metadata(),
             'books': BIBLE_BOOKS,
             'chapters': chapter_nodes,
             'connections': edges,
@@ -242,32 +405,189 @@ class BibleDataProcessor:
 
         print(f"[OK] Web data exported successfully")
 
+    def graph_metadata(self):
+        """Summary counts shared by the JSON and columnar exports"""
+        return {
+            'total_books': 66,
+            'total_chapters': TOTAL_CHAPTERS,
+            'total_connections': len(self.chapter_weights),
+            'total_verse_refs': len(self.votes)
+        }
+
+    def export_columns(self, output_dir):
+        """Export the graph as little-endian .npy columns plus meta.json (see GRAPH_COLUMNS_DTYPES)"""
+        print(f"Exporting columnar graph data to {output_dir}/...")
+        os.makedirs(output_dir, exist_ok=True)
+
+        if len(self.chapter_weights) and self.chapter_weights.max() > np.iinfo(np.uint32).max:
+            raise ValueError("Chapter edge weight does not fit in uint32")
+
+        columns = {
+            'source': self.chapter_sources,
+            'target': self.chapter_targets,
+            'weight': self.chapter_weights,
+            'book_matrix': np.array(self.book_refs, dtype=np.int64).reshape(66, 66)
+        }
+        for name, values in columns.items():
+            np.save(os.path.join(output_dir, f'{name}.npy'), values.astype(GRAPH_COLUMNS_DTYPES[name]))
+
+        # Written last: loaders treat a directory without meta.json as missing
+        meta = {
+            'format': GRAPH_COLUMNS_FORMAT,
+            'metadata': self.graph_metadata(),
+            'books': BIBLE_BOOKS,
+            'chapters': chapter_node_list()
+        }
+        with open(os.path.join(output_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+        print(f"[OK] Columnar data exported")
+
+    def export_tiles(self, output_dir):
+        """Export per-book and per-chapter edge tiles plus index.json (see GRAPH_TILES_FORMAT)"""
+        print(f"Exporting graph tiles to {output_dir}/...")
+        os.makedirs(os.path.join(output_dir, 'books'), exist_ok=True)
+        os.makedirs(os.path.join(output_dir, 'chapters'), exist_ok=True)
+
+        sources, targets, weights = self.chapter_sources, self.chapter_targets, self.chapter_weights
+        edges = np.arange(len(weights))
+        chapter_books = np.repeat(np.arange(66), [b['chapters'] for b in BIBLE_BOOKS])
+        chapter_labels = [node['label'] for node in chapter_node_list()]
+
+        def write_tiles(owners, owner_edges, count, folder, header):
+            """Group (owner, edge) incidences, keeping edges in graph order, and write one tile per owner"""
+            order = np.lexsort((owner_edges, owners))
+            owners, owner_edges = owners[order], owner_edges[order]
+            bounds = np.searchsorted(owners, np.arange(count + 1))
+            sizes = []
+            for owner in range(count):
+                tile_edges = owner_edges[bounds[owner]:bounds[owner + 1]]
+                tile = dict(header(owner), source=sources[tile_edges].tolist(),
+                            target=targets[tile_edges].tolist(), weight=weights[tile_edges].tolist())
+                with open(os.path.join(output_dir, folder, f'{owner}.json'), 'w', encoding='utf-8') as f:
+                    json.dump(tile, f, separators=(',', ':'))
+                sizes.append(len(tile_edges))
+            return sizes
+
+        # Each edge belongs to both endpoint chapters
+        chapter_sizes = write_tiles(np.concatenate([sources, targets]), np.concatenate([edges, edges]),
+                                    TOTAL_CHAPTERS, 'chapters',
+                                    lambda c: {'chapter': c, 'label': chapter_labels[c]})
+
+        # ... and to both endpoint books, once when they are the same book
+        book_pairs = np.unique(np.concatenate([chapter_books[sources] * len(edges) + edges,
+                                               chapter_books[targets] * len(edges) + edges]))
+        book_sizes = write_tiles(book_pairs // max(len(edges), 1), book_pairs % max(len(edges), 1), 66, 'books',
+                                 lambda b: {'book': BIBLE_BOOKS[b]['name'], 'book_index': b})
+
+        index = {
+            'format': GRAPH_TILES_FORMAT,
+            'total_connections': len(weights),
+            'books': [
+                {'book': book['name'], 'abbrev': book['abbrev'], 'file': f'books/{i}.json',
+                 'first_chapter': CHAPTER_OFFSETS[i], 'chapters': book['chapters'], 'connections': book_sizes[i]}
+                for i, book in enumerate(BIBLE_BOOKS)
+            ],
+            'chapters': [
+                {'id': c, 'label': chapter_labels[c], 'file': f'chapters/{c}.json', 'connections': chapter_sizes[c]}
+                for c in range(TOTAL_CHAPTERS)
+            ]
+        }
+        with open(os.path.join(output_dir, 'index.json'), 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'))
+
+        print(f"[OK] Wrote {len(book_sizes)} book tiles and {len(chapter_sizes)} chapter tiles")
+
+    def degree_distribution(self, verse_ids):
+        """How many verses have each reference count, plus summary figures"""
+        _, degrees = np.unique(verse_ids, return_counts=True)
+        if not len(degrees):
+            return {'verses': 0, 'max': 0, 'mean': 0, 'median': 0, 'degrees': [], 'counts': []}
+        values, counts = np.unique(degrees, return_counts=True)
+        return {
+            'verses': len(degrees),
+            'max': int(degrees.max()),
+            'mean': round(float(degrees.mean()), 2),
+            'median': float(np.median(degrees)),
+            'degrees': values.tolist(),
+            'counts': counts.tolist()
+        }
+
     def export_stats(self, output_file):
         """Export statistical summary"""
         print(f"Generating statistics...")
 
-        # Top referenced books
-        book_in_refs = defaultdict(int)
-        book_out_refs = defaultdict(int)
+        # Derive every per-reference column once, then count with bincount
+        from_ids, to_ids, votes = self.columns()
+        from_books = from_ids // BOOK_ID_SCALE
+        to_books = to_ids // BOOK_ID_SCALE
 
-        for ref in self.verse_refs:
-            book_out_refs[ref['from']['book']] += 1
-            book_in_refs[ref['to']['book']] += 1
+        book_out = np.bincount(from_books, minlength=66).tolist()
+        book_in = np.bincount(to_books, minlength=66).tolist()
 
-        top_in = sorted(book_in_refs.items(), key=lambda x: x[1], reverse=True)[:10]
-        top_out = sorted(book_out_refs.items(), key=lambda x: x[1], reverse=True)[:10]
+        # 0 = OT->OT, 1 = OT->NT, 2 = NT->OT, 3 = NT->NT
+        testament_pairs = (from_books >= NT_START) * 2 + (to_books >= NT_START)
+        testaments = np.bincount(testament_pairs, minlength=4).tolist()
+
+        vote_counts = np.bincount(np.digitize(votes, VOTE_BIN_EDGES), minlength=len(VOTE_BIN_LABELS)).tolist()
+
+        # Per-chapter reference counts. The input has no verse counts, so density divides by the
+        # highest verse number referenced in the chapter (a lower bound on its real verse count)
+        from_nodes = chapter_nodes(from_ids)
+        to_nodes = chapter_nodes(to_ids)
+        chapter_out = np.bincount(from_nodes[from_nodes >= 0], minlength=TOTAL_CHAPTERS)
+        chapter_in = np.bincount(to_nodes[to_nodes >= 0], minlength=TOTAL_CHAPTERS)
+        max_verse_referenced = np.zeros(TOTAL_CHAPTERS, dtype=np.int64)
+        for nodes, ids in ((from_nodes, from_ids), (to_nodes, to_ids)):
+            valid = nodes >= 0
+            np.maximum.at(max_verse_referenced, nodes[valid], ids[valid] % CHAPTER_ID_SCALE)
+        density = np.round((chapter_out + chapter_in) / np.maximum(max_verse_referenced, 1), 2)
+
+        chapter_labels = [f"{book['name']} {ch}" for book in BIBLE_BOOKS for ch in range(1, book['chapters'] + 1)]
+        densest = np.argsort(-density, kind='stable')[:10]
+
+        top_in = sorted(range(66), key=lambda i: book_in[i], reverse=True)[:10]
+        top_out = sorted(range(66), key=lambda i: book_out[i], reverse=True)[:10]
 
         stats = {
-            'total_verse_references': len(self.verse_refs),
-            'total_chapter_connections': len(self.chapter_refs),
-            'most_referenced_books': [{'book': b, 'count': c} for b, c in top_in],
-            'most_referencing_books': [{'book': b, 'count': c} for b, c in top_out],
+            'total_verse_references': len(self.votes),
+            'total_chapter_connections': len(self.chapter_weights),
+            'most_referenced_books': [{'book': BIBLE_BOOKS[i]['name'], 'count': book_in[i]} for i in top_in],
+            'most_referencing_books': [{'book': BIBLE_BOOKS[i]['name'], 'count': book_out[i]} for i in top_out],
             'testament_distribution': {
-                'OT_to_OT': sum(1 for r in self.verse_refs if r['from']['testament'] == 'OT' and r['to']['testament'] == 'OT'),
-                'OT_to_NT': sum(1 for r in self.verse_refs if r['from']['testament'] == 'OT' and r['to']['testament'] == 'NT'),
-                'NT_to_OT': sum(1 for r in self.verse_refs if r['from']['testament'] == 'NT' and r['to']['testament'] == 'OT'),
-                'NT_to_NT': sum(1 for r in self.verse_refs if r['from']['testament'] == 'NT' and r['to']['testament'] == 'NT')
-            }
+                'OT_to_OT': testaments[0],
+                'OT_to_NT': testaments[1],
+                'NT_to_OT': testaments[2],
+                'NT_to_NT': testaments[3]
+            },
+            'book_totals': [
+                {'book': book['name'], 'testament': book['testament'], 'in': book_in[i], 'out': book_out[i]}
+                for i, book in enumerate(BIBLE_BOOKS)
+            ],
+            'degree_distribution': {
+                'out': self.degree_distribution(from_ids),
+                'in': self.degree_distribution(to_ids)
+            },
+            'vote_histogram': {
+                'bins': VOTE_BIN_LABELS,
+                'counts': vote_counts,
+                'min': int(votes.min()) if len(votes) else 0,
+                'max': int(votes.max()) if len(votes) else 0,
+                'mean': round(float(votes.mean()), 2) if len(votes) else 0
+            },
+            # Indexed by chapter node id, matching graph_data.json 'chapters';
+            # density = (out + in) / max_verse_referenced
+            'chapter_density': {
+                'out': chapter_out.tolist(),
+                'in': chapter_in.tolist(),
+                'max_verse_referenced': max_verse_referenced.tolist(),
+                'density': density.tolist()
+            },
+            'densest_chapters': [
+                {'chapter': chapter_labels[i], 'density': float(density[i]),
+                 'references': int(chapter_out[i] + chapter_in[i])}
+                for i in densest
+            ]
         }
 
         with open(output_file, 'w', encoding='utf-8') as f:
@@ -276,23 +596,37 @@ class BibleDataProcessor:
         print(f"[OK] Statistics exported")
 
 def main():
+    parser = argparse.ArgumentParser(description='Convert cross_references.txt into visualization-ready formats')
+    parser.add_argument('--input', default='../cross_references.txt', help='cross-reference TSV file')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='worker processes for sharded parsing (0 = one per CPU, default: 1)')
+    args = parser.parse_args()
+    workers = args.workers or os.cpu_count() or 1
+
     print("Bible Cross-Reference Data Processor")
     print("=" * 50)
 
-    processor = BibleDataProcessor('../cross_references.txt')
+    processor = BibleDataProcessor(args.input)
 
     # Process data
-    processor.load_cross_references()
-    processor.aggregate_to_chapters()
-    processor.aggregate_to_books()
+    if workers > 1:
+        processor.process_sharded(workers)
+    else:
+        processor.load_cross_references()
+        processor.aggregate_to_chapters()
+        processor.aggregate_to_books()
 
     # Export
     processor.export_for_web('processed/graph_data.json')
+    processor.export_columns('processed/graph_columns')
+    processor.export_tiles('processed/tiles')
     processor.export_stats('processed/stats.json')
 
     print("\n[OK] All data processing complete!")
     print("\nGenerated files:")
     print("  - processed/graph_data.json  (for web visualizer)")
+    print("  - processed/graph_columns/   (binary columns for Python consumers)")
+    print("  - processed/tiles/           (per-book and per-chapter edge tiles)")
     print("  - processed/stats.json       (statistics)")
 
 if __name__ == "__main__":
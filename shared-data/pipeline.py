@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Incremental Data Pipeline
+Runs the data processor stages (parse, aggregate, export, tiles, stats, preview, web) and
+skips any stage whose inputs, parameters and code are unchanged since the last run.
+
+Usage:
+    python pipeline.py                      # rebuild only what changed
+    python pipeline.py --force              # rebuild everything
+    python pipeline.py --only stats         # run just the named stage(s)
+"""
+
+import argparse
+import glob
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+
+import create_preview_data as lod
+import data_processor as dp
+import web_assets
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = 'pipeline_cache'
+MANIFEST_FILE = os.path.join(CACHE_DIR, 'manifest.json')
+
+COLUMNS_FILE = os.path.join(CACHE_DIR, 'columns.npz')
+AGGREGATES_FILE = os.path.join(CACHE_DIR, 'aggregates.npz')
+GRAPH_FILE = os.path.join('processed', 'graph_data.json')
+GRAPH_COLUMNS_DIR = os.path.join('processed', 'graph_columns')
+GRAPH_COLUMNS_FILES = [os.path.join(GRAPH_COLUMNS_DIR, f'{name}.npy') for name in dp.GRAPH_COLUMNS_DTYPES] + \
+    [os.path.join(GRAPH_COLUMNS_DIR, 'meta.json')]
+TILES_INDEX_FILE = os.path.join('processed', 'tiles', 'index.json')
+STATS_FILE = os.path.join('processed', 'stats.json')
+PREVIEW_FILE = os.path.join('..', 'bible-visualizer-web', 'js', 'preview-data.js')
+LOD_INDEX_FILE = os.path.join(lod.LOD_DIR, 'index.json')
+WEB_MANIFEST_FILE = os.path.join(web_assets.WEB_DIR, 'manifest.json')
+
+# Every stage depends on the book table (names, chapter counts, testaments)
+BOOKS_HASH = hashlib.sha256(json.dumps(dp.BIBLE_BOOKS, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def code_hash(*objects):
+    """Hash of the source of the functions a stage runs, so editing one stage only invalidates it"""
+    digest = hashlib.sha256()
+    for obj in objects:
+        digest.update(inspect.getsource(obj).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class Pipeline:
+    def __init__(self, input_file, workers=1, force=False):
+        self.input_file = input_file
+        self.workers = workers
+        self.force = force
+        self.manifest = {'files': {}, 'stages': {}}
+        if os.path.exists(MANIFEST_FILE):
+            try:
+                with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+                    self.manifest = json.load(f)
+            except (OSError, ValueError):
+                print("[WARN] Pipeline manifest unreadable, rebuilding everything")
+
+    def file_stat(self, path):
+        """(size, mtime_ns) used to tell whether a file changed since it was last hashed"""
+        st = os.stat(path)
+        return [st.st_size, st.st_mtime_ns]
+
+    def file_hash(self, path):
+        """Content hash of a file, reusing the recorded hash while size and mtime are unchanged"""
+        key = os.path.normpath(path)
+        stat = self.file_stat(path)
+        cached = self.manifest['files'].get(key)
+        if cached and cached['stat'] == stat:
+            return cached['sha256']
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        self.manifest['files'][key] = {'stat': stat, 'sha256': digest.hexdigest()}
+        return digest.hexdigest()
+
+    def save_manifest(self):
+        """Write the manifest atomically"""
+        tmp_path = MANIFEST_FILE + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, MANIFEST_FILE)
+
+    def run_stage(self, name, inputs, params, code, outputs, build):
+        """Run build() unless the stage fingerprint matches the manifest and its outputs are intact"""
+        fingerprint = hashlib.sha256(json.dumps({
+            'inputs': {os.path.normpath(path): self.file_hash(path) for path in inputs},
+            'params': params,
+            'code': code,
+            'books': BOOKS_HASH,
+        }, sort_keys=True).encode('utf-8')).hexdigest()
+
+        recorded = self.manifest['stages'].get(name, {})
+        outputs_intact = all(
+            os.path.exists(path) and recorded.get('outputs', {}).get(os.path.normpath(path)) == self.file_stat(path)
+            for path in outputs
+        )
+        if not self.force and recorded.get('fingerprint') == fingerprint and outputs_intact:
+            print(f"[SKIP] {name:<10} unchanged")
+            return False
+
+        start = time.perf_counter()
+        build()
+        elapsed = time.perf_counter() - start
+
+        # Hash outputs now so downstream stages see their new content
+        for path in outputs:
+            self.file_hash(path)
+        self.manifest['stages'][name] = {
+            'fingerprint': fingerprint,
+            'params': params,
+            'outputs': {os.path.normpath(path): self.file_stat(path) for path in outputs},
+            'seconds': round(elapsed, 3),
+        }
+        self.save_manifest()
+        print(f"[OK]   {name:<10} rebuilt in {elapsed:.2f}s")
+        return True
+
+    def build_parse(self):
+        processor = dp.BibleDataProcessor(self.input_file)
+        if self.workers > 1:
+            processor.process_sharded(self.workers)
+        else:
+            processor.load_cross_references()
+        processor.save_columns(COLUMNS_FILE)
+
+    def build_aggregate(self):
+        processor = dp.BibleDataProcessor(self.input_file)
+        processor.load_columns(COLUMNS_FILE)
+        processor.aggregate_to_chapters()
+        processor.aggregate_to_books()
+        processor.save_aggregates(AGGREGATES_FILE)
+
+    def build_export(self):
+        processor = dp.BibleDataProcessor(self.input_file)
+        processor.load_columns(COLUMNS_FILE)
+        processor.load_aggregates(AGGREGATES_FILE)
+        processor.export_for_web(GRAPH_FILE)
+        processor.export_columns(GRAPH_COLUMNS_DIR)
+
+    def build_tiles(self):
+        processor = dp.BibleDataProcessor(self.input_file)
+        processor.load_aggregates(AGGREGATES_FILE)
+        processor.export_tiles(os.path.dirname(TILES_INDEX_FILE))
+
+    def build_stats(self):
+        processor = dp.BibleDataProcessor(self.input_file)
+        processor.load_columns(COLUMNS_FILE)
+        processor.load_aggregates(AGGREGATES_FILE)
+        processor.export_stats(STATS_FILE)
+
+    def stages(self):
+        """Stage definitions in dependency order: (name, inputs, params, code, outputs, build)"""
+        Processor = dp.BibleDataProcessor
+        return [
+            ('parse', [self.input_file], {},
+             code_hash(dp.parse_reference_id, dp.encode_verse_id, dp.header_end, dp.shard_bounds, dp.parse_shard,
+                       Processor.load_cross_references, Processor.save_columns),
+             [COLUMNS_FILE], self.build_parse),
+            ('aggregate', [COLUMNS_FILE], {'total_chapters': dp.TOTAL_CHAPTERS},
+             code_hash(dp.chapter_nodes, dp.sum_by_key, dp.chapter_edge_sums, dp.book_matrix_sums,
+                       Processor.set_chapter_edges, Processor.aggregate_to_chapters,
+                       Processor.aggregate_to_books, Processor.save_aggregates),
+             [AGGREGATES_FILE], self.build_aggregate),
+            ('export', [COLUMNS_FILE, AGGREGATES_FILE], {},
+             code_hash(dp.chapter_node_list, Processor.load_columns, Processor.load_aggregates,
+                       Processor.graph_metadata, Processor.export_for_web, Processor.export_columns),
+             [GRAPH_FILE] + GRAPH_COLUMNS_FILES, self.build_export),
+            ('tiles', [AGGREGATES_FILE], {'total_chapters': dp.TOTAL_CHAPTERS},
+             code_hash(dp.chapter_node_list, Processor.load_aggregates, Processor.export_tiles),
+             [TILES_INDEX_FILE], self.build_tiles),
+            ('stats', [COLUMNS_FILE, AGGREGATES_FILE],
+             {'vote_bins': dp.VOTE_BIN_EDGES, 'nt_start': dp.NT_START},
+             code_hash(dp.chapter_nodes, Processor.load_columns, Processor.load_aggregates,
+                       Processor.degree_distribution, Processor.export_stats),
+             [STATS_FILE], self.build_stats),
+            ('preview', GRAPH_COLUMNS_FILES, {'tiers': lod.LOD_TIERS},
+             code_hash(dp.load_graph_columns, lod.load_weight_ordered_graph, lod.build_lod_tiers,
+                       lod.write_lod_tiers, lod.write_preview_js, lod.create_preview_data),
+             [PREVIEW_FILE, LOD_INDEX_FILE], lod.create_preview_data),
+            ('web', [GRAPH_FILE, STATS_FILE] + sorted(glob.glob(os.path.join('theographic', '*.json'))),
+             {'brotli': web_assets.brotli is not None, 'hash_length': web_assets.HASH_LENGTH},
+             code_hash(web_assets.web_sources, web_assets.write_if_changed, web_assets.publish_web_assets),
+             [WEB_MANIFEST_FILE], web_assets.publish_web_assets),
+        ]
+
+    def run(self, only=None):
+        """Run every stage in order (or just `only`), skipping unchanged ones"""
+        stages = self.stages()
+        names = [stage[0] for stage in stages]
+        unknown = sorted(set(only or ()) - set(names))
+        if unknown:
+            raise ValueError(f"Unknown stage(s): {', '.join(unknown)} (stages: {', '.join(names)})")
+        producers = {os.path.normpath(path): stage[0] for stage in stages for path in stage[4]}
+
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        os.makedirs('processed', exist_ok=True)
+
+        rebuilt = []
+        for name, inputs, params, code, outputs, build in stages:
+            if only and name not in only:
+                continue
+            missing = [path for path in inputs if not os.path.exists(path)]
+            upstream = [stage for stage in names if stage in {producers.get(os.path.normpath(p)) for p in missing}]
+            if upstream:
+                raise FileNotFoundError(f"Stage '{name}' needs {', '.join(missing)}; run the upstream "
+                                        f"stage(s) first: --only {','.join(upstream + [name])}")
+            if missing:
+                raise FileNotFoundError(f"Stage '{name}' needs {', '.join(missing)}, which does not exist")
+            if self.run_stage(name, inputs, params, code, outputs, build):
+                rebuilt.append(name)
+
+        # Refresh hashes picked up for unchanged files too
+        self.save_manifest()
+        return rebuilt
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incrementally rebuild the processed cross-reference data')
+    parser.add_argument('--input', default='../cross_references.txt', help='cross-reference TSV file')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='worker processes for the parse stage (0 = one per CPU, default: 1)')
+    parser.add_argument('--force', action='store_true', help='rebuild every stage regardless of the manifest')
+    parser.add_argument('--only', help='comma-separated stage names to run (parse, aggregate, export, tiles, stats, preview, web)')
+    args = parser.parse_args()
+
+    # Stage paths are relative to shared-data/, the input is relative to where we were started
+    input_file = os.path.abspath(args.input)
+    os.chdir(SCRIPT_DIR)
+
+    print("Bible Cross-Reference Data Pipeline")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    pipeline = Pipeline(input_file, workers=args.workers or os.cpu_count() or 1, force=args.force)
+    try:
+        rebuilt = pipeline.run(set(args.only.split(',')) if args.only else None)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+    print(f"\n[OK] Pipeline finished in {time.perf_counter() - start:.2f}s "
+          f"({', '.join(rebuilt) if rebuilt else 'nothing to rebuild'})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the cross-reference data processor
+Checks that the sequential load and the sharded (multi-process) load agree on
+a small fixture that includes malformed rows.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+from data_processor import BOOK_TO_INDEX, BibleDataProcessor, chapter_nodes, encode_verse_id
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_fixtures', 'cross_references_sample.txt')
+
+failures = 0
+
+
+def check(description, condition):
+    global failures
+    if condition:
+        print(f"   ✓ {description}")
+    else:
+        failures += 1
+        print(f"   ✗ {description}")
+
+
+def load_sequential():
+    processor = BibleDataProcessor(FIXTURE)
+    processor.load_cross_references()
+    processor.aggregate_to_chapters()
+    processor.aggregate_to_books()
+    return processor
+
+
+def load_sharded(workers):
+    processor = BibleDataProcessor(FIXTURE)
+    processor.process_sharded(workers)
+    return processor
+
+
+def main():
+    if sys.platform == 'win32':
+        sys.stdout.reconfigure(encoding='utf-8')
+
+    print("Testing Data Processor\n")
+    print("=" * 60)
+
+    print("\n1. Sequential load...")
+    sequential = load_sequential()
+    from_ids, to_ids, votes = sequential.columns()
+    pairs = list(zip(from_ids.tolist(), to_ids.tolist(), votes.tolist()))
+
+    print("\n2. Malformed rows...")
+    gen = BOOK_TO_INDEX['Genesis']
+    john = BOOK_TO_INDEX['John']
+    check("non-numeric vote is kept with 0 votes",
+          (encode_verse_id(gen, 1, 1), encode_verse_id(john, 1, 1), 0) in pairs)
+    check("range target uses its first verse",
+          (encode_verse_id(BOOK_TO_INDEX['Psalms'], 23, 1), encode_verse_id(BOOK_TO_INDEX['Psalms'], 23, 1), 7) in pairs)
+    check("range source uses its first verse",
+          (encode_verse_id(BOOK_TO_INDEX['Isaiah'], 53, 5), encode_verse_id(BOOK_TO_INDEX['Matthew'], 5, 3), 4) in pairs)
+    check("out-of-range chapter is kept at verse level",
+          encode_verse_id(gen, 51, 1) in from_ids.tolist())
+    # 100 random rows plus 8 of the 13 hand-written ones
+    check("unknown books, malformed chapters, short and blank rows are dropped",
+          len(votes) == 100 + 8)
+
+    print("\n3. Chapter aggregation...")
+    check("same-chapter pairs have no chapter edge",
+          not np.any(sequential.chapter_sources == sequential.chapter_targets))
+    check("out-of-range chapters have no chapter edge",
+          not np.any(sequential.chapter_sources < 0) and not np.any(sequential.chapter_targets < 0))
+    sources, targets = chapter_nodes(from_ids), chapter_nodes(to_ids)
+    counted = (sources >= 0) & (targets >= 0) & (sources != targets)
+    check("chapter weights sum the |votes| of cross-chapter rows",
+          int(sequential.chapter_weights.sum()) == int(np.abs(votes[counted]).sum()))
+
+    for step, workers in enumerate((2, 3), start=4):
+        print(f"\n{step}. Sharded load with {workers} workers...")
+        sharded = load_sharded(workers)
+        for name, expected, actual in zip(('from_ids', 'to_ids', 'votes'), sequential.columns(), sharded.columns()):
+            check(f"{name} match the sequential load", np.array_equal(expected, actual))
+        check("chapter edges match the sequential load",
+              np.array_equal(sequential.chapter_sources, sharded.chapter_sources)
+              and np.array_equal(sequential.chapter_targets, sharded.chapter_targets)
+              and np.array_equal(sequential.chapter_weights, sharded.chapter_weights))
+        check("book matrix matches the sequential load", sequential.book_refs == sharded.book_refs)
+
+    print("\n" + "=" * 60)
+    if failures:
+        print(f"{failures} check(s) failed")
+        sys.exit(1)
+    print("All data processor checks passed")
+
+
+if __name__ == '__main__':
+    main()
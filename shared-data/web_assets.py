@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Web Asset Publisher
+Writes minified, content-hashed copies of the processed and theographic JSON
+files with precompressed .gz (and .br when the brotli package is installed)
+variants, plus a manifest.json mapping each logical name to its hashed file.
+
+Hashed files never change, so static hosting can serve them with
+`Cache-Control: max-age=31536000, immutable`; only manifest.json needs a short
+cache lifetime.
+
+Usage:
+    python web_assets.py            # publish into processed/web/
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+WEB_DIR = os.path.join('processed', 'web')
+HASH_LENGTH = 10
+
+
+def web_sources():
+    """Logical name -> source path for every JSON file the web visualizer fetches"""
+    sources = {}
+    for path in (os.path.join('processed', 'graph_data.json'), os.path.join('processed', 'stats.json')):
+        if os.path.exists(path):
+            sources[os.path.basename(path)] = path
+    for path in sorted(glob.glob(os.path.join('theographic', '*.json'))):
+        sources['theographic/' + os.path.basename(path)] = path
+    return sources
+
+
+def write_if_changed(path, data):
+    """Write bytes unless an identical file is already there (keeps mtimes stable for caches)"""
+    if os.path.exists(path) and os.path.getsize(path) == len(data):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def publish_web_assets(sources=None, output_dir=WEB_DIR):
+    """Publish minified, hashed and precompressed copies of `sources`; returns the manifest"""
+    sources = web_sources() if sources is None else sources
+    os.makedirs(output_dir, exist_ok=True)
+    print(f"Publishing {len(sources)} web assets to {output_dir}/...")
+
+    manifest = {'compression': ['gzip'] + (['br'] if brotli else []), 'files': {}}
+    keep = {'manifest.json'}
+
+    for name, path in sources.items():
+        with open(path, 'r', encoding='utf-8') as f:
+            minified = json.dumps(json.load(f), separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+        digest = hashlib.sha256(minified).hexdigest()
+        stem = os.path.splitext(name.replace('/', '-'))[0]
+        file_name = f"{stem}.{digest[:HASH_LENGTH]}.json"
+
+        # mtime=0 keeps the .gz bytes reproducible for the same content
+        variants = {
+            file_name: minified,
+            file_name + '.gz': gzip.compress(minified, compresslevel=9, mtime=0),
+        }
+        if brotli:
+            variants[file_name + '.br'] = brotli.compress(minified, quality=11)
+
+        for variant, data in variants.items():
+            write_if_changed(os.path.join(output_dir, variant), data)
+            keep.add(variant)
+
+        entry = {
+            'file': file_name,
+            'sha256': digest,
+            'source_bytes': os.path.getsize(path),
+            'bytes': len(minified),
+            'gzip_bytes': len(variants[file_name + '.gz']),
+        }
+        if brotli:
+            entry['br_bytes'] = len(variants[file_name + '.br'])
+        manifest['files'][name] = entry
+
+        compressed = entry.get('br_bytes', entry['gzip_bytes'])
+        print(f"  {name:<32} {entry['source_bytes'] / 1024:>9.1f} KB -> {compressed / 1024:>8.1f} KB compressed")
+
+    # Drop hashed files left over from earlier content
+    for existing in os.listdir(output_dir):
+        if existing not in keep:
+            os.remove(os.path.join(output_dir, existing))
+
+    write_if_changed(os.path.join(output_dir, 'manifest.json'),
+                     json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+
+    source_total = sum(e['source_bytes'] for e in manifest['files'].values())
+    gzip_total = sum(e['gzip_bytes'] for e in manifest['files'].values())
+    print(f"[OK] Web assets published ({source_total / 1024 / 1024:.1f} MB -> {gzip_total / 1024 / 1024:.1f} MB gzip)")
+    return manifest
+
+
+if __name__ == '__main__':
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    publish_web_assets()